@@ -0,0 +1,272 @@
+"""
+Benchmarks the controller request path (routing, dependencies, repository, serialization) in-process.
+
+every scenario is sent through the ASGI app with `httpx.AsyncClient`, against an in-memory repository,
+and reports requests/sec, p50/p99 latency and the peak memory traced while serving a request.
+
+    python -m benchmarks.controllers run [--requests 500] [--scenario get] [--output results.json]
+    python -m benchmarks.controllers compare baseline.json results.json [--threshold 0.15]
+    python -m benchmarks.controllers run --baseline baseline.json  # run and compare, fails on regressions
+
+the same `--seed`, `--items` and `--requests` give the same requests, compare results of the same machine only.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+from fastapi import Depends, FastAPI
+from pydantic import BaseModel
+
+from furiousapi.core.api.controllers import BulkCreateModelMixin, ModelController, action
+from furiousapi.core.db.memory import InMemoryRepository
+from furiousapi.core.db.metaclasses import model_query
+from furiousapi.core.db.models import FuriousPydanticConfig
+from furiousapi.core.pagination import OffsetPaginationParams
+from furiousapi.core.responses import ModelResponse
+
+#: relative change above which a metric is reported as a regression
+DEFAULT_THRESHOLD = 0.15
+PAGE_SIZE = 20
+BULK_SIZE = 100
+
+
+class Item(BaseModel):
+    id: Optional[str]
+    name: str
+    price: float
+    tags: List[str]
+    created_at: datetime
+
+    class Config(FuriousPydanticConfig):
+        pass
+
+
+class ItemRepository(InMemoryRepository[Item]):  # type: ignore[misc]
+    pass
+
+
+def make_item(rnd: random.Random, id_: Optional[str] = None) -> Item:
+    return Item(
+        id=id_,
+        name=f"item {rnd.randrange(10**6)}",
+        price=round(rnd.uniform(1, 1000), 2),
+        tags=rnd.sample(["red", "green", "blue", "new", "sale", "popular"], 3),
+        created_at=datetime(2023, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=rnd.randrange(10**7)),
+    )
+
+
+def make_app(repository: ItemRepository) -> FastAPI:
+    def repository_dependency() -> ItemRepository:
+        return repository
+
+    class ItemController(ModelController, BulkCreateModelMixin):
+        repository: ItemRepository = Depends(repository_dependency)
+
+        @action("/offset")
+        async def list_offset(self, pagination=model_query(OffsetPaginationParams)) -> ModelResponse:  # noqa: ANN001
+            return ModelResponse(await self.repository.list(pagination))
+
+    app = FastAPI()
+    app.include_router(ItemController.api_router)
+    return app
+
+
+# a request factory returns (method, url, query params, json body) for the request number `i`
+Request = Tuple[str, str, Optional[Dict[str, Any]], Any]
+RequestFactory = Callable[[int], Request]
+
+
+def make_scenarios(rnd: random.Random, items: int, cursors: Sequence[str]) -> Dict[str, RequestFactory]:
+    ids = [f"{i:08d}" for i in range(items)]
+    bodies = [make_item(rnd).dict(exclude={"id"}) for _ in range(BULK_SIZE)]
+    for body in bodies:
+        body["created_at"] = body["created_at"].isoformat()
+
+    return {
+        "get": lambda i: ("GET", f"/{ids[i * 7919 % items]}", None, None),
+        "list_offset": lambda i: ("GET", "/offset", {"limit": PAGE_SIZE, "offset": i * PAGE_SIZE % items}, None),
+        "list_cursor": lambda i: ("GET", "/", {"limit": PAGE_SIZE, "next": cursors[i % len(cursors)]}, None),
+        "create": lambda i: ("POST", "/", None, bodies[i % BULK_SIZE]),
+        "bulk_create": lambda _: ("POST", "/bulk", None, bodies),
+    }
+
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    rps: float
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, factory: RequestFactory, requests: int, repeat: int
+) -> ScenarioResult:
+    async def send(i: int) -> float:
+        method, url, params, body = factory(i)
+        start = time.perf_counter()
+        response = await client.request(method, url, params=params, json=body)
+        elapsed = time.perf_counter() - start
+        if response.status_code >= 400:  # noqa: PLR2004
+            raise RuntimeError(f"{method} {url} failed with {response.status_code}: {response.text[:200]}")
+        return elapsed
+
+    for i in range(min(50, requests)):
+        await send(i)
+
+    # best of `repeat` runs, the noise of a shared machine only makes a run slower
+    runs = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        latencies = [await send(i) for i in range(requests)]
+        runs.append((time.perf_counter() - start, sorted(latencies)))
+    total, latencies = min(runs, key=lambda run: run[0])
+
+    # traced separately, tracemalloc slows down the requests it traces
+    tracemalloc.start()
+    try:
+        peaks = []
+        for i in range(min(20, requests)):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await send(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return ScenarioResult(
+        requests=requests,
+        rps=requests / total,
+        p50_ms=statistics.median(latencies) * 1000,
+        p99_ms=quantiles[98] * 1000,
+        peak_kib=statistics.median(peaks) / 1024,
+    )
+
+
+async def collect_cursors(client: httpx.AsyncClient) -> List[str]:
+    cursors, next_ = [], None
+    while True:
+        response = await client.get("/", params={"limit": PAGE_SIZE, **({"next": next_} if next_ else {})})
+        next_ = response.json().get("next")
+        if not next_:
+            return cursors
+        cursors.append(next_)
+
+
+async def run(requests: int, repeat: int, items: int, seed: int, scenarios: Optional[List[str]]) -> Dict[str, Any]:
+    rnd = random.Random(seed)
+    results: Dict[str, Any] = {}
+    all_scenarios = None
+    for name in scenarios or ["get", "list_offset", "list_cursor", "create", "bulk_create"]:
+        # a fresh dataset per scenario, so writes of one scenario do not change the next one
+        repository = ItemRepository(make_item(random.Random(seed + i), f"{i:08d}") for i in range(items))
+        async with httpx.AsyncClient(app=make_app(repository), base_url="http://benchmark") as client:
+            if all_scenarios is None:
+                all_scenarios = make_scenarios(rnd, items, await collect_cursors(client))
+            if name not in all_scenarios:
+                raise SystemExit(f"unknown scenario {name}, available: {', '.join(all_scenarios)}")
+            result = await run_scenario(client, all_scenarios[name], requests, repeat)
+        results[name] = asdict(result)
+        print(  # noqa: T201
+            f"{name:12} {result.rps:9.1f} req/s  p50 {result.p50_ms:7.3f} ms  p99 {result.p99_ms:7.3f} ms"
+            f"  peak {result.peak_kib:8.1f} KiB"
+        )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": requests,
+            "repeat": repeat,
+            "items": items,
+            "seed": seed,
+        },
+        "scenarios": results,
+    }
+
+
+#: metric -> (True when higher is better, threshold multiplier), the tail latency is noisier than the median
+METRICS = {"rps": (True, 1), "p50_ms": (False, 1), "p99_ms": (False, 2), "peak_kib": (False, 1)}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print the relative change of every metric and return the regressions larger than `threshold`.
+    """
+    regressions = []
+    for name, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            print(f"{name:12} no baseline")  # noqa: T201
+            continue
+        changes = []
+        for metric, (higher_is_better, multiplier) in METRICS.items():
+            change = (result[metric] - base[metric]) / base[metric] if base[metric] else 0.0
+            worse = -change if higher_is_better else change
+            changes.append(f"{metric} {change:+7.1%}")
+            if worse > threshold * multiplier:
+                regressions.append(f"{name} {metric}: {base[metric]:.3f} -> {result[metric]:.3f} ({change:+.1%})")
+        print(f"{name:12} " + "  ".join(changes))  # noqa: T201
+    return regressions
+
+
+def load(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text())  # type: ignore[no-any-return]
+
+
+def report(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    regressions = compare(baseline, current, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")  # noqa: T201
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the scenarios")
+    run_parser.add_argument("--requests", type=int, default=500, help="measured requests per scenario")
+    run_parser.add_argument("--repeat", type=int, default=3, help="runs per scenario, the fastest is reported")
+    run_parser.add_argument("--items", type=int, default=1000, help="items in the repository")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--scenario", action="append", dest="scenarios", help="run only these scenarios")
+    run_parser.add_argument("--output", help="write the results as json")
+    run_parser.add_argument("--baseline", help="compare with these results, exit with 1 on regressions")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return report(load(args.baseline), load(args.current), args.threshold)
+
+    results = asyncio.run(run(args.requests, args.repeat, args.items, args.seed, args.scenarios))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        return report(load(args.baseline), results, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
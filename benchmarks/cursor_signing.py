@@ -0,0 +1,70 @@
+"""
+Measures the per page overhead of signing cursors.
+
+    python -m benchmarks.cursor_signing [--page-size 50] [--repeat 200]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, ClassVar, List
+
+from pydantic import BaseModel
+
+from furiousapi.core.db.cursors import BinaryCursorCodec, CursorSigner
+from furiousapi.core.db.models import json_dumps, json_loads
+from furiousapi.core.db.pagination import BaseRelayPagination
+from furiousapi.core.db.utils import get_model_sort_fields_enum
+
+
+class Item(BaseModel):
+    id: str
+    created_at: datetime
+    rank: int
+
+
+ItemSortEnum = get_model_sort_fields_enum(Item)
+
+
+class Pagination(BaseRelayPagination):
+    __json_dumps__: ClassVar[Callable] = staticmethod(json_dumps)
+    __json_loads__: ClassVar[Callable] = staticmethod(json_loads)
+    __cursor_codec__ = BinaryCursorCodec()
+
+
+class SignedPagination(Pagination):
+    __cursor_signer__ = CursorSigner("benchmark-secret")
+
+
+def make_items(page_size: int) -> List[Item]:
+    now = datetime(2023, 1, 1)  # noqa: DTZ001
+    return [Item(id=f"{i:024x}", created_at=now + timedelta(seconds=i), rank=i) for i in range(page_size)]
+
+
+def bench(pagination_cls: type, items: List[Item], repeat: int) -> float:
+    def page() -> None:
+        pagination = pagination_cls(ItemSortEnum, {"id"}, [-ItemSortEnum("created_at")])
+        field_orderings = pagination.get_field_orderings()
+        cursors = pagination.make_cursors(items, field_orderings)
+        pagination.parse_cursor(cursors[-1], field_orderings)
+
+    return min(timeit.repeat(page, number=repeat, repeat=5)) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    items = make_items(args.page_size)
+    plain = bench(Pagination, items, args.repeat)
+    signed = bench(SignedPagination, items, args.repeat)
+    print(f"page size: {args.page_size}")  # noqa: T201
+    print(f"unsigned: {plain * 1e6:10.1f} us/page")  # noqa: T201
+    print(f"signed:   {signed * 1e6:10.1f} us/page")  # noqa: T201
+    print(f"overhead: {(signed - plain) * 1e6:10.1f} us/page ({(signed / plain - 1) * 100:.1f}%)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
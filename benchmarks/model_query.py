@@ -0,0 +1,43 @@
+"""
+Compares the validated and the compiled `model_query` dependencies on a wide filter model.
+
+    python -m benchmarks.model_query [--fields 40] [--set 3] [--repeat 20000]
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, create_model
+
+from furiousapi.core.db.metaclasses import model_query
+
+
+def make_filter_model(fields: int) -> Type[BaseModel]:
+    return create_model(  # type: ignore[call-overload,no-any-return]
+        "WideFiltering", **{f"field_{i}": (Optional[int], None) for i in range(fields)}
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=40)
+    parser.add_argument("--set", type=int, default=3, help="number of query parameters which are not None")
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    model = make_filter_model(args.fields)
+    kwargs: Dict[str, Any] = {f"field_{i}": i if i < args.set else None for i in range(args.fields)}
+
+    print(f"fields: {args.fields}, set: {args.set}")  # noqa: T201
+    results = {}
+    for name, compiled in (("validated", False), ("compiled", True)):
+        dependency = model_query(model, compiled=compiled).dependency
+        timer = timeit.Timer(lambda dependency=dependency: dependency(**kwargs))  # type: ignore[misc]
+        results[name] = min(timer.repeat(number=args.repeat, repeat=5)) / args.repeat
+        print(f"{name:10}: {results[name] * 1e6:8.2f} us/request")  # noqa: T201
+    print(f"speedup   : {results['validated'] / results['compiled']:8.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
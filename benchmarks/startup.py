@@ -0,0 +1,128 @@
+"""
+Measures the time to define controllers, on a synthetic hierarchy of class based views.
+
+every controller inherits `--depth` base classes, each adding `--dependencies` class dependencies
+and `--actions` routes, the controllers are created with and without the shared introspection cache
+and with a lazy bootstrap, which defers the route registration to the first use of the router.
+by default no routes are defined, so only the class introspection and the `__init__` rewrite are measured,
+with routes FastAPI building the dependants of every route dominates the startup time.
+
+    python -m benchmarks.startup [--controllers 200] [--depth 6] [--dependencies 6] [--actions 0]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple, Type
+from unittest import mock
+
+from fastapi import APIRouter, Depends, FastAPI
+
+from furiousapi.core.api.controllers import CBV, action
+from furiousapi.core.api.controllers import base
+from furiousapi.core.api.controllers.base import LazyAPIRouter
+
+
+class Service:
+    pass
+
+
+def make_dependency(level: int, index: int) -> Callable[[], Service]:
+    def dependency() -> Service:
+        return Service()
+
+    dependency.__name__ = f"dependency_{level}_{index}"
+    return dependency
+
+
+def make_action(level: int, index: int) -> Callable[..., Any]:
+    async def endpoint(self, query: int = 0) -> Dict[str, int]:  # noqa: ANN001, ARG001
+        return {"query": query}
+
+    endpoint.__name__ = f"action_{level}_{index}"
+    return action(f"/{level}/{index}")(endpoint)
+
+
+def make_bases(depth: int, dependencies: int, actions: int) -> Type[CBV]:
+    parent: Type[Any] = CBV
+    for level in range(depth):
+        namespace: Dict[str, Any] = {"__annotations__": {}, "api_router": APIRouter()}
+        for i in range(dependencies):
+            namespace["__annotations__"][f"service_{level}_{i}"] = Service
+            namespace[f"service_{level}_{i}"] = Depends(make_dependency(level, i))
+        for i in range(actions):
+            namespace[f"action_{level}_{i}"] = make_action(level, i)
+        parent = type(parent)(f"Base{level}", (parent,), namespace)
+    return parent
+
+
+def define(parent: Type[Any], controllers: int, *, lazy: bool) -> List[Type[Any]]:
+    return [
+        type(parent)(
+            f"Controller{i}",
+            (parent,),
+            {"api_router": LazyAPIRouter() if lazy else APIRouter(), "__lazy_bootstrap__": lazy},
+        )
+        for i in range(controllers)
+    ]
+
+
+def uncached() -> Tuple[Any, Any]:
+    """
+    Patch the helpers to resolve the class hints and members on every call, as before the introspection cache.
+    """
+
+    def get_return_type(call: Callable[..., Any]) -> Any:
+        return base.get_type_hints(call).get("return")
+
+    return mock.patch.object(base, "introspect", base._introspect), mock.patch.object(  # noqa: SLF001
+        base, "_get_return_type", get_return_type
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--controllers", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--dependencies", type=int, default=6)
+    parser.add_argument("--actions", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    parent = make_bases(args.depth, args.dependencies, args.actions)
+    routes = args.controllers * args.depth * args.actions
+    print(f"controllers: {args.controllers}, routes: {routes}")  # noqa: T201
+
+    def measure(setup: Callable[[], Tuple[Any, ...]], *, lazy: bool, include: bool) -> float:
+        best = float("inf")
+        for _ in range(args.repeat):
+            patches = setup()
+            for patch in patches:
+                patch.start()
+            try:
+                start = time.perf_counter()
+                controllers = define(parent, args.controllers, lazy=lazy)
+                if include:
+                    app = FastAPI()
+                    for controller in controllers:
+                        app.include_router(controller.api_router)
+                best = min(best, time.perf_counter() - start)
+            finally:
+                for patch in patches:
+                    patch.stop()
+        return best
+
+    results = {
+        "uncached": measure(uncached, lazy=False, include=False),
+        "cached": measure(tuple, lazy=False, include=False),
+        "cached (include)": measure(tuple, lazy=False, include=True),
+        "lazy (define)": measure(tuple, lazy=True, include=False),
+        "lazy (include)": measure(tuple, lazy=True, include=True),
+    }
+    for name, duration in results.items():
+        per_controller = duration / args.controllers * 1e6
+        print(f"{name:16}: {duration * 1000:9.1f} ms  {per_controller:8.1f} us/controller")  # noqa: T201
+    print(f"speedup         : {results['uncached'] / results['cached']:9.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
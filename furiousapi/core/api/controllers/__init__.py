@@ -7,6 +7,10 @@ from .mixins import (
     CreateModelMixin,
     GetModelMixin,
     ListModelMixin,
+    StreamBulkCreateModelMixin,
+    StreamBulkDeleteModelMixin,
+    StreamBulkUpdateModelMixin,
+    StreamListModelMixin,
 )
 
 __all__ = [
@@ -15,9 +19,13 @@ __all__ = [
     "ModelController",
     "GetModelMixin",
     "ListModelMixin",
+    "StreamListModelMixin",
     "CreateModelMixin",
     "BulkCreateModelMixin",
     "BulkUpdateModelMixin",
     "BulkDeleteModelMixin",
+    "StreamBulkCreateModelMixin",
+    "StreamBulkUpdateModelMixin",
+    "StreamBulkDeleteModelMixin",
     "action",
 ]
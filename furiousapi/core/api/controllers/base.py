@@ -3,7 +3,10 @@ from __future__ import annotations
 import abc
 import inspect
 import logging
-from functools import wraps
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial, wraps
 
 # noinspection PyUnresolvedReferences
 from typing import (  # type:ignore[attr-defined]
@@ -26,6 +29,7 @@ from typing import (  # type:ignore[attr-defined]
     get_type_hints,
     overload,
 )
+from weakref import WeakKeyDictionary
 
 from fastapi import APIRouter
 from fastapi.datastructures import Default, DefaultPlaceholder
@@ -34,7 +38,9 @@ from fastapi.utils import generate_unique_id
 from pydantic.typing import is_classvar
 from starlette.responses import JSONResponse, Response
 
+from furiousapi.core.config import get_settings
 from furiousapi.core.exceptions import FuriousError
+from furiousapi.core.instrumentation import InstrumentedAPIRoute, record_bootstrap
 from furiousapi.utils import NOT_SET
 
 if TYPE_CHECKING:
@@ -84,6 +90,54 @@ def _type_is_sentinel(type_: GenericAlias) -> bool:
     return type_ is Sentinel
 
 
+@dataclass
+class ClassIntrospection:
+    """
+    The type hints and the dependency and route members of a controller class, see `introspect`.
+    """
+
+    hints: Dict[str, Any]
+    dependencies: Dict[str, Depends]
+    routes: List[Tuple[str, Callable[..., Any]]]
+
+
+_introspections: WeakKeyDictionary[type, ClassIntrospection] = WeakKeyDictionary()
+_return_types: WeakKeyDictionary[Callable[..., Any], Any] = WeakKeyDictionary()
+
+
+def introspect(cls: Type[Any]) -> ClassIntrospection:
+    """
+    Resolve the type hints and members of `cls` over its MRO, once per class.
+
+    the result is shared by the helpers of `CBVMeta` and computed when the class is created,
+    before `_get_cls_dependencies_values` rewrites its annotations.
+    """
+    introspection = _introspections.get(cls)
+    if introspection is None:
+        introspection = _introspections[cls] = _introspect(cls)
+    return introspection
+
+
+def _introspect(cls: Type[Any]) -> ClassIntrospection:
+    members = inspect.getmembers(cls)
+    return ClassIntrospection(
+        hints=get_type_hints(cls, include_extras=True),
+        dependencies={name: value for name, value in members if _is_dependency(value)},
+        routes=[(name, value) for name, value in members if _is_route(value)],
+    )
+
+
+def _get_return_type(call: Callable[..., Any]) -> Any:
+    try:
+        return _return_types[call]
+    except (KeyError, TypeError):  # TypeError: not weak referenceable
+        pass
+    return_type = get_type_hints(call).get("return")
+    with suppress(TypeError):
+        _return_types[call] = return_type
+    return return_type
+
+
 def _class_has_sentinels(cls: Type[Any]) -> bool:
     """
     Check if the given class has any attributes with Sentinel types.
@@ -94,18 +148,12 @@ def _class_has_sentinels(cls: Type[Any]) -> bool:
     :return: True if the class has any attributes with Sentinel types, False otherwise.
     :rtype: bool
     """
-    class_sentinels = [
-        name for name, hint in get_type_hints(cls, include_extras=True).items() if _type_is_sentinel(hint)
-    ]
-
-    dependencies_values = dict(inspect.getmembers(cls, _is_dependency))
-    for name in class_sentinels:
-        if name not in dependencies_values:
-            return True
-        if isinstance(dependencies_values[name], Depends):
-            class_sentinels.remove(name)
-
-    return bool(class_sentinels)
+    introspection = introspect(cls)
+    return any(
+        not isinstance(introspection.dependencies.get(name), Depends)
+        for name, hint in introspection.hints.items()
+        if _type_is_sentinel(hint)
+    )
 
 
 def _update_cbv_route_endpoint_signature(cls: Type[Any], route: Callable[..., Any]) -> None:
@@ -143,6 +191,9 @@ def _is_mixin(cls: Type) -> bool:
 
 
 def _new_init(cls: Type) -> None:
+    # a lazy bootstrap which failed runs again, the `__init__` of the class must not be wrapped twice
+    if getattr(cls.__dict__.get("__init__"), "__furious_cls__", None) is cls:
+        return
     old_init: Callable[..., Any] = cls.__init__
     old_signature = inspect.signature(old_init)
     old_parameters: list[inspect.Parameter] = list(old_signature.parameters.values())[1:]  # drop `self` parameter
@@ -173,21 +224,24 @@ def _new_init(cls: Type) -> None:
 
         old_init(self, *args, **kwargs)
 
+    new_init.__furious_cls__ = cls  # type: ignore[attr-defined]
     cls.__signature__ = new_signature
     cls.__init__ = new_init
 
 
 def _get_cls_dependencies_values(cls: Type) -> Set[Tuple[str, Type]]:
     dependencies: Set[Tuple[str, Type]] = set()
-    dependencies_by_name = dict(inspect.getmembers(cls, _is_dependency))
-    hints = get_type_hints(cls, include_extras=True)
+    introspection = introspect(cls)
+    dependencies_by_name = introspection.dependencies
+    hints = introspection.hints
 
     for dependency_name, dependency in dependencies_by_name.items():
         cls.__annotations__[dependency_name] = dependency
-        return_type = get_type_hints(dependency.dependency).get("return")
-        logger.warning(
-            f"dependency {dependency_name} has not defined return type hint __{dependency_name}__cls__ will be None"
-        )
+        return_type = _get_return_type(dependency.dependency)
+        if return_type is None:
+            logger.warning(
+                f"dependency {dependency_name} has not defined return type hint __{dependency_name}__cls__ will be None"
+            )
         dependencies.add((dependency_name, cast(Type, return_type)))
 
     for dependency_name, dependency_hint in _get_annotated_dependencies(dependencies_by_name, hints):
@@ -258,7 +312,100 @@ def action(path: str, **route_kwargs):
     return inner
 
 
+class LazyAPIRouter(APIRouter):
+    """
+    An `APIRouter` which bootstraps its controllers when its routes are first accessed
+    (e.g. by `include_router`) instead of when the controller classes are defined.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._pending: List[Callable[[], None]] = []
+        self._materialized = False
+        self._bootstrapping = False
+        super().__init__(*args, **kwargs)
+
+    def defer(self, bootstrap: Callable[[], None]) -> bool:
+        """
+        Run `bootstrap` on the first access to the routes, returns False when they were already accessed.
+        """
+        if self._materialized:
+            return False
+        self._pending.append(bootstrap)
+        return True
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    @property  # type: ignore[override]
+    def routes(self) -> List[BaseRoute]:
+        self._materialized = True
+        # a running bootstrap accesses the routes to add its own
+        while self._pending and not self._bootstrapping:
+            routes = list(self._routes)
+            self._bootstrapping = True
+            try:
+                self._pending[0]()
+            except BaseException:
+                # the bootstrap stays pending, without the routes it added, and fails again on the next access
+                self._routes = routes
+                raise
+            finally:
+                self._bootstrapping = False
+            self._pending.pop(0)
+        return self._routes
+
+    @routes.setter
+    def routes(self, routes: List[BaseRoute]) -> None:
+        self._routes = routes
+
+
+def _is_lazy(cls: Type[Any]) -> bool:
+    lazy = getattr(cls, "__lazy_bootstrap__", None)
+    return get_settings().controllers.lazy_bootstrap if lazy is None else lazy
+
+
+def bootstrap(cls: Type[Any], *, lazy: bool = False) -> None:
+    """
+    Register the routes of a controller, its actions and the endpoints of its mixins, on its `api_router`.
+    """
+    start = time.perf_counter()
+    _new_init(cls)
+
+    for _, route in introspect(cls).routes:
+        _update_cbv_route_endpoint_signature(cls, route)
+        cls.api_router.add_api_route(getattr(route, ROUTE_PATH), route, **getattr(route, ROUTE_KWARGS))
+
+    mixins: list[Type[BaseRouteMixin]] = cast(list[Type[BaseRouteMixin]], [b for b in cls.mro()[1:] if _is_mixin(b)])
+
+    for mix in mixins:
+        try:
+            endpoint: Callable[..., Optional[Any]] = getattr(mix, cast(str, mix.__method_name__))
+        except AttributeError as e:
+            raise FuriousError(f"endpoint {mix.__method_name__} must be defined") from e
+
+        _update_cbv_route_endpoint_signature(cls, endpoint)
+        mix.__bootstrap__(cls)
+
+    if cls.__enabled_routes__:
+        cls.api_router.routes = [
+            route
+            for route in cls.api_router.routes
+            if route.name in cls.__enabled_routes__  # type: ignore[attr-defined]
+        ]
+
+    record_bootstrap(f"{cls.__module__}.{cls.__qualname__}", time.perf_counter() - start, lazy=lazy)
+
+
 class CBVMeta(abc.ABCMeta):
+    """
+    Registers the routes of a controller class on its `api_router`, see `bootstrap`.
+
+    when `__lazy_bootstrap__` (or `Settings.controllers.lazy_bootstrap`) is set the registration is deferred
+    to the first access to the routes of the router, usually when it is included in the application,
+    so importing many controllers stays cheap.
+    """
+
     __enabled_routes__: Union[Set[str], List[str], Tuple[str]]
     api_router: APIRouter
 
@@ -270,35 +417,21 @@ class CBVMeta(abc.ABCMeta):
         if _class_has_sentinels(cls):
             return cls
 
-        _new_init(cls)
-
+        lazy = _is_lazy(cls)
         if not hasattr(cls, "api_router") or not cls.api_router or not isinstance(cls.api_router, APIRouter):
-            api_router = APIRouter(**router_kwargs)
+            router_kwargs.setdefault("route_class", InstrumentedAPIRoute)
+            api_router = (LazyAPIRouter if lazy else APIRouter)(**router_kwargs)
             cls.api_router = api_router
 
-        for _, route in inspect.getmembers(cls, _is_route):
-            _update_cbv_route_endpoint_signature(cls, route)
-            cls.api_router.add_api_route(getattr(route, ROUTE_PATH), route, **getattr(route, ROUTE_KWARGS))
-
-        mixins: list[Type[BaseRouteMixin]] = cast(
-            list[Type[BaseRouteMixin]], [b for b in cls.mro()[1:] if _is_mixin(b)]
-        )
-
-        for mix in mixins:
-            try:
-                endpoint: Callable[..., Optional[Any]] = getattr(mix, cast(str, mix.__method_name__))
-            except AttributeError as e:
-                raise FuriousError(f"endpoint {mix.__method_name__} must be defined") from e
-
-            _update_cbv_route_endpoint_signature(cls, endpoint)
-            mix.__bootstrap__(cls)
-
-        if cls.__enabled_routes__:
-            cls.api_router.routes = [
-                route
-                for route in cls.api_router.routes
-                if route.name in cls.__enabled_routes__  # type: ignore[attr-defined]
-            ]
+        if (
+            lazy
+            and isinstance(cls.api_router, LazyAPIRouter)
+            and cls.api_router.defer(partial(bootstrap, cls, lazy=True))
+        ):
+            # only the routes are deferred, the controller can be instantiated before they are registered
+            _new_init(cls)
+        else:
+            bootstrap(cls)
 
         return cls
 
@@ -306,6 +439,8 @@ class CBVMeta(abc.ABCMeta):
 class CBV(abc.ABC, metaclass=CBVMeta):
     api_router: ClassVar[APIRouter]
     __enabled_routes__: ClassVar[Sequence[str]] = ()
+    #: defer registering the routes to the first use of `api_router`, defaults to `Settings.controllers.lazy_bootstrap`
+    __lazy_bootstrap__: ClassVar[Optional[bool]] = None
 
 
 class ModelController(
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import inspect
 from abc import ABC
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Awaitable,
     Callable,
     ClassVar,
+    Dict,
     List,
     Optional,
     Type,
@@ -15,19 +20,42 @@ from typing import (
     cast,
 )
 
-from fastapi import APIRouter, Path, Query
-from pydantic import BaseModel, conlist
+from fastapi import APIRouter, Path, Query, Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, conlist, parse_obj_as
+from starlette.responses import Response, StreamingResponse
 
 from furiousapi.core.api import error_details
+from furiousapi.core.api.exceptions import BadRequestHttpError
+from furiousapi.core.db.bulk import BulkExecutor
+from furiousapi.core.db.counting import CountingStrategy, CountModeEnum
+from furiousapi.core.db.exceptions import FuriousBulkError
 from furiousapi.core.db.metaclasses import model_query
+from furiousapi.core.db.prefetch import PagePrefetcher  # noqa: TCH001
+from furiousapi.core.db.projection import FieldProjection, Include
 from furiousapi.core.db.repository import BaseRepository  # noqa: TCH001
+from furiousapi.core.exceptions import InvalidCursorError
+from furiousapi.core.instrumentation import PHASE_SERIALIZATION, phase
 from furiousapi.core.pagination import CursorPaginationParams, PaginatedResponse
-from furiousapi.core.responses import BulkResponseModel, PartialModelResponse
+from furiousapi.core.parsers import iter_items
+from furiousapi.core.responses import (
+    BulkItemError,
+    BulkResponseModel,
+    BulkResultBuilder,
+    BulkErrorsResponseModel,
+    BulkResultResponse,
+    ModelResponse,
+    PartialModelResponse,
+    RequestStreamingResponse,
+    StreamFormatEnum,
+    stream_bulk_results,
+    stream_pages,
+)
 
 from .utils import add_model_method_name
 
 if TYPE_CHECKING:
-    from furiousapi.core.db.fields import SortableFieldEnum
+    from furiousapi.core.db.fields import SortKey
     from furiousapi.core.types import TEntity, TModelFields
 
     from .base import ModelController, Sentinel  # noqa: F401,RUF100
@@ -60,6 +88,21 @@ class BaseRouteMixin(ABC):
 class BaseModelRouteMixin(BaseRouteMixin, ABC):
     repository: BaseRepository
     __repository_cls__: ClassVar[Type[BaseRepository]]
+    #: `ModelResponse` and `PartialModelResponse` serialize the projection of `fields` themselves,
+    #: other response classes are given the projected data
+    model_response_class: ClassVar[Type[Response]] = ModelResponse
+
+    def render_model(self, content: Any, include: Optional[Include] = None) -> Response:
+        if not issubclass(self.model_response_class, (ModelResponse, PartialModelResponse)):
+            return self.model_response_class(jsonable_encoder(content, include=include))
+        if include is None:
+            return self.model_response_class(content)
+        return self.model_response_class(content, include=include)
+
+    def invalidate_caches(self) -> None:
+        """
+        Drop the results cached from the repository (e.g. list totals), called by the write endpoints.
+        """
 
 
 class GetModelMixin(BaseModelRouteMixin):
@@ -81,30 +124,27 @@ class GetModelMixin(BaseModelRouteMixin):
 
     async def get(
         self, id_: str = Path(..., alias="id"), fields: Optional[List[TModelFields]] = Query(None)
-    ) -> PartialModelResponse:
-        result: Optional[BaseModel] = await self.repository.get(id_, fields)
-        return PartialModelResponse(result)
+    ) -> Response:
+        projection = FieldProjection.from_fields(fields)
+        result: Optional[BaseModel] = await self.repository.get(id_, projection)
+        with phase(PHASE_SERIALIZATION):
+            return self.render_model(result, None if projection is None else projection.include)
 
 
 class ListModelMixin(BaseModelRouteMixin):
     __method_name__: ClassVar[str] = "list"
+    count_strategy: ClassVar[CountingStrategy] = CountingStrategy()
+    #: when set, the next cursor page is fetched in the background after every page, see `PagePrefetcher`
+    page_prefetcher: ClassVar[Optional[PagePrefetcher]] = None
 
-    def __bootstrap__(cls, **kwargs) -> None:
-        signature = inspect.signature(cls.list)
-        parameters = signature.parameters.copy()
-        parameters["fields"] = parameters["fields"].replace(
-            annotation=Optional[conlist(cls.__repository_cls__.__fields__, min_items=1)],
-        )
+    def invalidate_caches(self) -> None:
+        super().invalidate_caches()
+        self.count_strategy.invalidate(self.repository)
+        if self.page_prefetcher is not None:
+            self.page_prefetcher.invalidate(self.repository)
 
-        parameters["sorting"] = parameters["sorting"].replace(
-            annotation=Optional[conlist(cls.__repository_cls__.__sort__, min_items=1)],
-            default=Query(None, examples=cls.__repository_cls__.__sort__.examples),
-        )
-
-        parameters["filtering"] = parameters["filtering"].replace(
-            default=cls.__repository_cls__.Config.model_to_query(cls.__repository_cls__.__filtering__),
-        )
-        cls.list.__signature__ = signature.replace(parameters=list(parameters.values()))  # type: ignore[attr-defined]
+    def __bootstrap__(cls, **kwargs) -> None:
+        _set_list_signature(cls, cls.list)
         params = {"response_model": PaginatedResponse[cls.__repository_cls__.__model__]}  # type: ignore[name-defined]
         add_model_method_name(cast("Type[ModelController]", cls), params, plural=True)
         cls.api_router.get("/", **params)(cls.list)  # type: ignore[arg-type]
@@ -115,12 +155,112 @@ class ListModelMixin(BaseModelRouteMixin):
             CursorPaginationParams
         ),
         fields: Optional[List[TModelFields]] = Query(None),  # type: ignore[assignment]
-        sorting: Optional[List[SortableFieldEnum]] = Query(None),  # type: ignore[assignment]
+        sorting: Optional[List[SortKey]] = Query(None),  # type: ignore[assignment]
         filtering=None,  # noqa: ANN001 todo: currently creates a bug which prevents test from running
+        count: Optional[CountModeEnum] = Query(
+            None, description="how to compute `total`, left to the repository by default"
+        ),
     ) -> PaginatedResponse:
         pagination = cast(CursorPaginationParams, pagination)
-        res = cast(BaseModel, await self.repository.list(pagination, fields, sorting, filtering))
-        return cast(PaginatedResponse, PartialModelResponse(res))
+        projection = FieldProjection.from_fields(fields)
+        if self.page_prefetcher is None:
+            page = self.repository.list(pagination, projection, sorting, filtering)
+        else:
+            page = self.page_prefetcher.list(self.repository, pagination, projection, sorting, filtering)
+        counting = None
+        if count is not None:
+            counting = asyncio.ensure_future(self.count_strategy.count(self.repository, filtering, count))
+        try:
+            res = cast(BaseModel, await page)
+        except BaseException as e:
+            # don't leave the count running in the background
+            if counting is not None:
+                counting.cancel()
+            if isinstance(e, InvalidCursorError):
+                raise BadRequestHttpError(str(e)) from e
+            raise
+        if counting is not None:
+            total = await counting
+            # keep the total the repository filled in when it can't count, unless asked for none
+            if total.total is not None or count == CountModeEnum.NONE:
+                res.total, res.total_estimated = total
+        with phase(PHASE_SERIALIZATION):
+            response = self.render_model(res, None if projection is None else projection.include_items(res))
+            return cast(PaginatedResponse, response)
+
+
+def _set_list_signature(cls: Type[BaseModelRouteMixin], endpoint: Callable[..., Any]) -> None:
+    """
+    Set the `fields`, `sorting` and `filtering` parameters of a list like endpoint from the repository.
+    """
+    signature = inspect.signature(endpoint)
+    parameters = signature.parameters.copy()
+    parameters["fields"] = parameters["fields"].replace(
+        annotation=Optional[conlist(cls.__repository_cls__.__fields__, min_items=1)],
+    )
+
+    parameters["sorting"] = parameters["sorting"].replace(
+        annotation=Optional[conlist(cls.__repository_cls__.__sort__, min_items=1)],
+        default=Query(None, examples=cls.__repository_cls__.__sort__.examples),
+    )
+
+    parameters["filtering"] = parameters["filtering"].replace(
+        default=cls.__repository_cls__.Config.model_to_query(cls.__repository_cls__.__filtering__),
+    )
+    endpoint.__signature__ = signature.replace(parameters=list(parameters.values()))  # type: ignore[attr-defined]
+
+
+class StreamListModelMixin(BaseModelRouteMixin):
+    """
+    Streams the whole (filtered) collection as NDJSON or as a chunked JSON document.
+
+    pages are fetched one at a time with `BaseRepository.iter_pages`, so memory stays bounded by the page size,
+    the last line (or the `next` key in json format) holds the cursor to resume from.
+    """
+
+    __method_name__: ClassVar[str] = "stream"
+
+    def __bootstrap__(cls, **kwargs) -> None:
+        _set_list_signature(cls, cls.stream)
+        responses = {
+            200: {
+                "content": {StreamFormatEnum.NDJSON.media_type: {}, StreamFormatEnum.JSON.media_type: {}},
+                "description": "one item per line followed by a `$meta` line with the resume cursor",
+            }
+        }
+        params = {"responses": responses, "response_class": StreamingResponse}
+        add_model_method_name(cast("Type[ModelController]", cls), params, plural=True)
+        cls.api_router.get("/stream", **params)(cls.stream)  # type: ignore[arg-type]
+
+    async def stream(
+        self,
+        pagination=model_query(CursorPaginationParams),  # noqa: ANN001
+        fields: Optional[List[TModelFields]] = Query(None),  # type: ignore[assignment]
+        sorting: Optional[List[SortKey]] = Query(None),  # type: ignore[assignment]
+        filtering=None,  # noqa: ANN001
+        format_: StreamFormatEnum = Query(StreamFormatEnum.NDJSON, alias="format"),
+        max_items: Optional[int] = Query(None, ge=1, description="stop after this many items"),
+    ) -> StreamingResponse:
+        pagination = cast(CursorPaginationParams, pagination)
+        projection = FieldProjection.from_fields(fields)
+        pages = self.repository.iter_pages(pagination, projection, sorting, filtering, max_items=max_items)
+        # fetch the first page before the response starts, so an invalid cursor is still a 400
+        try:
+            first = await pages.__anext__()
+        except InvalidCursorError as e:
+            raise BadRequestHttpError(str(e)) from e
+        except StopAsyncIteration:
+            first = None
+        include = None if projection is None else projection.include
+        return StreamingResponse(stream_pages(_prepend(first, pages), format_, include), media_type=format_.media_type)
+
+
+async def _prepend(first: Optional[Any], pages: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    if first is None:
+        return
+    yield first
+    async for page in pages:
+        yield page
 
 
 class DeleteModelMixin(BaseModelRouteMixin):
@@ -133,7 +273,10 @@ class DeleteModelMixin(BaseModelRouteMixin):
         cls.api_router.delete("/{id}", **params)(cls.delete)  # type: ignore[arg-type]
 
     async def delete(self, id_: Union[str, int] = Path(..., alias="id")) -> None:
-        return await self.repository.delete(id_)
+        try:
+            return await self.repository.delete(id_)
+        finally:
+            self.invalidate_caches()
 
 
 class CreateModelMixin(BaseModelRouteMixin):
@@ -159,7 +302,10 @@ class CreateModelMixin(BaseModelRouteMixin):
         cls.api_router.post("/", **params)(cls.create)  # type: ignore[arg-type]
 
     async def create(self, model: Union[BaseModel, TEntity]) -> TEntity:
-        return await self.repository.add(model)
+        try:
+            return await self.repository.add(model)
+        finally:
+            self.invalidate_caches()
 
 
 class UpdateModelMixin(BaseModelRouteMixin):
@@ -185,29 +331,40 @@ class UpdateModelMixin(BaseModelRouteMixin):
         cls.api_router.put("/", **params)(cls.update)  # type: ignore[arg-type]
 
     async def update(self, model: Union[BaseModel, TEntity]) -> Any:
-        return await self.repository.update(model)
+        try:
+            return await self.repository.update(model)
+        finally:
+            self.invalidate_caches()
 
 
 class BulkBase(BaseModelRouteMixin, ABC):
     __bulk_route__ = "bulk"
     __bulk_method__: str
+    bulk_executor: ClassVar[BulkExecutor] = BulkExecutor()
 
     @staticmethod
-    def set_route(cls, method, handler: Callable, **params) -> None:  # noqa: ANN001
+    def set_route(cls, method, handler: Callable, path: Optional[str] = None, **params) -> None:  # noqa: ANN001
         if method := getattr(cls.api_router, method):
-            method(f"/{cls.__bulk_route__}", **params)(handler)
+            method(path or f"/{cls.__bulk_route__}", **params)(handler)
         else:
             raise AssertionError(f"{cls.__name__} should define __bulk_method__")
 
+    @staticmethod
+    def get_bulk_responses() -> Dict[Union[int, str], Dict[str, Any]]:
+        return {
+            400: {"model": error_details.BadRequestHttpErrorDetails, "content": {"application/json": {}}},
+            409: {"model": error_details.ConflictHttpErrorDetails, "content": {"application/json": {}}},
+        }
+
 
 class BulkCreateModelMixin(BulkBase):
     create_model: Optional[Type[BaseModel]] = None
-    bulk_response_model: ClassVar[Type[BaseModel]] = BulkResponseModel
+    bulk_response_model: ClassVar[Type[BulkResponseModel]] = BulkResponseModel
     __method_name__: ClassVar[str] = "bulk_create"
     __bulk_method__ = "post"
 
     def __bootstrap__(cls, *args, **kwargs) -> None:
-        responses = {409: {"model": error_details.ConflictHttpErrorDetails, "content": {"application/json": {}}}}
+        responses = cls.get_bulk_responses()
         signature = inspect.signature(cls.bulk_create)
         parameters = signature.parameters.copy()
         if (
@@ -221,12 +378,30 @@ class BulkCreateModelMixin(BulkBase):
         cls.bulk_create.__signature__ = signature.replace(  # type: ignore[attr-defined]
             parameters=list(parameters.values())
         )
-        params = {"responses": responses, "response_model": List[cls.bulk_response_model]}  # type: ignore[name-defined]
+        params = {
+            "responses": responses,
+            # the response is `BulkErrorsResponseModel` with `errors_only`
+            "response_model": Union[cls.bulk_response_model, BulkErrorsResponseModel],  # type: ignore[name-defined]
+        }
         add_model_method_name(cast("Type[ModelController]", cls), params)
         cls.set_route(cls, "post", cls.bulk_create, **params)
 
-    async def bulk_create(self, bulk: List[Union[BaseModel, TEntity]]) -> BulkResponseModel:
-        return await self.repository.bulk_create(bulk)
+    async def bulk_create(
+        self,
+        bulk: List[Union[BaseModel, TEntity]],
+        *,
+        errors_only: bool = Query(
+            default=False, description="respond with the failed items (and their index) and the items count only"
+        ),
+    ) -> Response:
+        try:
+            result = await self.bulk_executor.create(self.repository, bulk)
+        except FuriousBulkError as e:
+            raise BadRequestHttpError(str(e)) from e
+        finally:
+            self.invalidate_caches()
+        with phase(PHASE_SERIALIZATION):
+            return BulkResultResponse(result, errors_only=errors_only, response_model=self.bulk_response_model)
 
 
 class BulkUpdateModelMixin(BulkBase):
@@ -234,7 +409,7 @@ class BulkUpdateModelMixin(BulkBase):
     __method_name__: ClassVar[str] = "bulk_update"
 
     def __bootstrap__(cls, *args, **kwargs) -> Any:
-        responses = {409: {"model": error_details.ConflictHttpErrorDetails, "content": {"application/json": {}}}}
+        responses = cls.get_bulk_responses()
         signature = inspect.signature(cls.bulk_update)
         parameters = signature.parameters.copy()
         if (
@@ -251,20 +426,26 @@ class BulkUpdateModelMixin(BulkBase):
         )
         params = {
             "responses": responses,
-            "response_model": List[cls.__repository_cls__.__model__],  # type: ignore[name-defined]
+            # the items which failed are reported in place as `BulkItemError`
+            "response_model": List[Union[BulkItemError, cls.__repository_cls__.__model__]],  # type: ignore[name-defined]
         }
         add_model_method_name(cast("Type[ModelController]", cls), params)
         cls.set_route(cls, "put", cls.bulk_update, **params)
 
-    async def bulk_update(self, bulk: list[Any]) -> Any:
-        return await self.repository.bulk_update(bulk)
+    async def bulk_update(self, bulk: List[Union[BaseModel, TEntity]]) -> Any:
+        try:
+            return await self.bulk_executor.update(self.repository, bulk)
+        except FuriousBulkError as e:
+            raise BadRequestHttpError(str(e)) from e
+        finally:
+            self.invalidate_caches()
 
 
 class BulkDeleteModelMixin(BulkBase):
     __method_name__: ClassVar[str] = "bulk_delete"
 
     def __bootstrap__(cls, *args, **kwargs) -> None:
-        responses = {409: {"model": error_details.ConflictHttpErrorDetails, "content": {"application/json": {}}}}
+        responses = cls.get_bulk_responses()
         signature = inspect.signature(cls.bulk_delete)
         parameters = signature.parameters.copy()
         annotation = cls.__repository_cls__.__model__.__fields__["id"].annotation
@@ -281,10 +462,107 @@ class BulkDeleteModelMixin(BulkBase):
         )
         params = {
             "responses": responses,
-            "response_model": List[annotation],  # type: ignore[valid-type]
+            "response_model": List[Union[BulkItemError, annotation]],  # type: ignore[valid-type]
         }
         add_model_method_name(cast("Type[ModelController]", cls), params)
         cls.set_route(cls, "delete", cls.bulk_delete, **params)
 
     async def bulk_delete(self, bulk: List[Any]) -> Any:
-        return await self.repository.bulk_delete(bulk)
+        try:
+            return await self.bulk_executor.delete(self.repository, bulk)
+        except FuriousBulkError as e:
+            raise BadRequestHttpError(str(e)) from e
+        finally:
+            self.invalidate_caches()
+
+
+class StreamBulkBase(BulkBase, ABC):
+    """
+    Bulk endpoints which read the body (a json array, or ndjson when sent as `application/x-ndjson`) incrementally.
+
+    items are validated and forwarded to the repository by chunks (see `BulkExecutor`) while the body is received,
+    and the per item results are streamed back as ndjson followed by a `$meta` line,
+    so memory is bounded by `chunk_size * concurrency` items whatever the bulk size.
+    """
+
+    __bulk_stream_route__ = "bulk/stream"
+
+    @staticmethod
+    def get_bulk_stream_params(cls) -> Dict[str, Any]:  # noqa: ANN001
+        content = {StreamFormatEnum.NDJSON.media_type: {}, StreamFormatEnum.JSON.media_type: {}}
+        params = {
+            "path": f"/{cls.__bulk_stream_route__}",
+            "response_class": StreamingResponse,
+            "responses": {
+                200: {
+                    "content": {StreamFormatEnum.NDJSON.media_type: {}},
+                    "description": "one result per item followed by a `$meta` line",
+                }
+            },
+            "openapi_extra": {"requestBody": {"content": content, "required": True}},
+        }
+        add_model_method_name(cast("Type[ModelController]", cls), params)
+        return params
+
+    def stream_bulk(
+        self,
+        request: Request,
+        parse: Callable[[Any], Any],
+        operation: Callable[[List[Any]], Awaitable[List[Any]]],
+    ) -> StreamingResponse:
+        format_ = (
+            StreamFormatEnum.NDJSON
+            if StreamFormatEnum.NDJSON.media_type in request.headers.get("content-type", "")
+            else StreamFormatEnum.JSON
+        )
+
+        async def write(bulk: List[Any]) -> List[Any]:
+            try:
+                return await operation(bulk)
+            finally:
+                self.invalidate_caches()
+
+        results = self.bulk_executor.stream(
+            iter_items(request.stream(), format_), parse, write, self.repository.bulk_concurrency
+        )
+        return RequestStreamingResponse(stream_bulk_results(results), media_type=StreamFormatEnum.NDJSON.media_type)
+
+
+class StreamBulkCreateModelMixin(StreamBulkBase):
+    create_model: ClassVar[Optional[Type[BaseModel]]] = None
+    __method_name__: ClassVar[str] = "bulk_create_stream"
+
+    def __bootstrap__(cls, *args, **kwargs) -> None:
+        cls.set_route(cls, "post", cls.bulk_create_stream, **cls.get_bulk_stream_params(cls))
+
+    async def bulk_create_stream(self, request: Request) -> StreamingResponse:
+        model = self.create_model or self.__repository_cls__.__model__
+
+        async def create(bulk: List[Any]) -> List[Any]:
+            result = await self.repository.bulk_create(bulk)
+            return (result.to_model() if isinstance(result, BulkResultBuilder) else result).items
+
+        return self.stream_bulk(request, model.parse_obj, create)
+
+
+class StreamBulkUpdateModelMixin(StreamBulkBase):
+    update_model: ClassVar[Optional[Type[BaseModel]]] = None
+    __method_name__: ClassVar[str] = "bulk_update_stream"
+
+    def __bootstrap__(cls, *args, **kwargs) -> None:
+        cls.set_route(cls, "put", cls.bulk_update_stream, **cls.get_bulk_stream_params(cls))
+
+    async def bulk_update_stream(self, request: Request) -> StreamingResponse:
+        model = self.update_model or self.__repository_cls__.__model__
+        return self.stream_bulk(request, model.parse_obj, self.repository.bulk_update)
+
+
+class StreamBulkDeleteModelMixin(StreamBulkBase):
+    __method_name__: ClassVar[str] = "bulk_delete_stream"
+
+    def __bootstrap__(cls, *args, **kwargs) -> None:
+        cls.set_route(cls, "delete", cls.bulk_delete_stream, **cls.get_bulk_stream_params(cls))
+
+    async def bulk_delete_stream(self, request: Request) -> StreamingResponse:
+        annotation = self.__repository_cls__.__model__.__fields__["id"].annotation
+        return self.stream_bulk(request, partial(parse_obj_as, annotation), self.repository.bulk_delete)
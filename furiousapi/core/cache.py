@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar, Union
+
+from furiousapi.utils import NOT_SET, NotSet
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    #: entries dropped because the cache was full
+    evictions: int = 0
+    #: entries dropped because their ttl passed
+    expirations: int = 0
+    #: entries removed explicitly
+    invalidations: int = 0
+    size: int = field(default=0)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[TKey, TValue]):
+    """
+    A thread safe, in-process LRU cache with an optional time to live.
+
+    expired entries are dropped lazily, when looked up or when they reach the LRU end.
+    `on_evict` is called with every dropped entry, including a value replaced by `set`.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Optional[Callable[[TKey, TValue], None]] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._on_evict = on_evict
+        self._data: "OrderedDict[TKey, Tuple[TValue, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            self._stats.size = len(self._data)
+            return CacheStats(**self._stats.__dict__)
+
+    def get(self, key: TKey) -> Union[TValue, NotSet]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return NOT_SET
+            value, expires_at = entry
+            if expires_at < self._clock():
+                self._remove(key, value)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return NOT_SET
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: TKey, value: TValue, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] is not value:
+                self._remove(key, entry[0])
+                if entry[1] < self._clock():
+                    self._stats.expirations += 1
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                old_key, (old_value, old_expires_at) = next(iter(self._data.items()))
+                self._remove(old_key, old_value)
+                if old_expires_at < self._clock():
+                    self._stats.expirations += 1
+                else:
+                    self._stats.evictions += 1
+
+    def pop(self, key: TKey) -> Union[TValue, NotSet]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return NOT_SET
+            self._remove(key, entry[0])
+            self._stats.invalidations += 1
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            for key, (value, _) in list(self._data.items()):
+                self._remove(key, value)
+
+    def _remove(self, key: TKey, value: TValue) -> None:
+        del self._data[key]
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def __contains__(self, key: TKey) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[1] >= self._clock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[TKey]:
+        return iter(list(self._data))
@@ -47,10 +47,37 @@ class BaseConnectionSettings(GenericModel, Generic[TConnectionString, TConnectio
 class PaginationSettings(BaseSettings):
     default_size: int = 10
     max_size: int = 50
+    count_cache_ttl: float = 30.0
+    count_cache_max_size: int = 1024
+    prefetch_ttl: float = 5.0
+    prefetch_max_size: int = 128
+    offset_anchor_interval: int = 500
+    offset_anchor_max_queries: int = 128
+    offset_anchor_max_anchors: int = 2048
+
+
+class CacheSettings(BaseSettings):
+    subset_models_max_size: int = 512
+    entities_max_size: int = 10_000
+    entities_ttl: Optional[float] = 60.0
+
+
+class BulkSettings(BaseSettings):
+    max_size: int = 10_000
+    chunk_size: int = 500
+    #: chunks run at a time on a repository, see `BaseRepository.bulk_concurrency`
+    concurrency: int = 1
+
+
+class ControllerSettings(BaseSettings):
+    lazy_bootstrap: bool = False
 
 
 class Settings(BaseSettings):
     pagination: PaginationSettings = Field(default_factory=PaginationSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    bulk: BulkSettings = Field(default_factory=BulkSettings)
+    controllers: ControllerSettings = Field(default_factory=ControllerSettings)
 
     class Config:
         env_nested_delimiter = "__"
@@ -0,0 +1,77 @@
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from furiousapi.core.cache import CacheStats, LRUCache
+from furiousapi.core.config import get_settings
+from furiousapi.utils import NOT_SET
+
+from .counting import filter_key
+
+
+class KeysetAnchors:
+    """
+    Keyset anchors of offset pagination, to serve deep offset pages by seeking instead of skipping.
+
+    an anchor is the sort key (keyset cursor) of the entity right before every `interval`-th offset of a query
+    (sorting and filter). a repository answers an offset page by seeking after the `nearest` anchor
+    and skipping only the remaining entities, adding the anchors it passes while skipping,
+    so a query is anchored progressively as clients page deeper.
+
+    anchors are positional, a repository must `clear` them whenever entities are written.
+    at most `max_queries` queries (least recently used first) and `max_anchors` anchors per query are kept,
+    the defaults are taken from `Settings.pagination`.
+    """
+
+    def __init__(
+        self, interval: Optional[int] = None, max_queries: Optional[int] = None, max_anchors: Optional[int] = None
+    ) -> None:
+        settings = get_settings().pagination
+        self.interval = interval or settings.offset_anchor_interval
+        self.max_anchors = max_anchors or settings.offset_anchor_max_anchors
+        # the anchors of a query are contiguous, the i-th anchor is the one of offset (i + 1) * interval
+        self._anchors: LRUCache[Hashable, List[Any]] = LRUCache(max_queries or settings.offset_anchor_max_queries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._anchors.stats
+
+    @staticmethod
+    def query(sorting: Sequence[Hashable], filtering: Optional[BaseModel] = None) -> Hashable:
+        """
+        The key of the anchors of a sorting and filter.
+        """
+        return tuple(sorting), filter_key(filtering)
+
+    def nearest(self, query: Hashable, offset: int) -> Tuple[int, Optional[Any]]:
+        """
+        The closest anchored offset at or before `offset` and its anchor, ``(0, None)`` when there is none.
+        """
+        anchors = self._anchors.get(query)
+        if anchors is NOT_SET or offset < self.interval:
+            return 0, None
+        count = min(offset // self.interval, len(anchors))
+        if not count:
+            return 0, None
+        return count * self.interval, anchors[count - 1]
+
+    def add(self, query: Hashable, offset: int, anchor: Any) -> bool:
+        """
+        Anchor `offset`, the sort key of the entity at ``offset - 1``, only the anchor following the last one is kept.
+        """
+        if offset % self.interval:
+            return False
+        anchors = self._anchors.get(query)
+        if anchors is NOT_SET:
+            anchors = []
+            self._anchors.set(query, anchors)
+        if offset != (len(anchors) + 1) * self.interval or len(anchors) >= self.max_anchors:
+            return False
+        anchors.append(anchor)
+        return True
+
+    def clear(self) -> None:
+        self._anchors.clear()
+
+    def __len__(self) -> int:
+        return len(self._anchors)
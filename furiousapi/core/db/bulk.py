@@ -0,0 +1,281 @@
+import asyncio
+import itertools
+import logging
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from furiousapi.core.config import get_settings
+from furiousapi.core.exceptions import FuriousError
+from furiousapi.core.responses import BulkItemError, BulkResponseModel, BulkResultBuilder
+
+from .exceptions import BulkDuplicateItemError, BulkTooLargeError
+from .repository import identifiers_key
+
+if TYPE_CHECKING:
+    from .repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+TResult = TypeVar("TResult")
+
+#: the per item message of a chunk which failed unexpectedly, the error itself is only logged
+CHUNK_FAILED_MESSAGE = "the bulk operation failed for this item"
+
+
+def bulk_item_id(item: Any) -> Any:
+    """
+    The id of a bulk item, an entity (or its unparsed mapping) or (for `bulk_delete`) the id itself,
+    `None` for new entities.
+    """
+    if isinstance(item, BaseModel):
+        return getattr(item, "id", None)
+    if isinstance(item, Mapping):
+        return item.get("id")
+    return item
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+async def achunked(items: AsyncIterable[T], size: int) -> AsyncIterator[List[T]]:
+    chunk: List[T] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _aiter(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+class BulkExecutor:
+    """
+    Runs a bulk operation as chunks of `chunk_size` items, at most `concurrency` chunks at a time.
+
+    a repository usually wraps a single session or connection, so chunks run one at a time by default,
+    repositories which are safe for concurrent use opt in with `BaseRepository.bulk_concurrency`.
+
+    results are merged in the order of the bulk, bulks larger than `max_size` are rejected
+    with `BulkTooLargeError`, and bulks with an id more than once with `BulkDuplicateItemError`
+    since the chunks run concurrently and the order of their writes is undefined.
+    the defaults are taken from `Settings.bulk`.
+
+    a chunk failing with an unexpected error is reported (and logged) as an error for each of its items,
+    the other chunks run as usual. a `FuriousError` (e.g. `EntityAlreadyExistsError`, or an HTTP error)
+    is raised as is, so it maps to its usual response. bulks are not atomic, the chunks which completed
+    before such an error stay written and the in-flight ones are cancelled.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
+        settings = get_settings().bulk
+        self.chunk_size = chunk_size or settings.chunk_size
+        self.concurrency = concurrency or settings.concurrency
+        self.max_size = max_size or settings.max_size
+        if self.chunk_size < 1 or self.concurrency < 1:
+            raise ValueError("chunk_size and concurrency must be positive integers")
+
+    def validate(self, bulk: Sequence[Any]) -> None:
+        if len(bulk) > self.max_size:
+            raise BulkTooLargeError(len(bulk), self.max_size)
+        seen: Set[Hashable] = set()
+        for item in bulk:
+            id_ = bulk_item_id(item)
+            if id_ is None:
+                continue
+            key = identifiers_key(id_)
+            if key in seen:
+                raise BulkDuplicateItemError(id_)
+            seen.add(key)
+
+    async def limit(self, items: AsyncIterable[T]) -> AsyncIterator[T]:
+        """
+        `validate` for bulks whose size is only known once consumed, raises when item `max_size + 1` is reached.
+        """
+        count = 0
+        async for item in items:
+            count += 1
+            if count > self.max_size:
+                raise BulkTooLargeError(count, self.max_size)
+            yield item
+
+    async def iter_chunks(
+        self,
+        bulk: Union[Iterable[T], AsyncIterable[T]],
+        operation: Callable[[List[T]], Awaitable[TResult]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[TResult]:
+        """
+        Yield the result of `operation` for every chunk, in order.
+
+        a chunk starts once a slot is free, so at most `concurrency` (the executor one by default) chunks are in-flight
+        (and held in memory) at a time, the pending chunks are cancelled when an operation fails
+        or when the iteration stops. an async `bulk` is consumed lazily, chunk by chunk,
+        when it fails (e.g. an invalid body) the results of the chunks already started are yielded before the error.
+        """
+        chunks = (
+            achunked(bulk, self.chunk_size)
+            if isinstance(bulk, AsyncIterable)
+            else _aiter(chunked(bulk, self.chunk_size))
+        ).__aiter__()
+        concurrency = concurrency or self.concurrency
+        in_flight: Deque["asyncio.Future[TResult]"] = deque()
+        try:
+            while True:
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    break
+                except Exception:
+                    # the started chunks may be written, they are reported
+                    while in_flight:
+                        yield await in_flight.popleft()
+                    raise
+                in_flight.append(asyncio.ensure_future(operation(chunk)))
+                if len(in_flight) >= concurrency:
+                    yield await in_flight.popleft()
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    async def stream(
+        self,
+        items: AsyncIterable[Any],
+        parse: Callable[[Any], T],
+        operation: Callable[[List[T]], Awaitable[List[Any]]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Yield the per item results of a bulk received as a stream, chunk by chunk and in order.
+
+        items which `parse` rejects, or whose id was already received, are reported as `BulkItemError`
+        without reaching `operation`, failed chunks are handled as by the other operations.
+        """
+        operation = self._reporting("stream", operation, _failed_items)
+        seen: Set[Hashable] = set()
+
+        async def run_chunk(chunk: List[Any]) -> List[Any]:
+            results: List[Any] = [None] * len(chunk)
+            parsed: List[T] = []
+            positions: List[int] = []
+            for position, raw in enumerate(chunk):
+                try:
+                    item = parse(raw)
+                except (ValueError, TypeError) as e:
+                    results[position] = BulkItemError(message=str(e))
+                    continue
+                id_ = bulk_item_id(item)
+                if id_ is not None:
+                    key = identifiers_key(id_)
+                    if key in seen:
+                        results[position] = BulkItemError(message=str(BulkDuplicateItemError(id_)))
+                        continue
+                    seen.add(key)
+                parsed.append(item)
+                positions.append(position)
+
+            if parsed:
+                done = await operation(parsed)
+                for position, result in zip(positions, done):
+                    results[position] = result
+            return results
+
+        async for results in self.iter_chunks(self.limit(items), run_chunk, concurrency):
+            yield results
+
+    async def map_chunks(
+        self,
+        bulk: Sequence[T],
+        operation: Callable[[List[T]], Awaitable[TResult]],
+        concurrency: Optional[int] = None,
+    ) -> List[TResult]:
+        self.validate(bulk)
+        return [result async for result in self.iter_chunks(bulk, operation, concurrency)]
+
+    async def create(self, repository: "BaseRepository", bulk: Sequence[Any]) -> BulkResultBuilder:
+        """
+        `repository.bulk_create` by chunks.
+        """
+
+        def failed(chunk: List[Any]) -> BulkResultBuilder:
+            builder = BulkResultBuilder()
+            builder.add_error(CHUNK_FAILED_MESSAGE, len(chunk))
+            return builder
+
+        builder = BulkResultBuilder()
+        results: List[Union[BulkResponseModel, BulkResultBuilder]] = await self.map_chunks(
+            bulk, self._reporting("create", repository.bulk_create, failed), repository.bulk_concurrency
+        )
+        for result in results:
+            builder.extend(result)
+        return builder
+
+    async def update(self, repository: "BaseRepository", bulk: Sequence[Any]) -> List:
+        results = await self.map_chunks(
+            bulk, self._reporting("update", repository.bulk_update, _failed_items), repository.bulk_concurrency
+        )
+        return [item for result in results for item in result]
+
+    async def delete(self, repository: "BaseRepository", bulk: Sequence[Any]) -> List:
+        results = await self.map_chunks(
+            bulk, self._reporting("delete", repository.bulk_delete, _failed_items), repository.bulk_concurrency
+        )
+        return [item for result in results for item in result]
+
+    @staticmethod
+    def _reporting(
+        name: str, operation: Callable[[List[T]], Awaitable[TResult]], failed: Callable[[List[T]], TResult]
+    ) -> Callable[[List[T]], Awaitable[TResult]]:
+        """
+        Report a chunk failing with an unexpected error with `failed`, without exposing the error.
+        """
+
+        async def run(chunk: List[T]) -> TResult:
+            try:
+                return await operation(chunk)
+            except FuriousError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("bulk %s chunk of %d items failed", name, len(chunk), exc_info=True)
+                return failed(chunk)
+
+        return run
+
+
+def _failed_items(chunk: List[Any]) -> List[Any]:
+    return [BulkItemError(message=CHUNK_FAILED_MESSAGE)] * len(chunk)
@@ -0,0 +1,183 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from furiousapi.core.cache import CacheStats, LRUCache
+from furiousapi.core.config import get_settings
+from furiousapi.core.types import TEntity
+from furiousapi.utils import NOT_SET, NotSet
+
+from .repository import BaseRepository, RepositoryWrapper, fields_key, identifiers_key, reusable_fields
+
+if TYPE_CHECKING:
+    from enum import Enum
+
+#: (identity, projection)
+CacheKey = Tuple[Hashable, Hashable]
+IdentityFunc = Callable[[Any], Hashable]
+
+
+def default_identity(entity: Any) -> Hashable:
+    """
+    The identity of an entity, or of the identifiers of `get` (e.g. ``"1"``, ``{"id": "1"}`` or ``("1",)``).
+
+    the entity `id` by default, identifiers with a single value (a one key dict or a one item tuple)
+    are identified by that value so they match the entity they identify.
+    """
+    identifiers = getattr(entity, "id", entity)
+    if isinstance(identifiers, dict) and len(identifiers) == 1:
+        identifiers = next(iter(identifiers.values()))
+    elif isinstance(identifiers, (tuple, list)) and len(identifiers) == 1:
+        identifiers = identifiers[0]
+    return identifiers_key(identifiers)
+
+
+class CacheBackend(ABC):
+    """
+    The storage of a `CachingRepository`.
+
+    entries are indexed by identity, so all the projections of an entity are invalidated together,
+    the interface is async so a shared (out of process) cache can implement it.
+    """
+
+    @abstractmethod
+    async def get(self, key: CacheKey) -> Union[Any, NotSet]: ...
+
+    @abstractmethod
+    async def set(self, key: CacheKey, value: Any) -> None: ...
+
+    @abstractmethod
+    async def invalidate(self, identities: Iterable[Hashable]) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats: ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: Optional[int] = None, ttl: Union[float, None, NotSet] = NOT_SET) -> None:
+        settings = get_settings().cache
+        self._cache: LRUCache[CacheKey, Any] = LRUCache(
+            max_size or settings.entities_max_size,
+            settings.entities_ttl if isinstance(ttl, NotSet) else ttl,
+            on_evict=self._on_evict,
+        )
+        self._keys: Dict[Hashable, Set[CacheKey]] = defaultdict(set)
+
+    def _on_evict(self, key: CacheKey, _: Any) -> None:
+        keys = self._keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[key[0]]
+
+    async def get(self, key: CacheKey) -> Union[Any, NotSet]:
+        return self._cache.get(key)
+
+    async def set(self, key: CacheKey, value: Any) -> None:
+        self._cache.set(key, value)
+        self._keys[key[0]].add(key)
+
+    async def invalidate(self, identities: Iterable[Hashable]) -> None:
+        for identity in identities:
+            for key in list(self._keys.get(identity, ())):
+                self._cache.pop(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+
+class CachingRepository(RepositoryWrapper[TEntity]):
+    """
+    A read-through cache of `get`, keyed by the `identity` of the identifiers and the fields projection.
+
+    writes made through the repository invalidate every cached projection of the written entities,
+    writes made elsewhere are only picked up when the entries expire (`ttl`).
+    missing entities are not cached, cached entities are shared, so callers must not mutate them.
+
+    usage:
+        repository = CachingRepository(MyRepository(), InMemoryCacheBackend(max_size=1000, ttl=30))
+    """
+
+    def __init__(
+        self,
+        repository: BaseRepository[TEntity],
+        backend: Optional[CacheBackend] = None,
+        *,
+        identity: IdentityFunc = default_identity,
+    ) -> None:
+        super().__init__(repository)
+        self.backend = backend or InMemoryCacheBackend()
+        self.identity = identity
+        # bumped by every write, a `get` which raced with a write does not store its (maybe stale) result
+        self._writes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.backend.stats
+
+    async def get(
+        self,
+        identifiers: Union[int, str, Dict[str, Any], tuple],
+        fields: Optional[Iterable["Enum"]] = None,
+        *,
+        should_error: bool = True,
+    ) -> Optional[TEntity]:
+        fields = reusable_fields(fields)
+        key = self.identity(identifiers), fields_key(fields)
+        cached = await self.backend.get(key)
+        if not isinstance(cached, NotSet):
+            return cached
+
+        writes = self._writes
+        entity = await self.repository.get(identifiers, fields, should_error=should_error)
+        if entity is not None and writes == self._writes:
+            await self.backend.set(key, entity)
+        return entity
+
+    async def invalidate(self, *entities: Any) -> None:
+        self._writes += 1
+        await self.backend.invalidate([self.identity(entity) for entity in entities])
+
+    async def update(self, entity: TEntity, **kwargs) -> Optional[TEntity]:
+        try:
+            return await self.repository.update(entity, **kwargs)
+        finally:
+            await self.invalidate(entity)
+
+    async def delete(self, entity: Union[TEntity, str, int], **kwargs) -> None:
+        try:
+            return await self.repository.delete(entity, **kwargs)
+        finally:
+            await self.invalidate(entity)
+
+    async def bulk_delete(self, bulk: List[Union[TEntity, Any]]) -> List:
+        try:
+            return await self.repository.bulk_delete(bulk)
+        finally:
+            await self.invalidate(*bulk)
+
+    async def bulk_update(self, bulk: List[TEntity]) -> List:
+        try:
+            return await self.repository.bulk_update(bulk)
+        finally:
+            await self.invalidate(*bulk)
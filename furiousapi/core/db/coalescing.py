@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Union,
+)
+
+from furiousapi.core.types import TEntity
+
+from .repository import BaseRepository, RepositoryWrapper, fields_key, identifiers_key
+
+if TYPE_CHECKING:
+    from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+GetKeyFunc = Callable[[Union[int, str, Dict[str, Any], tuple], Optional[Iterable[Any]], bool], Hashable]
+
+
+def default_get_key(
+    identifiers: Union[int, str, Dict[str, Any], tuple],
+    fields: Optional[Iterable[Any]],
+    should_error: bool,  # noqa: FBT001
+) -> Hashable:
+    return identifiers_key(identifiers), fields_key(fields), should_error
+
+
+@dataclass
+class CoalescingStats:
+    #: number of `get` calls
+    calls: int = 0
+    #: number of `get` calls which awaited an already in-flight call instead of querying the repository
+    coalesced: int = 0
+    #: number of distinct calls currently in-flight
+    in_flight: int = 0
+
+    @property
+    def coalesced_ratio(self) -> float:
+        return self.coalesced / self.calls if self.calls else 0.0
+
+
+class CoalescingRepository(RepositoryWrapper[TEntity]):
+    """
+    Deduplicates concurrent identical `get` calls (single-flight).
+
+    while a `get(identifiers, fields)` is in-flight, identical calls await its result instead of querying
+    the wrapped repository again, the result (or error) is shared by all callers,
+    so callers must not mutate the returned entity.
+
+    usage:
+        repository = CoalescingRepository(MyRepository())
+
+        def repository_dependency() -> MyRepository:
+            return repository
+    """
+
+    def __init__(
+        self,
+        repository: BaseRepository[TEntity],
+        *,
+        enabled: bool = True,
+        key: GetKeyFunc = default_get_key,
+    ) -> None:
+        super().__init__(repository)
+        self.enabled = enabled
+        self.key = key
+        self.stats = CoalescingStats()
+        self._in_flight: Dict[Hashable, "asyncio.Future[Optional[TEntity]]"] = {}
+
+    async def get(
+        self,
+        identifiers: Union[int, str, Dict[str, Any], tuple],
+        fields: Optional[Iterable["Enum"]] = None,
+        *,
+        should_error: bool = True,
+    ) -> Optional[TEntity]:
+        if not self.enabled:
+            return await self.repository.get(identifiers, fields, should_error=should_error)
+
+        key = self.key(identifiers, fields, should_error)
+        self.stats.calls += 1
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.repository.get(identifiers, fields, should_error=should_error))
+            self._in_flight[key] = future
+            self.stats.in_flight += 1
+            future.add_done_callback(lambda _: self._done(key))
+        else:
+            self.stats.coalesced += 1
+
+        # shield the shared call, a cancelled caller must not cancel the call for everyone else
+        return await asyncio.shield(future)
+
+    def _done(self, key: Hashable) -> None:
+        self._in_flight.pop(key, None)
+        self.stats.in_flight -= 1
@@ -0,0 +1,133 @@
+import logging
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+from furiousapi.core.cache import CacheStats, LRUCache
+from furiousapi.core.config import get_settings
+from furiousapi.utils import NOT_SET
+
+if TYPE_CHECKING:
+    from .repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CountModeEnum(str, Enum):
+    """
+    How the `total` of a list page is computed.
+
+    exact: count the matching entities for every page
+    cached: an exact count, reused for the same repository and filter until it expires
+    estimated: the repository estimate (e.g. collection statistics), an exact cached count if it has none
+    none: no total
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class Count(NamedTuple):
+    total: Optional[int]
+    #: whether `total` may be off, `None` when there is no total
+    estimated: Optional[bool]
+
+
+NO_COUNT = Count(None, None)
+
+
+def filter_key(filtering: Optional[BaseModel]) -> Hashable:
+    """
+    A hashable key of the set fields of a filter, the defaults of the filter model are ignored as by the repositories.
+    """
+    if filtering is None:
+        return ()
+    values = ((name, getattr(filtering, name)) for name in filtering.__fields_set__)
+    return tuple(sorted((name, repr(value)) for name, value in values if value is not None))
+
+
+def repository_key(repository: "BaseRepository") -> Hashable:
+    """
+    The key of the results cached for a repository, its class and its `BaseRepository.cache_scope`.
+    """
+    return type(repository), repository.cache_scope()
+
+
+class CountingStrategy:
+    """
+    Computes the total of list pages with `BaseRepository.count` and `BaseRepository.estimate_count`.
+
+    cached counts are kept per repository (see `repository_key`) and filter for `ttl` seconds,
+    a total served from the cache is reported as estimated since entities may have changed since.
+    writes should `invalidate` the counts of the repository, as the write endpoints do.
+    the defaults are taken from `Settings.pagination`.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        settings = get_settings().pagination
+        self._counts: LRUCache[Tuple[Hashable, Hashable], int] = LRUCache(
+            max_size or settings.count_cache_max_size, ttl or settings.count_cache_ttl, clock=clock
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._counts.stats
+
+    async def count(
+        self, repository: "BaseRepository", filtering: Optional[Any], mode: CountModeEnum = CountModeEnum.EXACT
+    ) -> Count:
+        """
+        The total of `filtering` in `mode`, `NO_COUNT` for `CountModeEnum.NONE` or when the repository can't count.
+        """
+        if mode == CountModeEnum.EXACT:
+            return self._exact(repository, await repository.count(filtering))
+        if mode == CountModeEnum.ESTIMATED:
+            estimate = await repository.estimate_count(filtering)
+            if estimate is not None:
+                return Count(estimate, estimated=True)
+            return await self._cached(repository, filtering)
+        if mode == CountModeEnum.CACHED:
+            return await self._cached(repository, filtering)
+        return NO_COUNT
+
+    def invalidate(self, repository: "BaseRepository", filtering: Optional[Any] = None) -> None:
+        """
+        Drop the cached counts of a repository, only the count of `filtering` when given.
+        """
+        key = repository_key(repository)
+        if filtering is not None:
+            self._counts.pop((key, filter_key(filtering)))
+            return
+        for cached in self._counts:
+            if cached[0] == key:
+                self._counts.pop(cached)
+
+    def clear(self) -> None:
+        self._counts.clear()
+
+    async def _cached(self, repository: "BaseRepository", filtering: Optional[Any]) -> Count:
+        key = repository_key(repository), filter_key(filtering)
+        total = self._counts.get(key)
+        if total is not NOT_SET:
+            return Count(total, estimated=True)
+        total = await repository.count(filtering)
+        if total is not None:
+            self._counts.set(key, total)
+        return self._exact(repository, total)
+
+    @staticmethod
+    def _exact(repository: "BaseRepository", total: Optional[int]) -> Count:
+        if total is None:
+            logger.debug("%s does not support counting", type(repository).__name__)
+            return NO_COUNT
+        return Count(total, estimated=False)
@@ -0,0 +1,345 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Union
+
+from furiousapi.core.exceptions import InvalidCursorError
+
+from .models import json_dumps, json_loads
+
+try:
+    from bson import ObjectId
+except ImportError:  # pragma: no cover
+    ObjectId = None
+
+EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
+_DOUBLE = struct.Struct(">d")
+_INT64 = struct.Struct(">q")
+_URLSAFE = bytes.maketrans(b"+/", b"-_")
+
+
+class CursorCodec(ABC):
+    """
+    Converts the tuple of sort values of an item into an opaque cursor string and back.
+
+    ``dumps``/``loads`` work with raw bytes so codecs can be wrapped (e.g. signed),
+    ``encode``/``decode`` add the text transport encoding.
+    """
+
+    @abstractmethod
+    def dumps(self, values: Sequence[Any]) -> bytes: ...
+
+    @abstractmethod
+    def loads(self, data: bytes) -> List[Any]: ...
+
+    def encode(self, values: Sequence[Any]) -> str:
+        return self.encode_bytes(self.dumps(values))
+
+    def decode(self, cursor: str) -> List[Any]:
+        return self.loads(self.decode_bytes(cursor))
+
+    def encode_many(self, values: Iterable[Sequence[Any]]) -> List[str]:
+        dumps = self.dumps
+        encode_bytes = self.encode_bytes
+        return [encode_bytes(dumps(value)) for value in values]
+
+    @staticmethod
+    def encode_bytes(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).translate(_URLSAFE).rstrip(b"=").decode("ascii")
+
+    @staticmethod
+    def decode_bytes(cursor: str) -> bytes:
+        try:
+            encoded = cursor.encode("ascii")
+            return base64.urlsafe_b64decode(encoded + (-len(encoded) % 4) * b"=")
+        except (UnicodeEncodeError, binascii.Error, ValueError) as e:
+            raise InvalidCursorError("invalid_cursor.encoding") from e
+
+
+class JSONCursorCodec(CursorCodec):
+    """
+    The original cursor format: JSON encoded values joined by a delimiter and base64 encoded.
+
+    kept for backward compatibility with cursors already handed out to clients,
+    note that values containing the delimiter can not be decoded.
+    """
+
+    def __init__(
+        self,
+        dumps: Callable[..., str] = json_dumps,
+        loads: Callable[..., Any] = json_loads,
+        delimiter: str = "$$",
+    ) -> None:
+        self._dumps = dumps
+        self._loads = loads
+        self.delimiter = delimiter
+
+    def dumps(self, values: Sequence[Any]) -> bytes:
+        return self.delimiter.join(str(self._dumps(value, default=str)) for value in values).encode()
+
+    def loads(self, data: bytes) -> List[Any]:
+        try:
+            return [self._loads(value) for value in data.decode().split(self.delimiter)]
+        except ValueError as e:
+            raise InvalidCursorError("invalid_cursor.value") from e
+
+    @staticmethod
+    def encode_bytes(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+    @staticmethod
+    def decode_bytes(cursor: str) -> bytes:
+        try:
+            encoded = cursor.encode()
+            encoded += (3 - ((len(encoded) + 3) % 4)) * b"="  # Add back padding.
+            return base64.b64decode(encoded)
+        except (binascii.Error, ValueError) as e:
+            raise InvalidCursorError("invalid_cursor.encoding") from e
+
+
+# binary cursor value tags
+TAG_NONE = 0x00
+TAG_FALSE = 0x01
+TAG_TRUE = 0x02
+TAG_INT = 0x03
+TAG_FLOAT = 0x04
+TAG_STR = 0x05
+TAG_BYTES = 0x06
+TAG_UUID = 0x07
+TAG_OBJECT_ID = 0x08
+TAG_DATETIME = 0x09
+TAG_DATETIME_TZ = 0x0A
+TAG_DATE = 0x0B
+TAG_DECIMAL = 0x0C
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Append a zigzag encoded varint, so small negative numbers stay small as well.
+    """
+    value = value * 2 if value >= 0 else -value * 2 - 1
+    while value > 0x7F:  # noqa: PLR2004
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+        shift += 7
+    return (result >> 1) ^ -(result & 1), offset
+
+
+def _micros(delta: timedelta) -> int:
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _take(data: bytes, offset: int, size: int) -> Tuple[bytes, int]:
+    raw = data[offset : offset + size]
+    if len(raw) != size:
+        raise ValueError("truncated value")
+    return raw, offset + size
+
+
+def _write_sized(buffer: bytearray, tag: int, value: bytes) -> None:
+    buffer.append(tag)
+    write_varint(buffer, len(value))
+    buffer += value
+
+
+class BinaryCursorCodec(CursorCodec):
+    """
+    A compact type tagged binary cursor format.
+
+    every value is written as a one byte tag followed by its payload,
+    integers use zigzag varints, datetimes are written as 64bit microseconds since the epoch
+    and UUIDs and ObjectIds are written as their raw bytes.
+    the result is URL safe base64 without padding.
+    """
+
+    version = 1
+
+    def dumps(self, values: Sequence[Any]) -> bytes:
+        buffer = bytearray((self.version,))
+        for value in values:
+            self._write(buffer, value)
+        return bytes(buffer)
+
+    def loads(self, data: bytes) -> List[Any]:
+        if not data or data[0] != self.version:
+            raise InvalidCursorError("invalid_cursor.version")
+        values = []
+        offset = 1
+        try:
+            while offset < len(data):
+                value, offset = self._read(data, offset)
+                values.append(value)
+        # out of range datetimes and dates overflow, malformed decimals raise `decimal.InvalidOperation`
+        except (IndexError, ValueError, ArithmeticError, struct.error) as e:
+            raise InvalidCursorError("invalid_cursor.value") from e
+        return values
+
+    def _write(self, buffer: bytearray, value: Any) -> None:  # noqa: C901, PLR0912
+        if isinstance(value, Enum):
+            value = value.value
+
+        if value is None:
+            buffer.append(TAG_NONE)
+        elif value is True:
+            buffer.append(TAG_TRUE)
+        elif value is False:
+            buffer.append(TAG_FALSE)
+        elif isinstance(value, int):
+            buffer.append(TAG_INT)
+            write_varint(buffer, value)
+        elif isinstance(value, str):
+            _write_sized(buffer, TAG_STR, value.encode())
+        elif isinstance(value, float):
+            buffer.append(TAG_FLOAT)
+            buffer += _DOUBLE.pack(value)
+        elif isinstance(value, uuid.UUID):
+            buffer.append(TAG_UUID)
+            buffer += value.bytes
+        elif ObjectId is not None and isinstance(value, ObjectId):
+            buffer.append(TAG_OBJECT_ID)
+            buffer += value.binary
+        elif isinstance(value, datetime):
+            offset = value.utcoffset()
+            if offset is None:
+                buffer.append(TAG_DATETIME)
+                buffer += _INT64.pack(_micros(value - EPOCH))
+            else:
+                buffer.append(TAG_DATETIME_TZ)
+                buffer += _INT64.pack(_micros(value.replace(tzinfo=None) - offset - EPOCH))
+                write_varint(buffer, int(offset.total_seconds()))
+        elif isinstance(value, date):
+            buffer.append(TAG_DATE)
+            write_varint(buffer, value.toordinal())
+        elif isinstance(value, (bytes, bytearray)):
+            _write_sized(buffer, TAG_BYTES, value)
+        elif isinstance(value, Decimal):
+            _write_sized(buffer, TAG_DECIMAL, str(value).encode())
+        else:
+            raise InvalidCursorError(f"invalid_cursor.unsupported_type: {type(value).__name__}")
+
+    @staticmethod
+    def _read(data: bytes, offset: int) -> Tuple[Any, int]:  # noqa: C901, PLR0911, PLR0912
+        tag = data[offset]
+        offset += 1
+        if tag == TAG_NONE:
+            return None, offset
+        if tag == TAG_TRUE:
+            return True, offset
+        if tag == TAG_FALSE:
+            return False, offset
+        if tag == TAG_INT:
+            return read_varint(data, offset)
+        if tag in (TAG_STR, TAG_BYTES, TAG_DECIMAL):
+            length, offset = read_varint(data, offset)
+            raw, offset = _take(data, offset, length)
+            if tag == TAG_STR:
+                return raw.decode(), offset
+            return (raw if tag == TAG_BYTES else Decimal(raw.decode())), offset
+        if tag == TAG_FLOAT:
+            return _DOUBLE.unpack_from(data, offset)[0], offset + _DOUBLE.size
+        if tag == TAG_UUID:
+            raw, offset = _take(data, offset, 16)
+            return uuid.UUID(bytes=raw), offset
+        if tag == TAG_OBJECT_ID:
+            if ObjectId is None:  # pragma: no cover
+                raise ValueError("bson is not installed")
+            raw, offset = _take(data, offset, 12)
+            return ObjectId(raw), offset
+        if tag == TAG_DATETIME:
+            return EPOCH + timedelta(microseconds=_INT64.unpack_from(data, offset)[0]), offset + _INT64.size
+        if tag == TAG_DATETIME_TZ:
+            micros = _INT64.unpack_from(data, offset)[0]
+            offset += _INT64.size
+            seconds, offset = read_varint(data, offset)
+            tz = timezone(timedelta(seconds=seconds))
+            return (EPOCH + timedelta(microseconds=micros, seconds=seconds)).replace(tzinfo=tz), offset
+        if tag == TAG_DATE:
+            ordinal, offset = read_varint(data, offset)
+            return date.fromordinal(ordinal), offset
+        raise ValueError(f"unknown tag {tag}")
+
+
+class CursorSigner:
+    """
+    Signs cursors with a keyed BLAKE2b MAC.
+
+    the signed envelope is ``version | fingerprint | payload | mac``, where the fingerprint identifies the
+    sort specification (and ``schema_version``) the cursor was rendered for.
+    forged, truncated, stale or cursors of a different sorting are rejected before the payload is decoded.
+    """
+
+    version = 1
+    fingerprint_size = 8
+
+    def __init__(self, secret: Union[str, bytes], *, schema_version: int = 0, mac_size: int = 16) -> None:
+        if not secret:
+            raise ValueError("secret must not be empty")
+        self._secret = secret.encode() if isinstance(secret, str) else secret
+        self.schema_version = schema_version
+        self.mac_size = mac_size
+
+    def fingerprint(self, scope: Iterable[Any]) -> bytes:
+        data = "\x00".join((str(self.schema_version), *(str(part) for part in scope))).encode()
+        return hashlib.blake2b(data, digest_size=self.fingerprint_size).digest()
+
+    def _mac(self, data: bytes) -> bytes:
+        return hashlib.blake2b(data, key=self._secret, digest_size=self.mac_size).digest()
+
+    def sign(self, payload: bytes, fingerprint: bytes) -> bytes:
+        data = bytes((self.version,)) + fingerprint + payload
+        return data + self._mac(data)
+
+    def verify(self, envelope: bytes, fingerprint: bytes) -> bytes:
+        header_size = 1 + self.fingerprint_size
+        if len(envelope) < header_size + self.mac_size:
+            raise InvalidCursorError("invalid_cursor.length")
+        if envelope[0] != self.version:
+            raise InvalidCursorError("invalid_cursor.version")
+        if not hmac.compare_digest(envelope[1:header_size], fingerprint):
+            raise InvalidCursorError("invalid_cursor.fingerprint")
+
+        data, mac = envelope[: -self.mac_size], envelope[-self.mac_size :]
+        if not hmac.compare_digest(self._mac(data), mac):
+            raise InvalidCursorError("invalid_cursor.signature")
+        return data[header_size:]
+
+
+class SignedCursorCodec(CursorCodec):
+    """
+    Wraps a codec, signing every cursor it renders and verifying every cursor it parses.
+    """
+
+    def __init__(self, codec: CursorCodec, signer: CursorSigner, fingerprint: bytes) -> None:
+        self.codec = codec
+        self.signer = signer
+        self.fingerprint = fingerprint
+
+    def encode_bytes(self, data: bytes) -> str:  # type: ignore[override]
+        return self.codec.encode_bytes(data)
+
+    def decode_bytes(self, cursor: str) -> bytes:  # type: ignore[override]
+        return self.codec.decode_bytes(cursor)
+
+    def dumps(self, values: Sequence[Any]) -> bytes:
+        return self.signer.sign(self.codec.dumps(values), self.fingerprint)
+
+    def loads(self, data: bytes) -> List[Any]:
+        return self.codec.loads(self.signer.verify(data, self.fingerprint))
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Any, Type
 
 from furiousapi.core.exceptions import FuriousError
 
@@ -22,3 +22,16 @@ class EntityAlreadyExistsError(FuriousEntityError):
 
 class FuriousBulkError(FuriousEntityError):
     pass
+
+
+class BulkTooLargeError(FuriousBulkError):
+    def __init__(self, size: int, max_size: int):
+        self.size = size
+        self.max_size = max_size
+        super().__init__(f"bulk of {size} items exceeds the maximum of {max_size} items")
+
+
+class BulkDuplicateItemError(FuriousBulkError):
+    def __init__(self, id_: Any):
+        self.id = id_
+        super().__init__(f"bulk contains item {id_} more than once")
@@ -1,6 +1,6 @@
 from enum import Enum, EnumMeta
 from types import DynamicClassAttribute
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
 
 import pydantic.errors
 
@@ -12,10 +12,69 @@ class GenerateByFieldEnum(str, Enum):
     VALUE = "value"
 
 
-# TODO: currently there are 2 bugs:
+class SortKey:
+    """
+    An immutable sort specification of a single field.
+
+    keys are interned per field and direction, so ``-MyEnum.field is -MyEnum.field``,
+    and they never mutate the shared enum member they refer to, which makes them safe to share between requests.
+    """
+
+    __slots__ = ("field", "direction")
+    field: "SortableFieldEnum"
+    direction: SortingDirection
+
+    def __new__(cls, field: "SortableFieldEnum", direction: Union[SortingDirection, str]) -> "SortKey":
+        # members of str enums compare equal to other enums members of the same value, so key by identity,
+        # the registry keeps the members alive so their ids are never reused
+        try:
+            return _SORT_KEYS[(id(field), direction)]
+        except KeyError:
+            pass
+        instance = super().__new__(cls)
+        object.__setattr__(instance, "field", field)
+        object.__setattr__(instance, "direction", SortingDirection(direction))
+        return _SORT_KEYS.setdefault((id(field), instance.direction), instance)
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, item: str) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return SortKey, (self.field, self.direction)
+
+    @property
+    def name(self) -> str:
+        return self.field.name
+
+    @property
+    def value(self) -> str:
+        return self.field.value
+
+    def __neg__(self) -> "SortKey":
+        return SortKey(self.field, SortingDirection.DESCENDING)
+
+    def __pos__(self) -> "SortKey":
+        return SortKey(self.field, SortingDirection.ASCENDING)
+
+    def __invert__(self) -> "SortKey":
+        return -self if self.direction == SortingDirection.ASCENDING else +self
+
+    def __repr__(self) -> str:
+        return f"<{self.name}: {self.direction.value}>"
+
+    def __str__(self) -> str:
+        return f"{self.name}:{self.direction.value}"
+
+
+_SORT_KEYS: Dict[Tuple[int, SortingDirection], SortKey] = {}
+
+
+# TODO: currently there is a bug:
 #  1. if we dont specify the operator the pagination runs forever
 #      for example: +MyModel.my_field or -MyModel.my_field or ~MyModel.my_field
-#  2. Enum members are singletons and may cause a bug with multi requests still need to check this
 class SortableFieldsEnumMeta(EnumMeta):
     __default__: SortingDirection
     __delimiter__: str
@@ -23,12 +82,17 @@ class SortableFieldsEnumMeta(EnumMeta):
     __examples_by__: GenerateByFieldEnum = GenerateByFieldEnum.NAME
 
     def __call__(cls, value: Any, names: Optional[List[str]] = None, **kwargs) -> Any:  # type: ignore[override]
-        if names is None:
-            field, _, direction = value.partition(cls.__delimiter__)
-            instance: SortableFieldEnum = super().__call__(field)
-            instance.__direction__ = direction and SortingDirection(direction) or cls.__default__
-            return instance
-        return super().__call__(value, names, **kwargs)
+        """
+        Parse ``"field"`` or ``"field:direction"`` into a `SortKey`, or create a new enum when `names` are passed.
+        """
+        if names is not None:
+            return super().__call__(value, names, **kwargs)
+        if isinstance(value, SortKey):
+            return value
+        if isinstance(value, cls):
+            return SortKey(value, cls.__default__)  # type: ignore[arg-type]
+        field, _, direction = value.partition(cls.__delimiter__)
+        return SortKey(super().__call__(field), direction or cls.__default__)
 
     def _generate_examples(cls, by_field: GenerateByFieldEnum = GenerateByFieldEnum.NAME) -> Dict[str, Dict[str, str]]:
         options: List[Any] = list(cls)
@@ -36,11 +100,11 @@ class SortableFieldsEnumMeta(EnumMeta):
         for i in range(min(len(options), cls.__examples_count__)):
             field_name = getattr(options[i], by_field.value)
             examples[str(-options[i])] = {
-                "summary": f"order by  {field_name} {(-options[i]).direction}",
+                "summary": f"order by  {field_name} {(-options[i]).direction.value}",
                 "value": str(-options[i]),
             }
             examples[str(+options[i])] = {
-                "summary": f"order by  {field_name} {(+options[i]).direction}",
+                "summary": f"order by  {field_name} {(+options[i]).direction.value}",
                 "value": str(+options[i]),
             }
         return examples
@@ -55,39 +119,36 @@ class SortableFieldEnum(str, Enum, metaclass=SortableFieldsEnumMeta):
     __examples_by__: GenerateByFieldEnum = GenerateByFieldEnum.NAME
     __default__ = SortingDirection.DESCENDING
     __delimiter__ = ":"
-    __direction__: SortingDirection = SortingDirection.DESCENDING
 
-    def __neg__(self) -> "SortableFieldEnum":
-        self.__direction__ = SortingDirection.DESCENDING
-        return self
+    def __neg__(self) -> SortKey:
+        return SortKey(self, SortingDirection.DESCENDING)
+
+    def __pos__(self) -> SortKey:
+        return SortKey(self, SortingDirection.ASCENDING)
 
-    def __pos__(self) -> "SortableFieldEnum":
-        self.__direction__ = SortingDirection.ASCENDING
-        return self
+    def __invert__(self) -> SortKey:
+        return ~SortKey(self, self.__default__)
 
-    def __invert__(self) -> "SortableFieldEnum":
-        if self.__direction__ == SortingDirection.ASCENDING:
-            self.__neg__()
-        else:
-            self.__pos__()
-        return self
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        # calling the enum class parses a sort key, so members are restored by name
+        return getattr, (self.__class__, self._name_)
 
     def __repr__(self) -> str:
-        return f"<{self.name}: {self.direction}>"
+        return f"<{self.name}: {self.direction.value}>"
 
     def __str__(self) -> str:
-        return f"{self.name}:{self.direction}"
+        return f"{self.name}:{self.direction.value}"
 
     @DynamicClassAttribute
     def direction(self) -> SortingDirection:
-        return self.__direction__
+        return self.__default__
 
     @classmethod
     def __get_validators__(cls) -> Any:
         yield cls.validate
 
     @classmethod
-    def validate(cls, value: str) -> "SortableFieldEnum":
+    def validate(cls, value: str) -> SortKey:
         field, _, direction = value.partition(":")
         possible_values = set(cls)
         if field not in possible_values:
@@ -0,0 +1,145 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from fastapi import Depends
+
+from furiousapi.core.types import TEntity
+
+from .exceptions import EntityNotFoundError
+from .repository import BaseRepository, fields_key, identifiers_key, reusable_fields
+
+if TYPE_CHECKING:
+    from enum import Enum
+
+Identifiers = Union[int, str, Dict[str, Any], tuple]
+
+
+class RepositoryLoader(Generic[TEntity]):
+    """
+    Batches the `get` calls issued in the same event loop tick into a single `get_many` call per projection.
+
+    results are memoized, so a loader should live for a single request, see `loader_dependency`.
+
+    usage:
+        loader = RepositoryLoader(self.repository)
+        authors = await asyncio.gather(*(loader.load(book.author_id) for book in books))
+    """
+
+    def __init__(self, repository: BaseRepository[TEntity], *, cache: bool = True) -> None:
+        self.repository = repository
+        self.cache = cache
+        self._results: Dict[Tuple[Hashable, Hashable], "asyncio.Future[Optional[TEntity]]"] = {}
+        self._pending: Dict[Hashable, Tuple[Optional[Iterable["Enum"]], Dict[Hashable, Tuple[Identifiers, Any]]]] = {}
+        self._scheduled = False
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def load(
+        self, identifiers: Identifiers, fields: Optional[Iterable["Enum"]] = None, *, should_error: bool = True
+    ) -> Optional[TEntity]:
+        entity = await self._future(identifiers, reusable_fields(fields))
+        if entity is None and should_error:
+            raise EntityNotFoundError(f"entity {identifiers} was not found")
+        return entity
+
+    async def load_many(
+        self, identifiers: Iterable[Identifiers], fields: Optional[Iterable["Enum"]] = None
+    ) -> List[Optional[TEntity]]:
+        fields = reusable_fields(fields)
+        return list(await asyncio.gather(*(self._future(i, fields) for i in identifiers)))
+
+    def prime(self, identifiers: Identifiers, entity: TEntity, fields: Optional[Iterable["Enum"]] = None) -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(entity)
+        self._results[identifiers_key(identifiers), fields_key(fields)] = future
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def _future(
+        self, identifiers: Identifiers, fields: Optional[Iterable["Enum"]]
+    ) -> "asyncio.Future[Optional[TEntity]]":
+        id_key, projection = identifiers_key(identifiers), fields_key(fields)
+        future = self._results.get((id_key, projection))
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self.cache:
+            self._results[id_key, projection] = future
+        _, batch = self._pending.setdefault(projection, (fields, {}))
+        if id_key in batch:
+            # not cached, chain on the already pending lookup
+            return batch[id_key][1]
+        batch[id_key] = (identifiers, future)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for fields, batch in pending.values():
+            task = asyncio.ensure_future(self._load_batch(fields, list(batch.values())))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self, fields: Optional[Iterable["Enum"]], batch: List[Tuple[Identifiers, "asyncio.Future[Optional[TEntity]]"]]
+    ) -> None:
+        try:
+            entities = await self.repository.get_many([identifiers for identifiers, _ in batch], fields)
+        except Exception as e:  # noqa: BLE001
+            self._fail(fields, batch, e)
+            return
+
+        if len(entities) != len(batch):
+            error = ValueError(f"get_many returned {len(entities)} results for {len(batch)} identifiers")
+            self._fail(fields, batch, error)
+            return
+        for (_, future), entity in zip(batch, entities):
+            if not future.done():
+                future.set_result(entity)
+
+    def _fail(
+        self,
+        fields: Optional[Iterable["Enum"]],
+        batch: List[Tuple[Identifiers, "asyncio.Future[Optional[TEntity]]"]],
+        error: Exception,
+    ) -> None:
+        # errors are not memoized, the next load retries
+        for identifiers, future in batch:
+            self._results.pop((identifiers_key(identifiers), fields_key(fields)), None)
+            if not future.done():
+                future.set_exception(error)
+
+
+def loader_dependency(
+    repository_dependency: Callable[..., BaseRepository[TEntity]],
+) -> Callable[..., RepositoryLoader[TEntity]]:
+    """
+    A FastAPI dependency of a per request `RepositoryLoader`
+
+    usage:
+        @action("/books/authors")
+        async def authors(self, loader: RepositoryLoader = Depends(loader_dependency(author_repository))): ...
+    """
+
+    def dependency(repository: BaseRepository[TEntity] = Depends(repository_dependency)) -> RepositoryLoader[TEntity]:
+        return RepositoryLoader(repository)
+
+    return dependency
@@ -0,0 +1,472 @@
+import bisect
+import functools
+import itertools
+import operator
+import uuid
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel
+
+from furiousapi.core.db import utils
+from furiousapi.core.exceptions import InvalidCursorError
+from furiousapi.core.fields import SortingDirection
+from furiousapi.core.pagination import AllPaginationStrategies, OffsetPaginationParams, PaginatedResponse
+from furiousapi.core.responses import BulkItemError, BulkResultBuilder
+from furiousapi.core.types import TEntity
+
+from .anchors import KeysetAnchors
+from .cursors import BinaryCursorCodec, CursorCodec
+from .exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from .fields import SortKey
+from .metaclasses import AllOptionalMeta, compiled_model_query
+from .pagination import BaseRelayPagination
+from .repository import BaseRepository, RepositoryConfig, identifiers_key
+
+Row = Tuple[Any, ...]
+Entry = Tuple[Any, ...]
+Predicate = Callable[[Row], bool]
+
+
+@functools.total_ordering
+class _Null:
+    """
+    Sorts before any other value, `None` is not orderable so it is indexed as `NULL`.
+    """
+
+    __slots__ = ()
+
+    def __lt__(self, other: Any) -> bool:
+        return other is not self
+
+    def __eq__(self, other: object) -> bool:
+        return other is self
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "NULL"
+
+
+NULL = _Null()
+
+
+class SortedIndex:
+    """
+    The entries (the values of `positions` of every row) of a repository, kept in ascending order.
+
+    the entries end with the id of the row, so they are unique and seeking a value is a bisection.
+    """
+
+    __slots__ = ("positions", "entries")
+
+    #: above this ratio of new entries to indexed entries `add_many` appends and sorts instead of inserting
+    REBUILD_RATIO: ClassVar[float] = 0.125
+
+    def __init__(self, positions: Sequence[int], rows: Iterable[Row] = ()) -> None:
+        self.positions = tuple(positions)
+        self.entries: List[Entry] = sorted(map(self.entry, rows))
+
+    def entry(self, row: Row) -> Entry:
+        return tuple(NULL if row[position] is None else row[position] for position in self.positions)
+
+    def add(self, row: Row) -> None:
+        bisect.insort(self.entries, self.entry(row))
+
+    def add_many(self, rows: Sequence[Row]) -> None:
+        if len(rows) > len(self.entries) * self.REBUILD_RATIO:
+            # timsort merges the two sorted runs
+            self.entries.extend(sorted(map(self.entry, rows)))
+            self.entries.sort()
+            return
+        for row in rows:
+            self.add(row)
+
+    def remove(self, row: Row) -> None:
+        entry = self.entry(row)
+        index = bisect.bisect_left(self.entries, entry)
+        if index < len(self.entries) and self.entries[index] == entry:
+            del self.entries[index]
+        else:
+            # the row values were mutated in place after being indexed
+            self.entries.remove(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class InMemoryPagination(BaseRelayPagination):
+    __cursor_codec__: ClassVar[Optional[CursorCodec]] = BinaryCursorCodec()
+
+
+class InMemoryRepository(BaseRepository[TEntity]):
+    """
+    A `BaseRepository` storing the entities in memory, a stand-in for a database in tests, benchmarks and load tests.
+
+    entities are stored as tuples of their field values and rebuilt (without validation) when read,
+    a sorted index is kept for every sorting used to list, it is created on the first `list` using it
+    (or by `create_index`) and maintained on every write, so a cursor page is a bisection
+    and a scan of `limit` entries.
+    sorting with mixed directions, filtering (equality of every set field of `__filtering__`)
+    and offset pages over a filter scan the entries instead.
+    deep offset pages seek from the nearest `KeysetAnchors` anchor of their query (see `__offset_anchors__`),
+    the anchors are dropped on every write.
+
+    stored values are not copied, mutating a container of an entity (e.g. a list field) mutates the stored entity.
+
+    usage:
+        class BookRepository(InMemoryRepository[Book]):
+            pass
+
+        repository = BookRepository(books)
+    """
+
+    __id_field__: ClassVar[str] = "id"
+    __pagination__: ClassVar[Type[BaseRelayPagination]] = InMemoryPagination
+    #: translate offset pages to keyset seeks from cached anchors
+    __offset_anchors__: ClassVar[bool] = True
+
+    class Config(RepositoryConfig):
+        model_to_query = staticmethod(compiled_model_query)
+        filter_model = AllOptionalMeta
+
+    def __init__(self, entities: Iterable[TEntity] = ()) -> None:
+        self._names: Tuple[str, ...] = tuple(self.__model__.__fields__)
+        self._positions: Dict[str, int] = {name: position for position, name in enumerate(self._names)}
+        self._id_position = self._positions[self.__id_field__]
+        self._rows: Dict[Hashable, Row] = {}
+        self._indexes: Dict[Tuple[str, ...], SortedIndex] = {}
+        self._anchors: Optional[KeysetAnchors] = KeysetAnchors() if self.__offset_anchors__ else None
+        for entity in entities:
+            self._insert(self._row(entity))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def new_id(self) -> Any:
+        """
+        The id of an added entity which has none.
+        """
+        return str(uuid.uuid4())
+
+    def create_index(self, *fields: Union[str, SortKey]) -> SortedIndex:
+        """
+        Build the index of a sorting ahead of the first `list` using it, the directions are irrelevant.
+        """
+        names = tuple(getattr(field, "name", field) for field in fields)
+        if self.__id_field__ not in names:
+            names = (*names, self.__id_field__)
+        return self._index(names)
+
+    async def get(
+        self,
+        identifiers: Union[int, str, Dict[str, Any], tuple],
+        fields: Optional[Iterable[Any]] = None,
+        *,
+        should_error: bool = True,
+    ) -> Optional[TEntity]:
+        row = self._rows.get(self._key(identifiers))
+        if row is None:
+            if should_error:
+                raise EntityNotFoundError(f"entity {identifiers} was not found")
+            return None
+        return self._build(fields)(row)
+
+    async def get_many(
+        self,
+        identifiers: Iterable[Union[int, str, Dict[str, Any], tuple]],
+        fields: Optional[Iterable[Any]] = None,
+    ) -> List[Optional[TEntity]]:
+        build = self._build(fields)
+        rows = (self._rows.get(self._key(i)) for i in identifiers)
+        return [None if row is None else build(row) for row in rows]
+
+    async def list(
+        self,
+        pagination: AllPaginationStrategies,
+        fields: Optional[Iterable[Any]] = None,
+        sorting: Optional[List[SortKey]] = None,
+        filtering: Optional[TEntity] = None,
+    ) -> PaginatedResponse[TEntity]:
+        predicate = self._predicate(filtering)
+        build = self._build(fields)
+        paginator = self.__pagination__(
+            self.__sort__,
+            {self.__id_field__},
+            sorting or [+self.__sort__(self.__id_field__)],
+            reversed_=not isinstance(pagination, OffsetPaginationParams) and bool(pagination.prev),
+        )
+        field_orderings = paginator.get_field_orderings()
+        names = tuple(key.name for key in field_orderings)
+        descending = [paginator.get_direction(key) == SortingDirection.DESCENDING for key in field_orderings]
+        id_position = names.index(self.__id_field__)
+
+        if isinstance(pagination, OffsetPaginationParams):
+            offset = pagination.next
+            if self._anchors is None or offset < self._anchors.interval:
+                rows = self._take(
+                    self._scan(names, descending), id_position, predicate, pagination.limit + 1, skip=offset
+                )
+            else:
+                query = self._anchors.query(tuple(zip(names, descending)), filtering)
+                entries = self._seek(query, names, descending, id_position, predicate, offset)
+                rows = self._take(entries, id_position, None, pagination.limit + 1)
+            has_more = len(rows) > pagination.limit
+            rows = rows[: pagination.limit]
+            return PaginatedResponse[TEntity](
+                items=[build(row) for row in rows],
+                index=offset,
+                next=offset + len(rows) if has_more else None,
+                total=len(self._rows) if predicate is None else None,
+            )
+
+        cursor = pagination.prev or pagination.next
+        after = self._parse_cursor(paginator, cursor, field_orderings)
+        rows = self._take(self._scan(names, descending, after), id_position, predicate, pagination.limit + 1)
+        has_more = len(rows) > pagination.limit
+        rows = paginator.reverse_results(rows[: pagination.limit])
+        # only the edges of a page render cursors, from the full entities since `fields` may omit the sort fields
+        edges = [self._build(None)(row) for row in (rows[:1] + rows[-1:])]
+        prev, next_ = paginator.make_page_cursors(edges, field_orderings, has_more=has_more, cursor=cursor)
+        return PaginatedResponse[TEntity](items=[build(row) for row in rows], next=next_, prev=prev)
+
+    async def count(self, filtering: Optional[TEntity] = None) -> int:
+        predicate = self._predicate(filtering)
+        if predicate is None:
+            return len(self._rows)
+        return sum(1 for row in self._rows.values() if predicate(row))
+
+    async def estimate_count(self, filtering: Optional[TEntity] = None) -> Optional[int]:
+        return len(self._rows) if self._predicate(filtering) is None else None
+
+    async def add(self, entity: TEntity) -> TEntity:
+        if getattr(entity, self.__id_field__, None) is None:
+            setattr(entity, self.__id_field__, self.new_id())
+        row = self._row(entity)
+        if self._key(row[self._id_position]) in self._rows:
+            raise EntityAlreadyExistsError(self.__model__)
+        self._insert(row)
+        return entity
+
+    async def update(self, entity: TEntity, **kwargs) -> Optional[TEntity]:
+        row = self._row(entity)
+        key = self._key(row[self._id_position])
+        if key not in self._rows:
+            return None
+        self._remove(key)
+        self._insert(row)
+        return entity
+
+    async def delete(self, entity: Union[TEntity, str, int], **kwargs) -> None:
+        identifiers = getattr(entity, self.__id_field__, entity)
+        key = self._key(identifiers)
+        if key not in self._rows:
+            raise EntityNotFoundError(f"entity {identifiers} was not found")
+        self._remove(key)
+
+    async def bulk_create(self, bulk: List[TEntity]) -> BulkResultBuilder:
+        result = BulkResultBuilder()
+        rows: Dict[Hashable, Row] = {}
+        for entity in bulk:
+            if getattr(entity, self.__id_field__, None) is None:
+                setattr(entity, self.__id_field__, self.new_id())
+            row = self._row(entity)
+            key = self._key(row[self._id_position])
+            if key in self._rows or key in rows:
+                result.add_error(str(EntityAlreadyExistsError(self.__model__)))
+                continue
+            rows[key] = row
+            result.add_success(row[self._id_position])
+
+        if rows and self._anchors is not None:
+            self._anchors.clear()
+        self._rows.update(rows)
+        for index in self._indexes.values():
+            index.add_many(list(rows.values()))
+        return result
+
+    async def bulk_update(self, bulk: List[TEntity]) -> List:
+        results: List[Any] = []
+        for entity in bulk:
+            updated = await self.update(entity)
+            results.append(
+                updated or BulkItemError(message=f"entity {getattr(entity, self.__id_field__, None)} was not found")
+            )
+        return results
+
+    async def bulk_delete(self, bulk: List[Union[TEntity, Any]]) -> List:
+        results: List[Any] = []
+        for entity in bulk:
+            identifiers = getattr(entity, self.__id_field__, entity)
+            key = self._key(identifiers)
+            if key in self._rows:
+                self._remove(key)
+                results.append(identifiers)
+            else:
+                results.append(BulkItemError(message=f"entity {identifiers} was not found"))
+        return results
+
+    def _key(self, identifiers: Union[int, str, Dict[str, Any], tuple]) -> Hashable:
+        if isinstance(identifiers, dict):
+            identifiers = identifiers[self.__id_field__]
+        elif isinstance(identifiers, (tuple, list)) and len(identifiers) == 1:
+            identifiers = identifiers[0]
+        return identifiers_key(identifiers)
+
+    def _row(self, entity: Any) -> Row:
+        return tuple(getattr(entity, name, None) for name in self._names)
+
+    def _insert(self, row: Row) -> None:
+        if self._anchors is not None:
+            self._anchors.clear()
+        self._rows[self._key(row[self._id_position])] = row
+        for index in self._indexes.values():
+            index.add(row)
+
+    def _remove(self, key: Hashable) -> None:
+        row = self._rows.pop(key)
+        if self._anchors is not None:
+            self._anchors.clear()
+        for index in self._indexes.values():
+            index.remove(row)
+
+    def _index(self, names: Tuple[str, ...]) -> SortedIndex:
+        index = self._indexes.get(names)
+        if index is None:
+            index = self._indexes[names] = SortedIndex([self._positions[name] for name in names], self._rows.values())
+        return index
+
+    def _build(self, fields: Optional[Iterable[Any]]) -> Callable[[Row], TEntity]:
+        """
+        A function rebuilding the entity of a row, projected to `fields`.
+        """
+        if fields is None:
+            model: Type[BaseModel] = self.__model__
+            names = self._names
+        else:
+            names = tuple(
+                {self.__id_field__: None, **{getattr(field, "name", field).split(".")[0]: None for field in fields}}
+            )
+            model = utils.create_subset_model(self.__model__, {name: 1 for name in names})
+        getter = operator.itemgetter(*(self._positions[name] for name in names))
+        if len(names) == 1:
+            return lambda row: model.construct(**{names[0]: getter(row)})  # type: ignore[return-value]
+        return lambda row: model.construct(**dict(zip(names, getter(row))))  # type: ignore[return-value]
+
+    def _predicate(self, filtering: Optional[BaseModel]) -> Optional[Predicate]:
+        if filtering is None:
+            return None
+        # only the fields set by the request filter, not the defaults of the filter model
+        values = ((name, getattr(filtering, name)) for name in filtering.__fields_set__)
+        conditions = [
+            (self._positions[name], value) for name, value in values if value is not None and name in self._positions
+        ]
+        if not conditions:
+            return None
+        return lambda row: all(row[position] == value for position, value in conditions)
+
+    def _parse_cursor(
+        self, paginator: BaseRelayPagination, cursor: Optional[str], field_orderings: List[SortKey]
+    ) -> Optional[Entry]:
+        parsed = paginator.parse_cursor(cursor, field_orderings)  # type: ignore[arg-type]
+        if parsed is None:
+            return None
+        entry = []
+        for key, raw in parsed:
+            field = self.__model__.__fields__[key.name]
+            value, errors = field.validate(raw, {}, loc=field.name)
+            if errors:
+                raise InvalidCursorError("invalid_cursor.value")
+            entry.append(NULL if value is None else value)
+        return tuple(entry)
+
+    def _scan(self, names: Tuple[str, ...], descending: List[bool], after: Optional[Entry] = None) -> Iterator[Entry]:
+        """
+        Iterate over the entries of `names` in the order of `descending`, starting after the `after` entry.
+        """
+        if all(descending) or not any(descending):
+            entries = self._index(names).entries
+            if not descending[0]:
+                start = 0 if after is None else bisect.bisect_right(entries, after)
+                return (entries[i] for i in range(start, len(entries)))
+            end = len(entries) if after is None else bisect.bisect_left(entries, after)
+            return (entries[i] for i in range(end - 1, -1, -1))
+
+        # mixed directions can not be served by a single ascending index, sort by each field, the last one first
+        index = SortedIndex([self._positions[name] for name in names])
+        entries = [index.entry(row) for row in self._rows.values()]
+        for position in reversed(range(len(names))):
+            entries.sort(key=operator.itemgetter(position), reverse=descending[position])
+        if after is not None:
+            return (entry for entry in entries if _follows(entry, after, descending))
+        return iter(entries)
+
+    def _seek(
+        self,
+        query: Hashable,
+        names: Tuple[str, ...],
+        descending: List[bool],
+        id_position: int,
+        predicate: Optional[Predicate],
+        offset: int,
+    ) -> Iterator[Entry]:
+        """
+        Iterate over the entries matching `predicate` from `offset`, seeking after the nearest anchor of `query`.
+        """
+        anchors = cast(KeysetAnchors, self._anchors)
+        position, after = anchors.nearest(query, offset)
+        entries = self._scan(names, descending, after)
+        if predicate is not None:
+            rows, key = self._rows, self._key
+            entries = (entry for entry in entries if predicate(rows[key(entry[id_position])]))
+        # skip to `offset` an interval at a time, anchoring the entries before every interval on the way
+        while position < offset:
+            boundary = min(offset, (position // anchors.interval + 1) * anchors.interval)
+            entry = next(itertools.islice(entries, boundary - position - 1, None), None)
+            if entry is None:
+                return iter(())
+            position = boundary
+            anchors.add(query, position, entry)
+        return entries
+
+    def _take(
+        self, entries: Iterator[Entry], id_position: int, predicate: Optional[Predicate], count: int, *, skip: int = 0
+    ) -> List[Row]:
+        rows, key = self._rows, self._key
+        if predicate is None:
+            return [rows[key(entry[id_position])] for entry in itertools.islice(entries, skip, skip + count)]
+
+        result: List[Row] = []
+        for entry in entries:
+            row = rows[key(entry[id_position])]
+            if not predicate(row):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            result.append(row)
+            if len(result) >= count:
+                break
+        return result
+
+
+def _follows(entry: Entry, after: Entry, descending: Sequence[bool]) -> bool:
+    for value, bound, desc in zip(entry, after, descending):
+        if value != bound:
+            return value < bound if desc else value > bound
+    return False
@@ -1,6 +1,7 @@
 import inspect
 import logging
-from typing import Any, Dict, Tuple, Type
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Type
 
 import pydantic
 from fastapi import Depends, Query, params
@@ -8,6 +9,9 @@ from pydantic import BaseModel
 
 from .utils import _convert_pydantic, _remove_extra_data_from_signature, clean_dict
 
+if TYPE_CHECKING:
+    from pydantic.fields import ModelField
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,14 +23,31 @@ class AllOptionalMeta(pydantic.main.ModelMetaclass):
         return new
 
 
-def model_query(model: Type[BaseModel], meta: Type[pydantic.main.ModelMetaclass] = AllOptionalMeta) -> params.Depends:
-    cls = meta(f"Optional{model.__name__}", (model,), {})
+def model_query(
+    model: Type[BaseModel], meta: Type[pydantic.main.ModelMetaclass] = AllOptionalMeta, *, compiled: bool = False
+) -> params.Depends:
+    """
+    Create a FastAPI dependency which builds `model` from query parameters.
 
-    def dependency(**kwargs) -> BaseModel:
-        return cls(**clean_dict(kwargs))
+    by default the model is fully validated from the non `None` parameters,
+    with `compiled=True` a parser specialized for the model is built once, it skips `None` parameters
+    and constructs the model without validating it again, since FastAPI already validated every query parameter
+    against its field annotation, note that model validators are not run in this mode.
+    """
+    cls = meta(f"Optional{model.__name__}", (model,), {})
 
     cls_params = dict(cls.__signature__.parameters)
     cls_params.pop("args", None)
+
+    if compiled:
+        dependency = _compile_query_parser(
+            cls, {parameter: model_field.name for parameter, model_field in zip(cls_params, model.__fields__.values())}
+        )
+    else:
+
+        def dependency(**kwargs) -> BaseModel:
+            return cls(**clean_dict(kwargs))
+
     params = []
     for parameter, model_field in zip(cls_params.values(), model.__fields__.values()):
         params.append(
@@ -51,3 +72,47 @@ def model_query(model: Type[BaseModel], meta: Type[pydantic.main.ModelMetaclass]
     )
 
     return Depends(dependency)
+
+
+def compiled_model_query(
+    model: Type[BaseModel], meta: Type[pydantic.main.ModelMetaclass] = AllOptionalMeta
+) -> params.Depends:
+    return model_query(model, meta, compiled=True)
+
+
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset, Enum)
+
+
+def _compile_query_parser(cls: Type[BaseModel], field_names: Dict[str, str]) -> Callable[..., BaseModel]:
+    """
+    Build a parser equivalent to `cls.construct`, with the defaults resolved once instead of per request.
+    """
+    static_defaults: Dict[str, Any] = {}
+    dynamic_defaults: List[ModelField] = []
+    for name, field in cls.__fields__.items():
+        if field.required:
+            continue
+        if field.default_factory is None and isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            static_defaults[name] = field.default
+        else:
+            dynamic_defaults.append(field)
+
+    def dependency(**kwargs) -> BaseModel:
+        values = static_defaults.copy()
+        for field in dynamic_defaults:
+            values[field.name] = field.get_default()
+
+        fields_set = set()
+        for name, value in kwargs.items():
+            if value is not None:
+                field_name = field_names[name]
+                values[field_name] = value
+                fields_set.add(field_name)
+
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        instance._init_private_attributes()  # noqa: SLF001
+        return instance
+
+    return dependency
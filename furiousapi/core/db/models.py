@@ -9,11 +9,18 @@ try:
     def orjson_dumps(v: Any, *, default: Any = None) -> str:
         return orjson.dumps(v, default=default).decode()
 
+    def orjson_dumps_bytes(v: Any, *, default: Any = None) -> bytes:
+        return orjson.dumps(v, default=default, option=orjson.OPT_NON_STR_KEYS)
+
     json_loads = orjson.loads
     json_dumps = orjson_dumps
+    json_dumps_bytes = orjson_dumps_bytes
 except ImportError:
     import json
 
+    def json_dumps_bytes(v: Any, *, default: Any = None) -> bytes:
+        return json.dumps(v, default=default, separators=(",", ":")).encode()
+
     json_loads = json.loads
     json_dumps = json.dumps  # type: ignore[assignment]
 
@@ -23,6 +30,7 @@ logger = logging.getLogger(__name__)
 class FuriousPydanticConfig(BaseConfig):
     extra = Extra.allow
     json_dumps = json_dumps
+    json_dumps_bytes = json_dumps_bytes
     json_loads = json_loads
 
 
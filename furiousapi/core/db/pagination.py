@@ -1,14 +1,18 @@
 import base64
 import logging
+import operator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Iterable,
+    Iterator,
     List,
     Optional,
     Protocol,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -16,8 +20,14 @@ from typing import (
 )
 
 from furiousapi.core.config import get_settings
-from furiousapi.core.db.fields import SortableFieldEnum
-from furiousapi.core.exceptions import FuriousError
+from furiousapi.core.db.cursors import (
+    CursorCodec,
+    CursorSigner,
+    JSONCursorCodec,
+    SignedCursorCodec,
+)
+from furiousapi.core.db.fields import SortableFieldEnum, SortKey
+from furiousapi.core.exceptions import FuriousError, InvalidCursorError
 from furiousapi.core.fields import SortingDirection
 from furiousapi.core.types import TEntity
 
@@ -126,6 +136,10 @@ class JSONLoad(Protocol):
 class BaseCursorPagination(BasePagination, ABC):
     __json_loads__: Callable
     __json_dumps__: Callable
+    #: The codec used to render and parse cursors, defaults to the legacy `JSONCursorCodec`
+    __cursor_codec__: ClassVar[Optional[CursorCodec]] = None
+    #: When set, cursors are signed and bound to the sorting they were rendered for
+    __cursor_signer__: ClassVar[Optional[CursorSigner]] = None
     #: The name of the query parameter to inspect for the cursor value.
     delimiter = "$$"
 
@@ -133,9 +147,10 @@ class BaseCursorPagination(BasePagination, ABC):
         self,
         sort_enum: Type[SortableFieldEnum],
         id_fields: Set[str],
-        sorting: List[SortableFieldEnum],
+        sorting: List[SortKey],
         *args,
         validate_values: bool = True,
+        reversed_: bool = False,
         **kwargs,
     ) -> None:
         super().__init__()
@@ -143,70 +158,101 @@ class BaseCursorPagination(BasePagination, ABC):
         self.sorting = sorting
         self.id_fields = id_fields
         self._validate_values = validate_values
+        self._reversed = reversed_
+        self._cursor_codec: Optional[CursorCodec] = None
 
-    # There are a number of different cases that this covers in order to be backwards compatible with
-    @staticmethod
-    def get_cursor_info(next_: str) -> CursorInfo:
-        cursor = next_
-        cursor_arg = None
+    @property
+    def cursor_codec(self) -> CursorCodec:
+        if self._cursor_codec is None:
+            codec = self.__cursor_codec__ or JSONCursorCodec(self.__json_dumps__, self.__json_loads__, self.delimiter)
+            if self.__cursor_signer__ is not None:
+                codec = SignedCursorCodec(
+                    codec, self.__cursor_signer__, self.__cursor_signer__.fingerprint(self.get_cursor_scope())
+                )
+            self._cursor_codec = codec
+        return self._cursor_codec
+
+    def get_cursor_scope(self) -> Tuple[str, ...]:
+        """
+        The parts identifying the sort specification a cursor belongs to, used for signed cursors.
+        """
+        return (self.sort_enum.__name__, *(str(field) for field in self.sorting or ()), *sorted(self.id_fields))
 
+    @staticmethod
+    def get_cursor_info(next_: Optional[str], prev: Optional[str] = None) -> CursorInfo:
+        """
+        Resolve which cursor to seek from, a `prev` cursor pages backward and takes precedence over `next`.
+        """
         limit = None
         limit_arg = None
 
-        # Unambiguous cases where a cursor is provided.
-        # if self.after_arg:
-
-        # Ambiguous cases where limits are provided but not cursors
-        # Relay sometimes sends both first and after, default to "first"
-        # in keeping with the cursor precedence
-
-        # legacy "cursor_arg" config cases always map to after/first
-        reversed_ = False  #
+        if prev:
+            return CursorInfo(reversed=True, cursor=prev, cursor_arg="prev", limit=limit, limit_arg=limit_arg)
 
-        return CursorInfo(reversed_, cursor, cursor_arg, limit, limit_arg)
+        return CursorInfo(
+            reversed=False, cursor=next_, cursor_arg="next" if next_ else None, limit=limit, limit_arg=limit_arg
+        )
 
     @property
     def reversed(self) -> bool:
-        return False
+        """
+        Whether the page is fetched backward, from a `prev` cursor.
+
+        when reversed the repository should query using `get_direction` for each field ordering,
+        which flips the requested direction, and restore the requested order with `reverse_results`.
+        """
+        return self._reversed
+
+    def get_direction(self, field: SortKey) -> SortingDirection:
+        direction = field.direction
+        if not self._reversed:
+            return direction
+        return SortingDirection.ASCENDING if direction == SortingDirection.DESCENDING else SortingDirection.DESCENDING
+
+    def reverse_results(self, items: List[TEntity]) -> List[TEntity]:
+        return items[::-1] if self._reversed else items
 
-    def get_field_orderings(self) -> List[SortableFieldEnum]:
+    def get_field_orderings(self) -> List[SortKey]:
         if self.sorting is None:
             raise AssertionError("sorting must be defined when using cursor pagination")
-        op = "__pos__" if self.sorting[-1].direction == SortingDirection.ASCENDING else "__neg__"
+        direction = self.sorting[-1].direction
+        sorted_fields = {key.value for key in self.sorting}
 
         missing_field_orderings = [
-            getattr(self.sort_enum(id_field), op)()
+            SortKey(self.sort_enum(id_field).field, direction)
             for id_field in self.id_fields
-            if id_field not in frozenset(self.sorting)
+            if id_field not in sorted_fields
         ]
 
-        field_ordering = self.sorting + missing_field_orderings
-        # if self.reversed:
+        return self.sorting + missing_field_orderings
 
-        return field_ordering  # noqa: RET504
-
-    def parse_cursor(
-        self, cursor: str, field_orderings: List[SortableFieldEnum]
-    ) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    def parse_cursor(self, cursor: str, field_orderings: List[SortKey]) -> Optional[Tuple[Tuple[str, Any], ...]]:
         if cursor is None:
             return None
         parsed_cursor = self.decode_cursor(cursor)
 
         if len(parsed_cursor) != len(field_orderings):
-            raise FuriousError("invalid_cursor.length")
+            raise InvalidCursorError("invalid_cursor.length")
 
         return tuple((field, value) for field, value in zip(field_orderings, parsed_cursor))
 
-    def render_cursor(self, item: TEntity, column_fields: Iterable[SortableFieldEnum]) -> str:
-        cursor = tuple(self.__json_dumps__(getattr(item, field.value), default=str) for field in column_fields)
-        return self.encode_cursor(cursor)
+    def render_cursor(self, item: TEntity, column_fields: Iterable[SortKey]) -> str:
+        return self.encode_cursor(tuple(getattr(item, field.value) for field in column_fields))
 
-    def encode_cursor(self, cursor: Tuple[str, ...]) -> str:
-        return self.encode_value(self.delimiter.join(str(value) for value in cursor))
+    def encode_cursor(self, cursor: Sequence[Any]) -> str:
+        """
+        The cursor of the raw sort values of an item, rendered by the cursor codec.
 
-    def decode_cursor(self, cursor: str) -> List[str]:
-        cursor = self.decode_value(cursor)
-        return [self.__json_loads__(value) for value in cursor.split(self.delimiter)]
+        the values were JSON dumped by `render_cursor` before codecs were pluggable, they are now passed as is,
+        pre-dumped strings would be dumped twice.
+        """
+        return self.cursor_codec.encode(cursor)
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        """
+        The raw sort values of a cursor, see `encode_cursor`.
+        """
+        return self.cursor_codec.decode(cursor)
 
     def encode_value(self, value: Any) -> str:
         value = str(value)
@@ -220,7 +266,7 @@ class BaseCursorPagination(BasePagination, ABC):
         encoded += (3 - ((len(encoded) + 3) % 4)) * b"="  # Add back padding.
         return base64.b64decode(encoded).decode()
 
-    def get_filter(self, field_orderings: List[SortableFieldEnum], cursor: Cursor) -> Any:
+    def get_filter(self, field_orderings: List[SortKey], cursor: Cursor) -> Any:
         raise NotImplementedError
 
     def get_previous_clause(self, column_cursors: List[Tuple[Any, SortingDirection, Tuple[str, Any]]]) -> Any:
@@ -237,6 +283,71 @@ class BaseCursorPagination(BasePagination, ABC):
         raise NotImplementedError
 
 
+class CursorBatch(Sequence[str]):
+    """
+    The cursors of a page of items.
+
+    the sort field accessor is resolved once per page and cursors are rendered only when accessed,
+    so serving only the `next` cursor renders only the cursor of the last item.
+    iterating renders all the remaining cursors in a single pass.
+    """
+
+    def __init__(self, codec: CursorCodec, items: Sequence[TEntity], field_orderings: Sequence[SortKey]) -> None:
+        self._codec = codec
+        self._items = items
+        self._cursors: List[Optional[str]] = [None] * len(items)
+        getter = operator.attrgetter(*(field.value for field in field_orderings))
+        self._get_values: Callable[[TEntity], Tuple[Any, ...]] = (
+            getter if len(field_orderings) > 1 else lambda item: (getter(item),)
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> str:  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]  # type: ignore[return-value]
+        cursor = self._cursors[index]
+        if cursor is None:
+            cursor = self._cursors[index] = self._codec.encode(self._get_values(self._items[index]))
+        return cursor
+
+    def __iter__(self) -> Iterator[str]:
+        missing = [i for i, cursor in enumerate(self._cursors) if cursor is None]
+        if missing:
+            get_values, items = self._get_values, self._items
+            rendered = self._codec.encode_many(get_values(items[i]) for i in missing)
+            for i, cursor in zip(missing, rendered):
+                self._cursors[i] = cursor
+        return iter(self._cursors)  # type: ignore[arg-type]
+
+    @property
+    def first(self) -> Optional[str]:
+        return self[0] if self._items else None
+
+    @property
+    def last(self) -> Optional[str]:
+        return self[-1] if self._items else None
+
+
 class BaseRelayPagination(BaseCursorPagination, ABC):
-    def make_cursors(self, items: List[TEntity], field_orderings: List[SortableFieldEnum]) -> Tuple[str, ...]:
-        return tuple(self.render_cursor(item, field_orderings) for item in items)
+    def make_cursors(self, items: List[TEntity], field_orderings: List[SortKey]) -> Tuple[str, ...]:
+        return tuple(self.make_cursor_batch(items, field_orderings))
+
+    def make_page_cursors(
+        self, items: Sequence[TEntity], field_orderings: Sequence[SortKey], *, has_more: bool, cursor: Any
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Render the `(prev, next)` cursors of a page.
+
+        `items` must already be in the requested order (see `reverse_results`),
+        `has_more` tells whether more items exist beyond the page in the fetching direction
+        and `cursor` is the cursor the page was fetched from.
+        """
+        batch = self.make_cursor_batch(items, field_orderings)
+        if self._reversed:
+            return (batch.first if has_more else None), batch.last
+        return (batch.first if cursor else None), (batch.last if has_more else None)
+
+    def make_cursor_batch(self, items: Sequence[TEntity], field_orderings: Sequence[SortKey]) -> CursorBatch:
+        return CursorBatch(self.cursor_codec, items, field_orderings)
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List, Optional, Set, Tuple
+
+from furiousapi.core.cache import LRUCache
+from furiousapi.core.config import get_settings
+from furiousapi.core.instrumentation import PREFETCH_DISCARDED, PREFETCH_LOOKUPS, detach_request, get_metrics_sink
+from furiousapi.core.pagination import CursorPaginationParams
+from furiousapi.utils import NOT_SET
+
+from .counting import filter_key, repository_key
+
+if TYPE_CHECKING:
+    from furiousapi.core.pagination import AllPaginationStrategies, PaginatedResponse
+
+    from .fields import SortKey
+    from .repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+PrefetchKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class PrefetchStats:
+    #: requests served from a prefetched page
+    hits: int = 0
+    #: requests with a `next` cursor which were not prefetched (or whose prefetch failed)
+    misses: int = 0
+    #: pages fetched in the background
+    prefetched: int = 0
+    #: prefetched pages dropped unused, because the cache was full, their ttl passed or they were invalidated
+    discarded: int = 0
+    #: background fetches which raised
+    errors: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Prefetch:
+    __slots__ = ("task", "served")
+
+    def __init__(self, task: "asyncio.Task[PaginatedResponse]") -> None:
+        self.task = task
+        self.served = False
+
+
+class PagePrefetcher:
+    """
+    Serves sequential cursor pagination from memory, by fetching the next page while the client reads the current one.
+
+    after a cursor page is served its `next` page is fetched in the background and kept for `ttl` seconds,
+    keyed by the repository (see `repository_key`), the emitted `next` cursor, the page size, projection, sorting
+    and filter. a follow-up request for that page awaits the prefetch instead of the repository.
+    at most `max_size` pages are kept, dropping a page still being fetched cancels its fetch.
+    writes should `invalidate` the pages of the repository, as the write endpoints do.
+    the defaults are taken from `Settings.pagination`.
+
+    a prefetched page may be up to `ttl` seconds stale, and the repository is used after the request
+    which served the previous page ended, so it must not hold per request resources (e.g. a session).
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        settings = get_settings().pagination
+        self._pages: LRUCache[PrefetchKey, _Prefetch] = LRUCache(
+            max_size or settings.prefetch_max_size,
+            ttl or settings.prefetch_ttl,
+            clock=clock,
+            on_evict=self._on_evict,
+        )
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = PrefetchStats()
+
+    @property
+    def stats(self) -> PrefetchStats:
+        return PrefetchStats(**{**self._stats.__dict__, "size": len(self._pages)})
+
+    async def list(
+        self,
+        repository: "BaseRepository",
+        pagination: "AllPaginationStrategies",
+        fields: Optional[Any] = None,
+        sorting: Optional[List["SortKey"]] = None,
+        filtering: Optional[Any] = None,
+    ) -> "PaginatedResponse":
+        """
+        `BaseRepository.list`, served from a prefetched page when there is one.
+        """
+        if not isinstance(pagination, CursorPaginationParams) or pagination.prev:
+            return await repository.list(pagination, fields, sorting, filtering)
+
+        page = None
+        if pagination.next:
+            page = await self._claim(repository, self._key(repository, pagination, fields, sorting, filtering))
+        if page is None:
+            page = await repository.list(pagination, fields, sorting, filtering)
+        if page.next:
+            self._prefetch(repository, pagination.copy(update={"next_": page.next}), fields, sorting, filtering)
+        return page
+
+    def invalidate(self, repository: "BaseRepository") -> None:
+        """
+        Drop the prefetched pages of a repository, e.g. after a write.
+        """
+        scope = repository_key(repository)
+        for key in self._pages:
+            if key[0] == scope:
+                self._pages.pop(key)
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+    @staticmethod
+    def _key(
+        repository: "BaseRepository",
+        pagination: CursorPaginationParams,
+        fields: Optional[Any],
+        sorting: Optional[List["SortKey"]],
+        filtering: Optional[Any],
+    ) -> PrefetchKey:
+        return (
+            repository_key(repository),
+            pagination.next,
+            pagination.limit,
+            frozenset(fields or ()),
+            tuple(sorting or ()),
+            filter_key(filtering),
+        )
+
+    async def _claim(self, repository: "BaseRepository", key: PrefetchKey) -> Optional["PaginatedResponse"]:
+        prefetch = self._pages.get(key)
+        # tasks are bound to their event loop, a page prefetched in another loop can't be awaited
+        if prefetch is not NOT_SET and prefetch.task.get_loop() is asyncio.get_running_loop():
+            prefetch.served = True
+            self._pages.pop(key)
+            try:
+                page = await prefetch.task
+            except Exception:  # noqa: BLE001 the error is logged by the prefetch, the page is fetched again
+                logger.debug("prefetch of a page of %s failed, fetching it again", type(repository).__name__)
+            else:
+                self._record(repository, hit=True)
+                return page
+        self._record(repository, hit=False)
+        return None
+
+    def _prefetch(
+        self,
+        repository: "BaseRepository",
+        pagination: CursorPaginationParams,
+        fields: Optional[Any],
+        sorting: Optional[List["SortKey"]],
+        filtering: Optional[Any],
+    ) -> None:
+        key = self._key(repository, pagination, fields, sorting, filtering)
+        if key in self._pages:
+            return
+
+        async def fetch() -> "PaginatedResponse":
+            detach_request()
+            try:
+                return await repository.list(pagination, fields, sorting, filtering)
+            except Exception:
+                self._stats.errors += 1
+                logger.warning("failed to prefetch a page of %s", type(repository).__name__, exc_info=True)
+                raise
+
+        task = asyncio.ensure_future(fetch())
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+        self._stats.prefetched += 1
+        self._pages.set(key, _Prefetch(task))
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        # retrieve the exception, an unused failed prefetch is not an unhandled error
+        if not task.cancelled():
+            task.exception()
+
+    def _on_evict(self, key: PrefetchKey, prefetch: _Prefetch) -> None:
+        if prefetch.served:
+            return
+        prefetch.task.cancel()
+        self._stats.discarded += 1
+        sink = get_metrics_sink()
+        if sink.enabled:
+            sink.gauge(PREFETCH_DISCARDED, 1, {"repository": key[0][0].__name__})  # type: ignore[index]
+
+    def _record(self, repository: "BaseRepository", *, hit: bool) -> None:
+        if hit:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+        sink = get_metrics_sink()
+        if sink.enabled:
+            sink.gauge(
+                PREFETCH_LOOKUPS, 1, {"repository": type(repository).__name__, "result": "hit" if hit else "miss"}
+            )
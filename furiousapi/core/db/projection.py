@@ -0,0 +1,121 @@
+from enum import Enum
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .utils import Projection
+
+Include = Dict[str, Any]
+
+
+class FieldProjection:
+    """
+    The fields selected by the `fields` query parameter, members of a repository `__fields__` enum.
+
+    nested fields are dotted paths (see `RepositoryConfig.fields_recursive`), selecting a field selects all of
+    its nested fields. iterating a projection yields the enum members, so repositories which expect
+    an iterable of members keep working, repositories aware of projections can push `tree` (or `alias_tree`)
+    down to the database and the response layer serializes only the `include` keys.
+    """
+
+    __slots__ = ("fields", "_tree", "_alias_tree", "_include")
+
+    def __init__(self, fields: Iterable[Enum]) -> None:
+        self.fields: Tuple[Enum, ...] = tuple(dict.fromkeys(fields))
+        self._tree: Optional[Projection] = None
+        self._alias_tree: Optional[Projection] = None
+        self._include: Optional[Include] = None
+
+    @classmethod
+    def from_fields(cls, fields: Optional[Iterable[Enum]]) -> Optional["FieldProjection"]:
+        """
+        The projection of the `fields` query parameter, `None` (no projection) when no field is selected.
+        """
+        if fields is None or isinstance(fields, FieldProjection):
+            return fields
+        projection = cls(fields)
+        return projection if projection.fields else None
+
+    @property
+    def paths(self) -> FrozenSet[str]:
+        return frozenset(field.name for field in self.fields)
+
+    @property
+    def names(self) -> FrozenSet[str]:
+        """
+        The selected top level fields.
+        """
+        return frozenset(self.tree)
+
+    @property
+    def tree(self) -> Projection:
+        """
+        The projection by field names, e.g. ``{"title": 1, "author": {"name": 1}}``, see `create_subset_model`.
+        """
+        if self._tree is None:
+            self._tree = _build_tree(field.name for field in self.fields)
+        return self._tree
+
+    @property
+    def alias_tree(self) -> Projection:
+        """
+        `tree` by field aliases, as stored by most databases.
+        """
+        if self._alias_tree is None:
+            self._alias_tree = _build_tree(str(field.value) for field in self.fields)
+        return self._alias_tree
+
+    @property
+    def include(self) -> Include:
+        """
+        `tree` as the `include` argument of `BaseModel.dict`.
+        """
+        if self._include is None:
+            self._include = _to_include(self.tree)
+        return self._include
+
+    def include_items(self, page: BaseModel, key: str = "items") -> Include:
+        """
+        The `include` of a page of items (e.g. `PaginatedResponse`), projecting only the items.
+        """
+        include: Include = {name: ... for name in page.__fields__ if name != key}
+        include[key] = {"__all__": self.include}
+        return include
+
+    def __iter__(self) -> Iterator[Enum]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.fields or item in self.paths
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FieldProjection) and set(self.fields) == set(other.fields)
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.fields))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({sorted(self.paths)})"
+
+
+def _build_tree(paths: Iterable[str]) -> Projection:
+    tree: Projection = {}
+    # parents first, so a selected parent absorbs the paths nested in it
+    for path in sorted(set(paths), key=lambda p: p.count(".")):
+        *parents, leaf = path.split(".")
+        node = tree
+        for part in parents:
+            child = node.setdefault(part, {})
+            if not isinstance(child, dict):
+                break
+            node = child
+        else:
+            node[leaf] = 1
+    return tree
+
+
+def _to_include(tree: Projection) -> Include:
+    return {key: _to_include(value) if isinstance(value, dict) else ... for key, value in tree.items()}
@@ -1,13 +1,19 @@
+import asyncio
+import inspect
 import sys
 from abc import ABCMeta, abstractmethod
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Generic,
+    Hashable,
     Iterable,
+    Iterator,
     List,
     Optional,
     Protocol,
@@ -23,6 +29,7 @@ from fastapi.params import Depends
 
 from furiousapi.core.config import get_settings
 from furiousapi.core.db import utils
+from furiousapi.core.instrumentation import instrument_repository_method
 from furiousapi.core.types import TEntity
 
 if sys.version_info >= (3, 10):
@@ -35,9 +42,9 @@ if TYPE_CHECKING:
 
     from pydantic import BaseModel
 
-    from furiousapi.core.db.fields import SortableFieldEnum
-    from furiousapi.core.pagination import AllPaginationStrategies
-    from furiousapi.core.responses import BulkResponseModel
+    from furiousapi.core.db.fields import SortableFieldEnum, SortKey
+    from furiousapi.core.pagination import AllPaginationStrategies, CursorPaginationParams
+    from furiousapi.core.responses import BulkResponseModel, BulkResultBuilder
     from furiousapi.core.types import TModelFields
 
 
@@ -54,6 +61,8 @@ ModelDependency: TypeAlias = Callable[
 class RepositoryConfig:
     fields_include: ClassVar[Optional[Set[str]]] = None
     fields_exclude: ClassVar[Optional[Set[str]]] = None
+    #: include the dotted paths of the nested models fields in `__fields__`, e.g. `author.name`
+    fields_recursive: ClassVar[bool] = False
     sort_include: ClassVar[Optional[Set[str]]] = None
     sort_exclude: ClassVar[Optional[Set[str]]] = None
     default_limit: ClassVar[int] = get_settings().pagination.default_size
@@ -62,6 +71,23 @@ class RepositoryConfig:
     filter_model: ClassVar[ModelMetaclass]
 
 
+INSTRUMENTED_METHODS = frozenset(
+    (
+        "get",
+        "get_many",
+        "list",
+        "count",
+        "estimate_count",
+        "add",
+        "update",
+        "delete",
+        "bulk_create",
+        "bulk_update",
+        "bulk_delete",
+    )
+)
+
+
 class RepositoryMeta(ABCMeta):
     def __new__(
         mcs: Type["RepositoryMeta"],  # noqa: N804
@@ -69,6 +95,15 @@ class RepositoryMeta(ABCMeta):
         bases: Tuple[Union[Type["BaseRepository"], Type]],
         namespace: dict,
     ) -> "RepositoryMeta":
+        for method in INSTRUMENTED_METHODS & namespace.keys():
+            func = namespace[method]
+            if (
+                inspect.iscoroutinefunction(func)
+                and not getattr(func, "__isabstractmethod__", False)
+                and not hasattr(func, "__furious_instrumented__")
+            ):
+                namespace[method] = instrument_repository_method(func)
+
         parents = [b for b in bases if isinstance(b, mcs)]
         if not parents:
             return super().__new__(mcs, name, bases, namespace)
@@ -90,7 +125,7 @@ class RepositoryMeta(ABCMeta):
             model, include=config.sort_include, exclude=config.sort_exclude
         )
         fields: Type[Enum] = utils.get_model_fields_enum(
-            model, include=config.fields_include, exclude=config.fields_exclude
+            model, include=config.fields_include, exclude=config.fields_exclude, recursive=config.fields_recursive
         )
         filtering = (
             config.filter_model is not None
@@ -130,6 +165,9 @@ class BaseRepository(Generic[TEntity], metaclass=RepositoryMeta):  # type: ignor
         __filtering__: ClassVar[Type[BaseModel]]
 
     Config = RepositoryConfig
+    #: the chunks of a bulk run at a time on an instance (see `BulkExecutor`), `None` for the executor `concurrency`,
+    #: only repositories safe for concurrent use (e.g. on a connection pool, not a single session) should raise it
+    bulk_concurrency: ClassVar[Optional[int]] = None
 
     @abstractmethod
     async def get(
@@ -140,15 +178,79 @@ class BaseRepository(Generic[TEntity], metaclass=RepositoryMeta):  # type: ignor
         should_error: bool = True,
     ) -> Optional[TEntity]: ...
 
+    async def get_many(
+        self,
+        identifiers: Iterable[Union[int, str, Dict[str, Any], tuple]],
+        fields: Optional[Iterable["Enum"]] = None,
+    ) -> List[Optional[TEntity]]:
+        """
+        Get several entities at once, the results are ordered as `identifiers`, with `None` for missing entities.
+
+        the default implementation gathers a `get` per identifier,
+        repositories should override it with a single (e.g. `$in`) query.
+        """
+        fields = reusable_fields(fields)
+        return list(await asyncio.gather(*(self.get(i, fields, should_error=False) for i in identifiers)))
+
     @abstractmethod
     async def list(
         self,
         pagination: "AllPaginationStrategies",
         fields: Optional[Iterable["TModelFields"]] = None,
-        sorting: Optional[List["SortableFieldEnum"]] = None,
+        sorting: Optional[List["SortKey"]] = None,
         filtering: Optional[TEntity] = None,
     ) -> Any: ...
 
+    async def count(self, filtering: Optional[TEntity] = None) -> Optional[int]:  # noqa: ARG002
+        """
+        The exact number of entities matching `filtering`, see `CountingStrategy`, `None` when it can't count.
+        """
+        return None
+
+    async def estimate_count(self, filtering: Optional[TEntity] = None) -> Optional[int]:  # noqa: ARG002
+        """
+        A fast estimate of `count`, e.g. from the collection statistics, `None` when there is none.
+        """
+        return None
+
+    def cache_scope(self) -> Hashable:
+        """
+        The scope of the results cached for the repository (e.g. by `CountingStrategy`), `None` by default.
+
+        results are shared by the instances of a repository class with the same scope,
+        repositories whose instances see different entities (e.g. scoped per tenant or user) return their scope.
+        """
+        return None
+
+    async def iter_pages(
+        self,
+        pagination: "CursorPaginationParams",
+        fields: Optional[Iterable["TModelFields"]] = None,
+        sorting: Optional[List["SortKey"]] = None,
+        filtering: Optional[TEntity] = None,
+        *,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over consecutive pages, starting at `pagination`, until the last page or `max_items` items.
+
+        the default implementation follows the `next` cursors returned by `list`,
+        repositories with a native streaming cursor may override it, the `next` of every page must be
+        the cursor to resume from after it.
+        """
+        remaining = max_items
+        while remaining is None or remaining > 0:
+            if remaining is not None and remaining < pagination.limit:
+                pagination = pagination.copy(update={"limit": remaining})
+            page = await self.list(pagination, fields, sorting, filtering)
+            yield page
+            if remaining is not None:
+                remaining -= len(page.items)
+            if not page.next or not page.items:
+                return
+            # `prev` takes precedence over `next`, a stream started from a `prev` cursor continues forward
+            pagination = pagination.copy(update={"next_": page.next, "prev_": None})
+
     @abstractmethod
     async def add(self, entity: TEntity) -> TEntity: ...
 
@@ -159,10 +261,121 @@ class BaseRepository(Generic[TEntity], metaclass=RepositoryMeta):  # type: ignor
     async def delete(self, entity: Union[TEntity, str, int], **kwargs) -> None: ...
 
     @abstractmethod
-    async def bulk_create(self, bulk: List[TEntity]) -> "BulkResponseModel": ...
+    async def bulk_create(self, bulk: List[TEntity]) -> Union["BulkResponseModel", "BulkResultBuilder"]: ...
 
     @abstractmethod
     async def bulk_delete(self, bulk: List[Union[TEntity, Any]]) -> List: ...
 
     @abstractmethod
     async def bulk_update(self, bulk: List[TEntity]) -> List: ...
+
+
+class RepositoryWrapper(BaseRepository[TEntity]):
+    """
+    A base for repository decorators, delegates every call to the wrapped `repository`.
+
+    subclasses override only the operations they decorate,
+    the wrapped repository class (not the wrapper) should still be used as the controller repository type hint.
+    """
+
+    def __init__(self, repository: BaseRepository[TEntity]) -> None:
+        self.repository = repository
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.repository, item)
+
+    async def get(
+        self,
+        identifiers: Union[int, str, Dict[str, Any], tuple],
+        fields: Optional[Iterable["Enum"]] = None,
+        *,
+        should_error: bool = True,
+    ) -> Optional[TEntity]:
+        return await self.repository.get(identifiers, fields, should_error=should_error)
+
+    async def get_many(
+        self,
+        identifiers: Iterable[Union[int, str, Dict[str, Any], tuple]],
+        fields: Optional[Iterable["Enum"]] = None,
+    ) -> List[Optional[TEntity]]:
+        return await self.repository.get_many(identifiers, fields)
+
+    async def list(
+        self,
+        pagination: "AllPaginationStrategies",
+        fields: Optional[Iterable["TModelFields"]] = None,
+        sorting: Optional[List["SortKey"]] = None,
+        filtering: Optional[TEntity] = None,
+    ) -> Any:
+        return await self.repository.list(pagination, fields, sorting, filtering)
+
+    async def count(self, filtering: Optional[TEntity] = None) -> Optional[int]:
+        return await self.repository.count(filtering)
+
+    async def estimate_count(self, filtering: Optional[TEntity] = None) -> Optional[int]:
+        return await self.repository.estimate_count(filtering)
+
+    def cache_scope(self) -> Hashable:
+        return self.repository.cache_scope()
+
+    @property
+    def bulk_concurrency(self) -> Optional[int]:  # type: ignore[override]
+        return self.repository.bulk_concurrency
+
+    def iter_pages(  # type: ignore[override]
+        self,
+        pagination: "CursorPaginationParams",
+        fields: Optional[Iterable["TModelFields"]] = None,
+        sorting: Optional[List["SortKey"]] = None,
+        filtering: Optional[TEntity] = None,
+        *,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        return self.repository.iter_pages(pagination, fields, sorting, filtering, max_items=max_items)
+
+    async def add(self, entity: TEntity) -> TEntity:
+        return await self.repository.add(entity)
+
+    async def update(self, entity: TEntity, **kwargs) -> Optional[TEntity]:
+        return await self.repository.update(entity, **kwargs)
+
+    async def delete(self, entity: Union[TEntity, str, int], **kwargs) -> None:
+        return await self.repository.delete(entity, **kwargs)
+
+    async def bulk_create(self, bulk: List[TEntity]) -> Union["BulkResponseModel", "BulkResultBuilder"]:
+        return await self.repository.bulk_create(bulk)
+
+    async def bulk_delete(self, bulk: List[Union[TEntity, Any]]) -> List:
+        return await self.repository.bulk_delete(bulk)
+
+    async def bulk_update(self, bulk: List[TEntity]) -> List:
+        return await self.repository.bulk_update(bulk)
+
+
+def identifiers_key(identifiers: Union[int, str, Dict[str, Any], tuple]) -> Hashable:
+    """
+    A hashable key of `get` identifiers, scalars are compared by their string value
+    so an id taken from the path matches the id of an entity (e.g. an `ObjectId`).
+    """
+    if isinstance(identifiers, dict):
+        return tuple(sorted((str(k), str(v)) for k, v in identifiers.items()))
+    if isinstance(identifiers, (tuple, list)):
+        return tuple(str(i) for i in identifiers)
+    return str(identifiers)
+
+
+def reusable_fields(fields: Optional[Iterable[Any]]) -> Optional[Iterable[Any]]:
+    """
+    A `get` projection which can be iterated more than once, one-shot iterators are collected in a list,
+    anything else (e.g. a `FieldProjection`) is passed to the repository as is.
+    """
+    return list(fields) if isinstance(fields, Iterator) else fields
+
+
+def fields_key(fields: Optional[Iterable[Any]]) -> Optional[FrozenSet[Any]]:
+    """
+    A hashable, order independent key of a `get` projection.
+    """
+    if fields is None:
+        return None
+    return frozenset(getattr(field, "value", field) for field in fields)
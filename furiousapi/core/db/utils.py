@@ -1,12 +1,15 @@
 import inspect
 import logging
 import sys
+import threading
+from collections import OrderedDict
 from enum import Enum
-from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Hashable,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -16,11 +19,13 @@ from typing import (
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 from fastapi import Query
 from pydantic import BaseConfig, BaseModel, Extra, create_model
 from pydantic.fields import FieldInfo
 
+from furiousapi.core.config import get_settings
 from furiousapi.utils import NOT_SET, NotSet
 
 from .consts import ANNOTATIONS
@@ -35,23 +40,29 @@ logger = logging.getLogger(__name__)
 def get_model_fields(
     model: Type[BaseModel], include: Optional[Set[str]] = None, *, recursive: bool = False
 ) -> Dict[str, str]:
-    keys = {}
-    config = model.Config  # type: ignore[attr-defined]
-    alias_generator = getattr(config, "alias_generator", lambda x: x) or (lambda x: x)
-    for key, value in model.__fields__.items():
-        # if recursive and isinstance(value.type_, GenericAlias) and value.type_.__origin__ is list:
-        #     pass
-        if recursive and issubclass(value.type_, BaseModel):
-            keys.update({key: alias_generator(key)})
-            sub_fields = get_model_fields(value.type_, include, recursive=recursive)
-            for child_key, child_value in sub_fields.items():
-                keys.update({f"{key}.{child_key}": f"{key}.{alias_generator(child_value)}"})
-        else:
-            keys.update({key: alias_generator(key)})
+    metadata = model_metadata.get(model)
+    if not recursive:
+        keys = metadata.fields
+    elif include:
+        keys = _get_recursive_fields(metadata, include)
+    else:
+        keys = metadata.recursive_fields
 
     if include:
         return {k: v for k, v in keys.items() if k in include}
 
+    return dict(keys)
+
+
+def _get_recursive_fields(metadata: "ModelMetadata", include: Optional[Set[str]]) -> Dict[str, str]:
+    keys = {}
+    for key, alias in metadata.fields.items():
+        keys[key] = alias
+        nested = metadata.nested.get(key)
+        if nested is not None:
+            sub_fields = get_model_fields(nested, include, recursive=True)
+            for child_key, child_value in sub_fields.items():
+                keys[f"{key}.{child_key}"] = f"{key}.{metadata.alias_generator(child_value)}"
     return keys
 
 
@@ -97,19 +108,101 @@ class FieldAlias(NamedTuple):
     field: "ModelField"
 
 
-@lru_cache
 def model_alias_mapping(model: Type[BaseModel]) -> Dict[str, FieldAlias]:
-    aliases = {}
-    for k, v in model.__fields__.items():
-        aliases[v.alias] = FieldAlias(k, v)
+    return model_metadata.get(model).aliases
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+class ModelMetadata:
+    """
+    The field metadata of a model, computed once by `ModelMetadataRegistry`.
+
+    fields: field name to alias (through `Config.alias_generator`)
+    aliases: field alias to `FieldAlias`
+    nested: field name to the model of fields typed as a model
+    recursive_fields: `fields` including the dotted paths of the nested models fields, computed on first use
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        config = model.Config  # type: ignore[attr-defined]
+        self.alias_generator = getattr(config, "alias_generator", _identity) or _identity
+        self.fields: Dict[str, str] = {key: self.alias_generator(key) for key in model.__fields__}
+        self.aliases: Dict[str, FieldAlias] = {
+            field.alias: FieldAlias(key, field) for key, field in model.__fields__.items()
+        }
+        self.nested: Dict[str, Type[BaseModel]] = {
+            key: field.type_
+            for key, field in model.__fields__.items()
+            if inspect.isclass(field.type_) and issubclass(field.type_, BaseModel)
+        }
+        self._recursive_fields: Optional[Dict[str, str]] = None
+
+    @property
+    def recursive_fields(self) -> Dict[str, str]:
+        if self._recursive_fields is None:
+            self._recursive_fields = _get_recursive_fields(self, None)
+        return self._recursive_fields
+
+
+class RegistryInfo(NamedTuple):
+    hits: int
+    misses: int
+    current_size: int
+
+
+class ModelMetadataRegistry:
+    """
+    A thread safe registry of `ModelMetadata`, by model.
+
+    models are referenced weakly, so the metadata of dynamic models (e.g. created by :func:`create_subset_model`)
+    is dropped with the model, `registry_info` reports the size for monitoring.
+    """
+
+    def __init__(self) -> None:
+        self._metadata: "WeakKeyDictionary[Type[BaseModel], ModelMetadata]" = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, model: Type[BaseModel]) -> ModelMetadata:
+        with self._lock:
+            metadata = self._metadata.get(model)
+            if metadata is not None:
+                self._hits += 1
+                return metadata
+            self._misses += 1
+
+        metadata = ModelMetadata(model)
+        with self._lock:
+            return self._metadata.setdefault(model, metadata)
+
+    def registry_info(self) -> RegistryInfo:
+        with self._lock:
+            return RegistryInfo(self._hits, self._misses, len(self._metadata))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._metadata.clear()
+            self._hits = 0
+            self._misses = 0
 
-    return aliases
+    def __len__(self) -> int:
+        return len(self._metadata)
+
+    def __contains__(self, model: Type[BaseModel]) -> bool:
+        return model in self._metadata
+
+
+model_metadata = ModelMetadataRegistry()
 
 
 Projection = Dict[str, Union[int, "Projection"]]
 
 
-def create_subset_model(model: Type[BaseModel], projection: Projection) -> Type[BaseModel]:
+def create_subset_model(model: Type[BaseModel], projection: Projection, *, cache: bool = True) -> Type[BaseModel]:
     """
     Create a new Pydantic model that is a subset of the given model, based on a given projection.
 
@@ -130,7 +223,16 @@ def create_subset_model(model: Type[BaseModel], projection: Projection) -> Type[
 
     Also note that any fields in the original model that are not included in the projection will not be included in the
     subset model.
+
+    Subset models are memoized in :data:`subset_model_cache` by ``(model, projection)``,
+    pass ``cache=False`` to always build a new model.
     """
+    if cache:
+        return subset_model_cache.get_or_create(model, projection)
+    return _create_subset_model(model, projection)
+
+
+def _create_subset_model(model: Type[BaseModel], projection: Projection) -> Type[BaseModel]:
     fields: Dict[str, Any] = {}
     alias_mapping = model_alias_mapping(model)
     projection_stack: List[Tuple[Any, Projection, Dict[str, Any]]] = [(model, projection, fields)]
@@ -162,6 +264,94 @@ def create_subset_model(model: Type[BaseModel], projection: Projection) -> Type[
     return create_model(f"Temp{model.__name__}", __config__=config, **fields)  # type: ignore[call-overload]
 
 
+def canonicalize_projection(projection: Projection) -> Tuple[Tuple[str, Hashable], ...]:
+    """
+    Convert a projection into a hashable, order independent key.
+
+    ``{"b": 1, "a": {"c": 1}}`` and ``{"a": {"c": 1}, "b": 1}`` produce the same key.
+    """
+    return tuple(
+        sorted(
+            (str(k), canonicalize_projection(v) if isinstance(v, dict) else v)  # type: ignore[misc]
+            for k, v in projection.items()
+        )
+    )
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+
+
+SubsetModelKey = Tuple[Type[BaseModel], Tuple[Tuple[str, Hashable], ...]]
+
+
+class SubsetModelCache:
+    """
+    A bounded, thread safe LRU cache of subset models created by :func:`create_subset_model`.
+
+    Building a model with :func:`pydantic.create_model` is expensive and every call creates a new class,
+    caching by ``(model, canonical projection)`` makes sure each projection is built only once.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self._models: "OrderedDict[SubsetModelKey, Type[BaseModel]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self, model: Type[BaseModel], projection: Projection) -> Type[BaseModel]:
+        key: SubsetModelKey = (model, canonicalize_projection(projection))
+        with self._lock:
+            subset = self._models.get(key)
+            if subset is not None:
+                self._hits += 1
+                self._models.move_to_end(key)
+                return subset
+            self._misses += 1
+
+        # build outside the lock, creating a model is slow and should not block concurrent hits
+        subset = _create_subset_model(model, projection)
+        with self._lock:
+            subset = self._models.setdefault(key, subset)
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+        return subset
+
+    def warm(self, model: Type[BaseModel], projections: Iterable[Projection]) -> None:
+        """
+        Pre build subset models for projections known in advance, e.g. at application startup.
+        """
+        for projection in projections:
+            self.get_or_create(model, projection)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.max_size, len(self._models))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, item: Tuple[Type[BaseModel], Projection]) -> bool:
+        model, projection = item
+        return (model, canonicalize_projection(projection)) in self._models
+
+
+subset_model_cache = SubsetModelCache(get_settings().cache.subset_models_max_size)
+
+
 def clean_dict(d: dict) -> dict:
     stack: List[Iterator[Tuple[str, Any]]] = [iter(d.items())]
     dict_ = {}
@@ -2,3 +2,9 @@ class FuriousError(Exception): ...
 
 
 class InvalidEnumFieldError(FuriousError): ...
+
+
+class InvalidCursorError(FuriousError): ...
+
+
+class InvalidStreamError(FuriousError): ...
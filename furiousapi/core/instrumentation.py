@@ -0,0 +1,299 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
+from weakref import WeakValueDictionary
+
+from fastapi.routing import APIRoute, request_response
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Tags = Mapping[str, str]
+
+REQUEST_DURATION = "furiousapi.request.duration"
+REQUEST_PHASE_DURATION = "furiousapi.request.phase.duration"
+REQUESTS_IN_FLIGHT = "furiousapi.requests.in_flight"
+REPOSITORY_DURATION = "furiousapi.repository.duration"
+REPOSITORY_CALLS_IN_FLIGHT = "furiousapi.repository.in_flight"
+CONTROLLER_BOOTSTRAP_DURATION = "furiousapi.controller.bootstrap.duration"
+PREFETCH_LOOKUPS = "furiousapi.prefetch.lookups"
+PREFETCH_DISCARDED = "furiousapi.prefetch.discarded"
+
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_ENDPOINT = "endpoint"
+PHASE_REPOSITORY = "repository"
+PHASE_SERIALIZATION = "serialization"
+
+
+class MetricsSink:
+    """
+    Receives the instrumentation metrics, the base class discards them.
+
+    implementations forward them to a metrics backend (prometheus, statsd, ...),
+    durations are in seconds and are reported to `observe` (histograms),
+    in-flight counts and counters (e.g. prefetch hits) to `gauge` as deltas.
+    """
+
+    #: when False routes and repositories are not timed at all
+    enabled: bool = False
+
+    def observe(self, name: str, value: float, tags: Tags) -> None: ...
+
+    def gauge(self, name: str, delta: float, tags: Tags) -> None: ...
+
+
+class RecordingMetricsSink(MetricsSink):
+    """
+    Keeps the metrics in memory, for tests and benchmarks.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.observations: List[Tuple[str, float, Dict[str, str]]] = []
+        self.gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def observe(self, name: str, value: float, tags: Tags) -> None:
+        self.observations.append((name, value, dict(tags)))
+
+    def gauge(self, name: str, delta: float, tags: Tags) -> None:
+        key = name, tuple(sorted(tags.items()))
+        self.gauges[key] = self.gauges.get(key, 0) + delta
+
+    def values(self, name: str, **tags: str) -> List[float]:
+        return [
+            value
+            for name_, value, tags_ in self.observations
+            if name_ == name and all(tags_.get(k) == v for k, v in tags.items())
+        ]
+
+
+_sink: MetricsSink = MetricsSink()
+
+
+def get_metrics_sink() -> MetricsSink:
+    return _sink
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> None:
+    """
+    Set the metrics sink, `None` disables the metrics.
+
+    the `InstrumentedAPIRoute` handlers are rebuilt when the sink is enabled or disabled,
+    so set the sink again after changing its `enabled` flag.
+    """
+    global _sink  # noqa: PLW0603
+    was_enabled = _sink.enabled
+    _sink = sink or MetricsSink()
+    if _sink.enabled != was_enabled:
+        for route in list(_routes.values()):
+            route.rebuild_handler()
+
+
+#: the bootstrap duration (in seconds) of every bootstrapped controller, by its import path
+bootstrap_durations: Dict[str, float] = {}
+
+
+def record_bootstrap(controller: str, duration: float, *, lazy: bool) -> None:
+    """
+    Record the time spent registering the routes of a controller, see `CBVMeta`.
+
+    controllers are usually bootstrapped at import time, before a metrics sink is set,
+    so the durations are also kept in `bootstrap_durations`.
+    """
+    bootstrap_durations[controller] = duration
+    logger.debug("bootstrapped %s in %.3fms (lazy=%s)", controller, duration * 1000, lazy)
+    if _sink.enabled:
+        _sink.observe(CONTROLLER_BOOTSTRAP_DURATION, duration, {"controller": controller, "lazy": str(lazy).lower()})
+
+
+@dataclass
+class RequestTimings:
+    start: float
+    endpoint_start: Optional[float] = None
+    endpoint_end: Optional[float] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, phase: str, duration: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("furiousapi_request_timings", default=None)
+# set while a repository call is timed, so nested calls (wrappers, `super()`) are not counted twice
+_in_repository_call: ContextVar[bool] = ContextVar("furiousapi_in_repository_call", default=False)
+
+
+def detach_request() -> None:
+    """
+    Stop attributing timings to the current request, for background tasks spawned while handling it.
+    """
+    _request_timings.set(None)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Time a block as part of the `name` phase of the current request, a no-op outside an instrumented request.
+    """
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def instrument_repository_method(
+    func: Callable[..., Coroutine[Any, Any, T]], method: Optional[str] = None
+) -> Callable[..., Coroutine[Any, Any, T]]:
+    """
+    Time an async repository method, applied by `RepositoryMeta` to the `BaseRepository` operations.
+    """
+    method = method or func.__name__
+
+    @wraps(func)
+    async def wrapper(self: Any, *args, **kwargs) -> T:
+        sink = _sink
+        if not sink.enabled or _in_repository_call.get():
+            return await func(self, *args, **kwargs)
+
+        tags = {"repository": type(self).__name__, "method": method}
+        token = _in_repository_call.set(True)  # noqa: FBT003
+        sink.gauge(REPOSITORY_CALLS_IN_FLIGHT, 1, tags)
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            _in_repository_call.reset(token)
+            sink.gauge(REPOSITORY_CALLS_IN_FLIGHT, -1, tags)
+            sink.observe(REPOSITORY_DURATION, duration, tags)
+            if (timings := _request_timings.get()) is not None:
+                timings.add(PHASE_REPOSITORY, duration)
+
+    wrapper.__furious_instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _instrument_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    def start() -> None:
+        if (timings := _request_timings.get()) is not None:
+            timings.endpoint_start = time.perf_counter()
+
+    def end() -> None:
+        if (timings := _request_timings.get()) is not None:
+            timings.endpoint_end = time.perf_counter()
+
+    instrumented: Callable[..., Any]
+    if asyncio.iscoroutinefunction(call):
+
+        @wraps(call)
+        async def instrumented(*args, **kwargs) -> Any:
+            start()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                end()
+
+    else:
+
+        @wraps(call)
+        def instrumented(*args, **kwargs) -> Any:
+            start()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                end()
+
+    instrumented.__furious_instrumented__ = True  # type: ignore[attr-defined]
+    return instrumented
+
+
+class InstrumentedAPIRoute(APIRoute):
+    """
+    An `APIRoute` which reports the request duration, split into phases, and the in-flight requests.
+
+    phases:
+        dependencies: parsing the request and resolving the endpoint dependencies
+        endpoint: the endpoint itself, excluding the repository and serialization phases it contains
+        repository: the `BaseRepository` calls
+        serialization: building the response, inside the endpoint (see `phase`) and after it
+
+    the endpoint and the handler are wrapped only while an enabled metrics sink is set, otherwise the route
+    serves requests exactly like an `APIRoute`, see `set_metrics_sink`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        _routes[id(self)] = self
+
+    def rebuild_handler(self) -> None:
+        self.app = request_response(self.get_route_handler())
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        call = self.dependant.call
+        if not _sink.enabled:
+            if getattr(call, "__furious_instrumented__", False):
+                self.dependant.call = call.__wrapped__  # type: ignore[union-attr]
+            return super().get_route_handler()
+
+        if call is not None and not hasattr(call, "__furious_instrumented__"):
+            self.dependant.call = _instrument_endpoint(call)
+        handler = super().get_route_handler()
+        tags = {"route": self.name, "path": self.path_format, "method": ",".join(sorted(self.methods or ()))}
+
+        async def instrumented_handler(request: Request) -> Response:
+            sink = _sink
+            if not sink.enabled:
+                return await handler(request)
+
+            timings = RequestTimings(start=time.perf_counter())
+            token = _request_timings.set(timings)
+            sink.gauge(REQUESTS_IN_FLIGHT, 1, tags)
+            status = "error"
+            try:
+                response = await handler(request)
+                status = str(response.status_code)
+                return response
+            finally:
+                end = time.perf_counter()
+                _request_timings.reset(token)
+                sink.gauge(REQUESTS_IN_FLIGHT, -1, tags)
+                sink.observe(REQUEST_DURATION, end - timings.start, {**tags, "status": status})
+                for name, duration in _get_phases(timings, end).items():
+                    sink.observe(REQUEST_PHASE_DURATION, duration, {**tags, "phase": name})
+
+        return instrumented_handler
+
+
+# routes are not hashable, keyed by their id
+_routes: "WeakValueDictionary[int, InstrumentedAPIRoute]" = WeakValueDictionary()
+
+
+def _get_phases(timings: RequestTimings, end: float) -> Dict[str, float]:
+    phases = dict(timings.phases)
+    if timings.endpoint_start is None:
+        phases[PHASE_DEPENDENCIES] = end - timings.start
+        return phases
+
+    endpoint_end = timings.endpoint_end or end
+    phases[PHASE_DEPENDENCIES] = timings.endpoint_start - timings.start
+    phases[PHASE_ENDPOINT] = max(
+        endpoint_end
+        - timings.endpoint_start
+        - phases.get(PHASE_REPOSITORY, 0.0)
+        - phases.get(PHASE_SERIALIZATION, 0.0),
+        0.0,
+    )
+    phases[PHASE_SERIALIZATION] = phases.get(PHASE_SERIALIZATION, 0.0) + end - endpoint_end
+    return phases
@@ -19,9 +19,12 @@ SETTINGS = get_settings()
 
 class PaginatedResponse(GenericModel, Generic[TEntity]):  # type: ignore[misc]
     total: Optional[int]
+    #: whether `total` is an estimate, see `CountModeEnum`
+    total_estimated: Optional[bool]
     items: List[TEntity]
     index: Optional[int]
     next: Optional[Union[str, int]]
+    prev: Optional[Union[str, int]]
 
     def dict(  # type: ignore[override]
         self,
@@ -77,10 +80,15 @@ class OffsetPaginationParams(BasePaginationParams):
 class CursorPaginationParams(BasePaginationParams):
     type: Literal[PaginationStrategyEnum.CURSOR] = PaginationStrategyEnum.CURSOR
     next_: str = Field(alias="next", description="next record")
+    prev_: str = Field(alias="prev", description="previous record, takes precedence over next")
 
     @property
     def next(self) -> Optional[str]:
         return self.next_
 
+    @property
+    def prev(self) -> Optional[str]:
+        return self.prev_
+
 
 AllPaginationStrategies = Union[CursorPaginationParams, OffsetPaginationParams]
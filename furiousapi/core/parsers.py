@@ -0,0 +1,194 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional
+
+from furiousapi.core.exceptions import InvalidStreamError
+from furiousapi.core.responses import StreamFormatEnum
+
+MAX_ITEM_SIZE = 1024 * 1024
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+# json array parser states
+_START = "start"
+_FIRST_ITEM = "first item"
+_ITEM = "item"
+_SEPARATOR = "separator"
+_END = "end"
+# an escape (a backslash and the escaped character, alone when split across chunks) or a quote, within a string
+_STRING_TOKENS = re.compile(r'\\.?|"', re.DOTALL)
+_CONTAINER_TOKENS = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r"[\s,\]]")
+
+
+def _decode(decoder: codecs.IncrementalDecoder, chunk: bytes, *, final: bool = False) -> str:
+    try:
+        return decoder.decode(chunk, final=final)
+    except UnicodeDecodeError as e:
+        raise InvalidStreamError(f"invalid utf-8: {e.reason}") from e
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes], loads: Callable[[str], Any] = json.loads, max_item_size: int = MAX_ITEM_SIZE
+) -> AsyncIterator[Any]:
+    """
+    Yield the values of a newline delimited JSON stream, blank lines are skipped.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    line_number = 0
+    async for chunk in chunks:
+        text = _decode(decoder, chunk)
+        # only split once a line ends, so a long line is not scanned again for every chunk
+        if "\n" not in text:
+            buffer += text
+            if len(buffer) > max_item_size:
+                raise InvalidStreamError(f"line {line_number + 1} exceeds {max_item_size} characters")
+            continue
+        *lines, buffer = (buffer + text).split("\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield _loads_line(loads, line, line_number)
+        if len(buffer) > max_item_size:
+            raise InvalidStreamError(f"line {line_number + 1} exceeds {max_item_size} characters")
+
+    buffer += _decode(decoder, b"", final=True)
+    if buffer.strip():
+        yield _loads_line(loads, buffer, line_number + 1)
+
+
+def _loads_line(loads: Callable[[str], Any], line: str, line_number: int) -> Any:
+    try:
+        return loads(line)
+    except ValueError as e:
+        raise InvalidStreamError(f"invalid json at line {line_number}: {e}") from e
+
+
+async def iter_json_array(  # noqa: C901, PLR0912, PLR0915
+    chunks: AsyncIterable[bytes], max_item_size: int = MAX_ITEM_SIZE
+) -> AsyncIterator[Any]:
+    """
+    Yield the items of a JSON array as soon as they are fully received.
+
+    only the current (incomplete) item is buffered, so memory is bounded by `max_item_size`.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    json_decoder = json.JSONDecoder()
+    buffer = ""
+    state = _START
+    eof = False
+    scanner: Optional[_ValueScanner] = None
+    iterator = chunks.__aiter__()
+    while True:
+        position = _skip_whitespace(buffer, 0)
+        while position < len(buffer):
+            char = buffer[position]
+            if state == _START:
+                if char != "[":
+                    raise InvalidStreamError("expected a json array")
+                state = _FIRST_ITEM
+                position += 1
+            elif state == _FIRST_ITEM and char == "]":
+                state = _END
+                position += 1
+            elif state in (_FIRST_ITEM, _ITEM):
+                # an incomplete item is decoded again only once it is complete, not for every chunk
+                if scanner is not None and not eof and not scanner.complete(buffer):
+                    break
+                try:
+                    value, end = json_decoder.raw_decode(buffer, position)
+                except ValueError as e:
+                    if eof:
+                        raise InvalidStreamError(f"invalid json: {e}") from e
+                    if scanner is None:
+                        scanner = _ValueScanner(position)
+                    break
+                scanner = None
+                # a value is complete once followed by a delimiter, e.g. "1" may continue as "1.5" in the next chunk
+                if not eof and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    break
+                yield value
+                state = _SEPARATOR
+                position = end
+            elif state == _SEPARATOR and char in ",]":
+                state = _ITEM if char == "," else _END
+                position += 1
+            else:
+                raise InvalidStreamError(f"unexpected {char!r} at json array {state}")
+            position = _skip_whitespace(buffer, position)
+
+        buffer = buffer[position:]
+        if scanner is not None:
+            scanner.shift(position)
+        if len(buffer) > max_item_size:
+            raise InvalidStreamError(f"json array item exceeds {max_item_size} characters")
+        if eof:
+            break
+        try:
+            buffer += _decode(decoder, await iterator.__anext__())
+        except StopAsyncIteration:
+            buffer += _decode(decoder, b"", final=True)
+            eof = True
+
+    if state != _END:
+        raise InvalidStreamError("unexpected end of the json array")
+
+
+class _ValueScanner:
+    """
+    Tells whether the JSON value starting at `start` of a growing buffer is complete,
+    every character is scanned once, whatever the number of chunks the value is received in.
+    """
+
+    __slots__ = ("start", "position", "depth", "in_string", "done")
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.position = start
+        self.depth = 0
+        self.in_string = False
+        self.done = False
+
+    def shift(self, offset: int) -> None:
+        self.start -= offset
+        self.position -= offset
+
+    def complete(self, buffer: str) -> bool:
+        if self.done:
+            return True
+        if buffer[self.start] not in '{["':
+            self.done = _SCALAR_END.search(buffer, self.position) is not None
+            self.position = len(buffer)
+            return self.done
+        position = self.position
+        while not self.done:
+            match = (_STRING_TOKENS if self.in_string else _CONTAINER_TOKENS).search(buffer, position)
+            if match is None or match.group() == "\\":
+                # resume at a backslash split from the character it escapes
+                self.position = len(buffer) if match is None else match.start()
+                return False
+            position = match.end()
+            char = match.group()
+            if char == '"':
+                self.in_string = not self.in_string
+                self.done = not self.in_string and not self.depth
+            elif char in "[{":
+                self.depth += 1
+            elif char in "]}":
+                self.depth -= 1
+                self.done = not self.depth
+        self.position = position
+        return True
+
+
+def _skip_whitespace(buffer: str, position: int) -> int:
+    while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+def iter_items(chunks: AsyncIterable[bytes], format_: StreamFormatEnum) -> AsyncIterator[Any]:
+    if format_ is StreamFormatEnum.NDJSON:
+        return iter_ndjson(chunks)
+    return iter_json_array(chunks)
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import functools
 import typing
+import uuid
+from datetime import date, time
 from enum import Enum
-from typing import TYPE_CHECKING, Annotated, List, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+)
 
 from beanie import PydanticObjectId  # noqa: TCH002
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from furiousapi.core.db.models import json_dumps_bytes
+from furiousapi.core.exceptions import FuriousError
 
 if TYPE_CHECKING:
+    from pydantic.typing import AbstractSetIntStr, MappingIntStrAny
     from starlette.background import BackgroundTask
+    from starlette.types import Receive, Scope, Send
 
 
 class PartialModelResponse(JSONResponse):
@@ -21,11 +40,175 @@ class PartialModelResponse(JSONResponse):
         headers: typing.Optional[typing.Dict[str, str]] = None,
         media_type: typing.Optional[str] = None,
         background: typing.Optional[BackgroundTask] = None,
+        *,
+        include: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
     ) -> None:
-        content = jsonable_encoder(content, by_alias=True)
+        content = jsonable_encoder(content, by_alias=True, include=include)
         super().__init__(content, status_code, headers, media_type, background)
 
 
+#: the types `json_dumps_bytes` (orjson) serializes natively, without calling the `default` json encoder
+NATIVE_JSON_TYPES = (str, int, float, dict, list, tuple, date, time, uuid.UUID, Enum)
+
+
+@functools.lru_cache(maxsize=None)
+def encodes_native_types(model: Type[BaseModel]) -> bool:
+    """
+    Whether the `json_encoders` of a model override types `json_dumps_bytes` serializes natively.
+    """
+    return any(
+        isinstance(type_, type) and issubclass(type_, NATIVE_JSON_TYPES) for type_ in model.__config__.json_encoders
+    )
+
+
+def dump_model(
+    model: BaseModel,
+    *,
+    by_alias: bool = True,
+    exclude_none: bool = False,
+    include: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
+) -> bytes:
+    """
+    Dump a model to JSON bytes with the `json_dumps_bytes` hook of its config and its own json encoder.
+
+    a model whose `json_encoders` override natively serialized types (e.g. `datetime`) is walked
+    by `jsonable_encoder` instead, as by `PartialModelResponse`, so its encoders still apply.
+    like `jsonable_encoder`, only the encoders of the dumped model apply, not the ones of its nested models.
+    """
+    if encodes_native_types(type(model)):
+        encoded = jsonable_encoder(model, by_alias=by_alias, exclude_none=exclude_none, include=include)
+        return json_dumps_bytes(encoded)
+    dumps = getattr(model.__config__, "json_dumps_bytes", json_dumps_bytes)
+    data = model.dict(by_alias=by_alias, exclude_none=exclude_none, include=include)
+    return dumps(data, default=model.__json_encoder__)
+
+
+class ModelResponse(Response):
+    """
+    Serializes a pydantic model straight to JSON bytes.
+
+    unlike `PartialModelResponse` the model is not walked by `jsonable_encoder` before being serialized,
+    it is dumped with the `json_dumps_bytes` hook of its config (orjson when available)
+    and the model's own json encoder for types the hook does not support, see `dump_model`.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Optional[BaseModel],
+        status_code: int = 200,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        media_type: typing.Optional[str] = None,
+        background: typing.Optional[BackgroundTask] = None,
+        *,
+        by_alias: bool = True,
+        exclude_none: bool = False,
+        include: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
+    ) -> None:
+        self.by_alias = by_alias
+        self.exclude_none = exclude_none
+        self.include = include
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if not isinstance(content, BaseModel):
+            return json_dumps_bytes(jsonable_encoder(content, by_alias=self.by_alias, exclude_none=self.exclude_none))
+
+        return dump_model(content, by_alias=self.by_alias, exclude_none=self.exclude_none, include=self.include)
+
+
+class StreamFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    JSON = "json"
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self is StreamFormatEnum.NDJSON else "application/json"
+
+
+STREAM_META_KEY = "$meta"
+
+
+async def stream_pages(
+    pages: AsyncIterator[Any],
+    format_: StreamFormatEnum,
+    include: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Encode pages (`PaginatedResponse` like objects) item by item, projecting every item with `include`.
+
+    ndjson: one item per line, the last line is ``{"$meta": {"next": <cursor>, "count": <items>}}``.
+    json: ``{"items": [...], "next": <cursor>, "count": <items>}`` written in chunks.
+    """
+    ndjson = format_ is StreamFormatEnum.NDJSON
+    count = 0
+    next_ = None
+    if not ndjson:
+        yield b'{"items":['
+
+    async for page in pages:
+        chunk = bytearray()
+        for item in page.items:
+            if ndjson:
+                chunk += dump_model(item, include=include) + b"\n"
+            else:
+                chunk += (b"," if count else b"") + dump_model(item, include=include)
+            count += 1
+        next_ = page.next
+        if chunk:
+            yield bytes(chunk)
+
+    meta = {"next": next_, "count": count}
+    if ndjson:
+        yield json_dumps_bytes({STREAM_META_KEY: meta}) + b"\n"
+    else:
+        yield b"]," + json_dumps_bytes(meta)[1:]
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """
+    A `StreamingResponse` whose body iterator reads the request body while the response is sent.
+
+    `StreamingResponse` listens for the client disconnect by consuming `receive`,
+    which would steal the request body messages, here `Request.stream` is the only consumer.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def stream_bulk_results(results: AsyncIterator[List[Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode per item bulk results as ndjson, chunk by chunk.
+
+    the last line is ``{"$meta": {"count": <items>, "has_errors": <bool>, "error": <message>}}``,
+    `error` is set when the bulk was aborted (e.g. invalid body), `count` items were processed before it,
+    every item submitted to the repository is reported before the `$meta` line.
+    """
+    count = 0
+    has_errors = False
+    error = None
+    try:
+        async for items in results:
+            chunk = bytearray()
+            for item in items:
+                if isinstance(item, BulkItemError):
+                    has_errors = True
+                chunk += (
+                    dump_model(item) if isinstance(item, BaseModel) else json_dumps_bytes(jsonable_encoder(item))
+                ) + b"\n"
+            count += len(items)
+            yield bytes(chunk)
+    except FuriousError as e:
+        has_errors = True
+        error = str(e)
+
+    yield json_dumps_bytes({STREAM_META_KEY: {"count": count, "has_errors": has_errors, "error": error}}) + b"\n"
+
+
 class BulkItemStatusEnum(str, Enum):
     OK = "OK"
     ERROR = "ERROR"
@@ -53,3 +236,125 @@ BulkItemResult = Annotated[BulkResponseModelUnion, Field(discriminator="status")
 class BulkResponseModel(BaseModel):
     items: List[BulkItemResult]
     has_errors: bool = False
+
+
+class BulkIndexedItemError(BulkItemError):
+    index: int
+
+
+class BulkErrorsResponseModel(BaseModel):
+    """
+    The "errors only" form of `BulkResponseModel`, `index` is the position of the item in the bulk.
+    """
+
+    errors: List[BulkIndexedItemError]
+    count: int
+    has_errors: bool = False
+
+
+class BulkResultBuilder:
+    """
+    A compact `BulkResponseModel`, statuses, ids and error messages are stored in parallel arrays.
+
+    results are rendered straight to the `BulkResponseModel` (or `BulkErrorsResponseModel`) wire format
+    without building a model per item, use `to_model` where a `BulkResponseModel` is needed.
+    """
+
+    __slots__ = ("_ok", "_values", "error_count")
+
+    def __init__(self) -> None:
+        self._ok = bytearray()
+        #: the id of a success or the message of an error
+        self._values: List[Any] = []
+        self.error_count = 0
+
+    @classmethod
+    def from_model(cls, model: BulkResponseModel) -> BulkResultBuilder:
+        builder = cls()
+        builder.extend(model)
+        return builder
+
+    def add_success(self, id_: Any) -> None:
+        self._ok.append(1)
+        self._values.append(id_)
+
+    def add_error(self, message: str, count: int = 1) -> None:
+        self._ok.extend(b"\0" * count)
+        self._values.extend([message] * count)
+        self.error_count += count
+
+    def extend(self, other: Union[BulkResultBuilder, BulkResponseModel]) -> None:
+        if isinstance(other, BulkResultBuilder):
+            self._ok += other._ok  # noqa: SLF001
+            self._values += other._values  # noqa: SLF001
+            self.error_count += other.error_count
+            return
+        for item in other.items:
+            if isinstance(item, BulkItemError):
+                self.add_error(item.message)
+            else:
+                self.add_success(item.id)
+
+    @property
+    def has_errors(self) -> bool:
+        return self.error_count > 0
+
+    def __len__(self) -> int:
+        return len(self._ok)
+
+    def to_dict(self, *, errors_only: bool = False) -> Dict[str, Any]:
+        ok, error = BulkItemStatusEnum.OK.value, BulkItemStatusEnum.ERROR.value
+        if errors_only:
+            errors = [
+                {"status": error, "message": value, "index": index}
+                for index, (is_ok, value) in enumerate(zip(self._ok, self._values))
+                if not is_ok
+            ]
+            return {"errors": errors, "count": len(self), "has_errors": self.has_errors}
+        items = [
+            {"status": ok, "id": value} if is_ok else {"status": error, "message": value}
+            for is_ok, value in zip(self._ok, self._values)
+        ]
+        return {"items": items, "has_errors": self.has_errors}
+
+    def render(self, *, errors_only: bool = False) -> bytes:
+        # ids which are not json types (e.g. `ObjectId`) are rendered as strings
+        return json_dumps_bytes(self.to_dict(errors_only=errors_only), default=str)
+
+    def to_model(self) -> BulkResponseModel:
+        items = [
+            (
+                BulkItemSuccess.construct(status=BulkItemStatusEnum.OK, id=value)
+                if is_ok
+                else BulkItemError.construct(status=BulkItemStatusEnum.ERROR, message=value)
+            )
+            for is_ok, value in zip(self._ok, self._values)
+        ]
+        return BulkResponseModel.construct(items=items, has_errors=self.has_errors)
+
+
+class BulkResultResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Union[BulkResultBuilder, BulkResponseModel],
+        status_code: int = 200,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        media_type: typing.Optional[str] = None,
+        background: typing.Optional[BackgroundTask] = None,
+        *,
+        errors_only: bool = False,
+        response_model: Type[BulkResponseModel] = BulkResponseModel,
+    ) -> None:
+        self.errors_only = errors_only
+        self.response_model = response_model
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Union[BulkResultBuilder, BulkResponseModel]) -> bytes:
+        if isinstance(content, BulkResponseModel):
+            content = BulkResultBuilder.from_model(content)
+        if self.errors_only or self.response_model is BulkResponseModel:
+            return content.render(errors_only=self.errors_only)
+        # a custom response model may add fields, it is built from the wire format
+        return dump_model(self.response_model.parse_obj(content.to_dict()))
@@ -1,3 +1,6 @@
+import asyncio
+import json
+import threading
 import uuid
 from enum import Enum
 from http import HTTPStatus
@@ -11,6 +14,7 @@ from typing import (
     Optional,
     Type,
     Union,
+    cast,
 )
 
 import pytest
@@ -18,14 +22,36 @@ from fastapi import APIRouter, FastAPI, Query
 from fastapi.params import Depends
 from pydantic import BaseModel, Field
 from pydantic.main import ModelMetaclass
+from starlette.responses import JSONResponse
 from starlette.testclient import TestClient
 
-from furiousapi.core.api.controllers import CBV, ModelController, action
+from furiousapi.core.api.controllers import (
+    CBV,
+    ModelController,
+    BulkCreateModelMixin,
+    BulkDeleteModelMixin,
+    BulkUpdateModelMixin,
+    StreamBulkCreateModelMixin,
+    StreamListModelMixin,
+    action,
+)
+from furiousapi.core.api.controllers.base import LazyAPIRouter, introspect
+from furiousapi.core.api.controllers.mixins import BaseRouteMixin
+from furiousapi.core.db.bulk import CHUNK_FAILED_MESSAGE, BulkExecutor
 from furiousapi.core.db.fields import SortableFieldEnum
+from furiousapi.core.db.memory import InMemoryRepository
+from furiousapi.core.db.metaclasses import compiled_model_query
 from furiousapi.core.db.models import FuriousPydanticConfig
+from furiousapi.core.db.prefetch import PagePrefetcher
 from furiousapi.core.db.repository import BaseRepository, RepositoryConfig
-from furiousapi.core.pagination import AllPaginationStrategies, PaginatedResponse
-from furiousapi.core.responses import BulkResponseModel
+from furiousapi.core.exceptions import FuriousError, InvalidCursorError
+from furiousapi.core.instrumentation import bootstrap_durations
+from furiousapi.core.pagination import (
+    AllPaginationStrategies,
+    CursorPaginationParams,
+    PaginatedResponse,
+)
+from furiousapi.core.responses import BulkItemSuccess, BulkResponseModel
 from furiousapi.core.types import TEntity, TModelFields
 
 if TYPE_CHECKING:
@@ -234,6 +260,50 @@ async def test_app():
     assert list_response.json()["items"][0] == model.dict(by_alias=True)
 
 
+def test_app__fields_project_the_response():
+    app = FastAPI()
+    app.include_router(MyController.api_router)
+    client = TestClient(app)
+    doc = client.post("/", json={"my_param": "projected"}).json()
+
+    assert client.get(f"/{doc['_id']}", params={"fields": "my_param"}).json() == {"my_param": "projected"}
+    page = client.get("/", params={"fields": "my_param"}).json()
+    assert {"my_param": "projected"} in page["items"]
+    assert all(set(item) == {"my_param"} for item in page["items"])
+
+
+class MyJSONController(ModelController):
+    repository: Depends = Depends(repository_dependency)
+    model_response_class = JSONResponse
+    __enabled_routes__ = ("get", "list", "create")
+
+
+def test_app__fields_project_a_plain_json_response():
+    app = FastAPI()
+    app.include_router(MyJSONController.api_router)
+    client = TestClient(app)
+    doc = client.post("/", json={"my_param": "projected"}).json()
+
+    assert client.get(f"/{doc['_id']}", params={"fields": "my_param"}).json() == {"my_param": "projected"}
+    page = client.get("/", params={"fields": "my_param"}).json()
+    assert all(set(item) == {"my_param"} for item in page["items"])
+    assert client.get(f"/{doc['_id']}").json() == doc
+
+
+def test_app__count_mode():
+    app = FastAPI()
+    app.include_router(MyController.api_router)
+    client = TestClient(app)
+
+    page = client.get("/", params={"count": "none"}).json()
+    assert page["total"] is None
+    page = client.get("/").json()
+    assert page["total"] == len(page["items"])
+    # the repository can't count, the total of its page is kept
+    page = client.get("/", params={"count": "exact"}).json()
+    assert (page["total"], page["total_estimated"]) == (len(page["items"]), None)
+
+
 def test_api_router():
     assert id(MyController.api_router) != id(MyController2.api_router)
 
@@ -248,3 +318,396 @@ def test_controller_no_overlapped_mixin():
     routes = [i.name for i in MyController.api_router.routes]
     duplicates = {x for x in routes if routes.count(x) > 1}
     assert not duplicates
+
+
+def test_introspect__is_computed_once_per_class():
+    introspection = introspect(MyController)
+    assert introspect(MyController) is introspection
+    assert set(introspection.dependencies) == {"repository"}
+    assert [name for name, _ in introspect(MyCBV).routes] == ["endpoint1", "endpoint2"]
+
+
+class MyLazyController(ModelController):
+    repository: Depends = Depends(repository_dependency)
+    __enabled_routes__ = ("get", "list")
+    __lazy_bootstrap__ = True
+
+
+class MyLazyInitController(ModelController):
+    repository: Depends = Depends(repository_dependency)
+    __enabled_routes__ = ("get",)
+    __lazy_bootstrap__ = True
+
+
+def test_lazy_bootstrap__controller_can_be_instantiated_before_the_routes_are_registered():
+    controller = MyLazyInitController(repository=repository)  # type: ignore[call-arg]
+
+    assert controller.repository is repository
+    assert MyLazyInitController.api_router.pending
+    assert [route.name for route in MyLazyInitController.api_router.routes] == ["get"]
+
+
+class MyLazyCBV(CBV):
+    api_router = LazyAPIRouter(prefix="/cbv")
+    __lazy_bootstrap__ = True
+
+    @action("/lazy")
+    def lazy(self):
+        pass
+
+
+def test_lazy_bootstrap__routes_are_registered_on_first_use():
+    assert isinstance(MyLazyController.api_router, LazyAPIRouter)
+    assert MyLazyController.api_router.pending
+
+    app = FastAPI()
+    app.include_router(MyLazyController.api_router)
+
+    assert not MyLazyController.api_router.pending
+    assert sorted(route.name for route in MyLazyController.api_router.routes) == ["get", "list"]
+    assert f"{__name__}.MyLazyController" in bootstrap_durations
+    assert TestClient(app).get("/").status_code == HTTPStatus.OK
+
+
+def test_lazy_bootstrap__when_lazy_router_given__then_use_it():
+    assert MyLazyCBV.api_router.pending
+    assert [route.path for route in MyLazyCBV.api_router.routes] == ["/cbv/lazy"]
+    assert not MyLazyCBV.api_router.defer(lambda: None)
+
+
+class MissingEndpointMixin(BaseRouteMixin):
+    __method_name__ = "missing"
+
+    def __bootstrap__(cls, **kwargs) -> None:  # noqa: N805
+        pass
+
+
+class MyBrokenLazyCBV(CBV, MissingEndpointMixin):
+    api_router = LazyAPIRouter()
+    __lazy_bootstrap__ = True
+
+    @action("/broken")
+    def broken(self):
+        pass
+
+
+def test_lazy_bootstrap__when_bootstrap_fails__then_it_fails_on_every_access():
+    for _ in range(2):
+        with pytest.raises(FuriousError, match="endpoint missing must be defined"):
+            FastAPI().include_router(MyBrokenLazyCBV.api_router)
+        assert MyBrokenLazyCBV.api_router.pending
+    assert not MyBrokenLazyCBV.api_router._routes  # noqa: SLF001
+
+
+class PagingRepository(InMemoryDBRepository[MyModel]):  # type: ignore[type-arg]
+    Config = MyRepository.Config
+
+    async def list(
+        self,
+        pagination: AllPaginationStrategies,
+        fields: Optional[Iterable[TModelFields]] = None,  # noqa: ARG002
+        sorting: Optional[List[SortableFieldEnum]] = None,  # noqa: ARG002
+        filtering: Optional[TEntity] = None,  # noqa: ARG002
+    ) -> PaginatedResponse[TEntity]:
+        pagination = cast(CursorPaginationParams, pagination)
+        cursor = pagination.prev or pagination.next or "0"
+        if not cursor.isdigit():
+            raise InvalidCursorError("invalid_cursor")
+        start = max(int(cursor) - pagination.limit, 0) if pagination.prev else int(cursor)
+        items = list(self._store.values())[start : start + pagination.limit]
+        end = start + len(items)
+        return PaginatedResponse[TEntity](items=items, next=str(end) if end < len(self._store) else None)
+
+
+paging_repository = PagingRepository()
+
+
+def paging_repository_dependency() -> PagingRepository:
+    return paging_repository
+
+
+class MyStreamController(ModelController, StreamListModelMixin):
+    repository: Depends = Depends(paging_repository_dependency)
+    __enabled_routes__ = ("stream",)
+
+
+@pytest.mark.parametrize(
+    ("params", "expected_count", "expected_next"),
+    [({"limit": 2}, 5, None), ({"limit": 2, "max_items": 3}, 3, "3"), ({"limit": 2, "next": "4"}, 1, None)],
+)
+def test_stream__ndjson(params: dict, expected_count: int, expected_next: Optional[str]):
+    paging_repository._store = {str(i): MyModel(_id=str(i), my_param=str(i)) for i in range(5)}  # noqa: SLF001
+    app = FastAPI()
+    app.include_router(MyStreamController.api_router)
+
+    response = TestClient(app).get("/stream", params=params)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    *items, meta = (json.loads(line) for line in response.text.splitlines())
+    assert meta == {"$meta": {"next": expected_next, "count": expected_count}}
+    start = int(params.get("next", 0))
+    assert [item["_id"] for item in items] == [str(i) for i in range(start, start + expected_count)]
+
+
+def test_stream__from_a_prev_cursor_continues_forward():
+    paging_repository._store = {str(i): MyModel(_id=str(i), my_param=str(i)) for i in range(5)}  # noqa: SLF001
+    app = FastAPI()
+    app.include_router(MyStreamController.api_router)
+
+    response = TestClient(app).get("/stream", params={"limit": 2, "prev": "4"})
+    *items, meta = (json.loads(line) for line in response.text.splitlines())
+    assert [item["_id"] for item in items] == ["2", "3", "4"]
+    assert meta == {"$meta": {"next": None, "count": 3}}
+
+
+def test_stream__when_invalid_cursor__then_bad_request():
+    app = FastAPI()
+    app.include_router(MyStreamController.api_router)
+
+    response = TestClient(app).get("/stream", params={"next": "forged"})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+class CountingRepository(InMemoryDBRepository[MyModel]):  # type: ignore[type-arg]
+    class Config(MyRepository.Config):
+        model_to_query = staticmethod(compiled_model_query)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # set from the event loop thread of the test client
+        self.count_cancelled = threading.Event()
+        self.block_count = False
+
+    async def list(self, *args, **kwargs) -> PaginatedResponse[MyModel]:
+        # let the count start
+        await asyncio.sleep(0)
+        return await PagingRepository.list(self, *args, **kwargs)
+
+    async def count(self, filtering: Optional[MyModel] = None) -> int:  # noqa: ARG002
+        try:
+            if self.block_count:
+                await asyncio.Event().wait()
+            return len(self._store)
+        except asyncio.CancelledError:
+            self.count_cancelled.set()
+            raise
+
+
+counting_repository = CountingRepository()
+
+
+def counting_repository_dependency() -> CountingRepository:
+    return counting_repository
+
+
+class MyCountingController(ModelController):
+    repository: Depends = Depends(counting_repository_dependency)
+    page_prefetcher = PagePrefetcher()
+    __enabled_routes__ = ("list", "create")
+
+
+def app_of(controller: Type[CBV]) -> FastAPI:
+    app = FastAPI()
+    # the routes themselves, `include_router` rebuilds them from the endpoints shared by the controllers
+    app.router.routes.extend(controller.api_router.routes)
+    return app
+
+
+def test_list__when_written__then_cached_count_is_invalidated():
+    client = TestClient(app_of(MyCountingController))
+
+    assert client.get("/", params={"count": "cached"}).json()["total_estimated"] is False
+    assert client.get("/", params={"count": "cached"}).json()["total_estimated"] is True
+    client.post("/", json={"my_param": "counted"})
+
+    page = client.get("/", params={"count": "cached"}).json()
+    assert (page["total"], page["total_estimated"]) == (len(counting_repository._store), False)  # noqa: SLF001
+
+
+def test_list__when_written__then_prefetched_pages_are_invalidated():
+    prefetcher = cast(PagePrefetcher, MyCountingController.page_prefetcher)
+    # a single event loop, the prefetch is bound to the loop of the request which started it
+    with TestClient(app_of(MyCountingController)) as client:
+        for _ in range(2):
+            client.post("/", json={"my_param": "prefetched"})
+        client.get("/", params={"limit": 1})
+        assert prefetcher.stats.size == 1
+
+        client.post("/", json={"my_param": "prefetched"})
+        assert (prefetcher.stats.size, prefetcher.stats.discarded) == (0, 1)
+
+
+def test_list__when_page_fails__then_count_is_cancelled():
+    counting_repository.block_count = True
+    try:
+        with TestClient(app_of(MyCountingController)) as client:
+            response = client.get("/", params={"count": "exact", "next": "forged"})
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+            assert counting_repository.count_cancelled.wait(1)
+    finally:
+        counting_repository.block_count = False
+
+
+def test_stream__json():
+    paging_repository._store = {str(i): MyModel(_id=str(i), my_param=str(i)) for i in range(3)}  # noqa: SLF001
+    app = FastAPI()
+    app.include_router(MyStreamController.api_router)
+
+    response = TestClient(app).get("/stream", params={"limit": 2, "format": "json"})
+    assert response.json() == {
+        "items": [{"_id": str(i), "my_param": str(i)} for i in range(3)],
+        "next": None,
+        "count": 3,
+    }
+
+
+class Note(BaseModel):
+    id: Optional[str]
+    text: str
+
+
+class NoteRepository(InMemoryRepository[Note]):  # type: ignore[misc]
+    async def bulk_update(self, bulk: List[Note]) -> List:
+        if any(note.text == "fail" for note in bulk):
+            raise RuntimeError("unavailable")
+        return await super().bulk_update(bulk)
+
+
+note_repository = NoteRepository([])
+
+
+def note_repository_dependency() -> NoteRepository:
+    return note_repository
+
+
+class MyNoteBulkController(ModelController, BulkUpdateModelMixin, BulkDeleteModelMixin):
+    repository: Depends = Depends(note_repository_dependency)
+    bulk_executor = BulkExecutor(chunk_size=1)
+    __enabled_routes__ = ("bulk_update", "bulk_delete")
+
+
+def test_stream__fields_project_the_items():
+    paging_repository._store = {str(i): MyModel(_id=str(i), my_param=str(i)) for i in range(3)}  # noqa: SLF001
+    app = FastAPI()
+    app.include_router(MyStreamController.api_router)
+
+    response = TestClient(app).get("/stream", params={"fields": "my_param"})
+    *items, _ = (json.loads(line) for line in response.text.splitlines())
+    assert items == [{"my_param": str(i)} for i in range(3)]
+
+
+class BulkRepository(InMemoryDBRepository[MyModel]):  # type: ignore[type-arg]
+    Config = MyRepository.Config
+
+    async def bulk_create(self, bulk: List[MyModel]) -> BulkResponseModel:
+        return BulkResponseModel(items=[BulkItemSuccess(id=(await self.add(entity)).id) for entity in bulk])
+
+
+bulk_repository = BulkRepository()
+
+
+def bulk_repository_dependency() -> BulkRepository:
+    return bulk_repository
+
+
+class MyStreamBulkController(ModelController, StreamBulkCreateModelMixin):
+    repository: Depends = Depends(bulk_repository_dependency)
+    __enabled_routes__ = ("bulk_create_stream",)
+
+
+class MyBulkResponseModel(BulkResponseModel):
+    source: str = "api"
+
+
+class MyBulkController(ModelController, BulkCreateModelMixin):
+    repository: Depends = Depends(bulk_repository_dependency)
+    bulk_response_model = MyBulkResponseModel
+    __enabled_routes__ = ("bulk_create",)
+
+
+def test_bulk_create__renders_through_the_bulk_response_model():
+    bulk_repository._store = {}  # noqa: SLF001
+    app = FastAPI()
+    app.include_router(MyBulkController.api_router)
+    client = TestClient(app)
+
+    body = client.post("/bulk", json=[{"my_param": "0"}]).json()
+    assert body == {"items": [{"status": "OK", "id": body["items"][0]["id"]}], "has_errors": False, "source": "api"}
+    assert client.post("/bulk", params={"errors_only": True}, json=[{"my_param": "1"}]).json() == {
+        "errors": [],
+        "count": 1,
+        "has_errors": False,
+    }
+    schemas = app.openapi()["components"]["schemas"]
+    assert {"MyBulkResponseModel", "BulkErrorsResponseModel", "BulkIndexedItemError"} <= set(schemas)
+
+
+@pytest.mark.parametrize(
+    ("body", "content_type"),
+    [
+        ('{"my_param": "0"}\n{"other": 1}\n\n{"my_param": "2"}\n', "application/x-ndjson"),
+        ('[{"my_param": "0"}, {"other": 1}, {"my_param": "2"}]', "application/json"),
+    ],
+)
+def test_stream_bulk_create(body: str, content_type: str):
+    bulk_repository._store = {}  # noqa: SLF001
+    app = FastAPI()
+    app.include_router(MyStreamBulkController.api_router)
+
+    response = TestClient(app).post("/bulk/stream", content=body, headers={"content-type": content_type})
+    assert response.status_code == HTTPStatus.OK
+    *items, meta = (json.loads(line) for line in response.text.splitlines())
+    assert [item["status"] for item in items] == ["OK", "ERROR", "OK"]
+    assert [item["id"] for item in items if "id" in item] == list(bulk_repository._store)  # noqa: SLF001
+    assert meta == {"$meta": {"count": 3, "has_errors": True, "error": None}}
+
+
+def test_stream_bulk_create__when_invalid_body__then_error_in_meta():
+    app = FastAPI()
+    app.include_router(MyStreamBulkController.api_router)
+
+    response = TestClient(app).post("/bulk/stream", content='[{"my_param": "0"} {')
+    assert json.loads(response.text.splitlines()[-1])["$meta"]["error"].startswith("unexpected '{'")
+
+
+def test_stream_bulk_create__when_invalid_utf8__then_error_in_meta():
+    app = FastAPI()
+    app.include_router(MyStreamBulkController.api_router)
+
+    response = TestClient(app).post(
+        "/bulk/stream",
+        content=b'{"my_param": "0"}\n{"my_param": "\xff"}\n',
+        headers={"content-type": "application/x-ndjson"},
+    )
+    meta = json.loads(response.text.splitlines()[-1])["$meta"]
+    assert meta["error"].startswith("invalid utf-8")
+    assert meta["count"] == 0
+
+
+@pytest.fixture()
+def notes_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setitem(globals(), "note_repository", NoteRepository([Note(id="1", text="a"), Note(id="2", text="b")]))
+    return TestClient(app_of(MyNoteBulkController))
+
+
+def test_bulk_update__missing_and_failed_items_are_reported(notes_client: TestClient):
+    body = [{"id": "1", "text": "c"}, {"id": "3", "text": "d"}, {"id": "2", "text": "fail"}]
+
+    response = notes_client.put("/bulk", json=body)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == [
+        {"id": "1", "text": "c"},
+        {"status": "ERROR", "message": "entity 3 was not found"},
+        {"status": "ERROR", "message": CHUNK_FAILED_MESSAGE},
+    ]
+
+
+def test_bulk_update__when_duplicate_ids__then_bad_request(notes_client: TestClient):
+    response = notes_client.put("/bulk", json=[{"id": "1", "text": "c"}, {"id": "1", "text": "d"}])
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_bulk_delete__missing_items_are_reported(notes_client: TestClient):
+    response = notes_client.request("DELETE", "/bulk", json=["1", "3"])
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == ["1", {"status": "ERROR", "message": "entity 3 was not found"}]
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+from typing import Iterator
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from furiousapi.core.instrumentation import (
+    REPOSITORY_DURATION,
+    REQUEST_DURATION,
+    REQUEST_PHASE_DURATION,
+    RecordingMetricsSink,
+    set_metrics_sink,
+)
+from tests.core.test_controllers import MyController, MyModel, repository
+
+
+@pytest.fixture()
+def sink() -> Iterator[RecordingMetricsSink]:
+    sink = RecordingMetricsSink()
+    set_metrics_sink(sink)
+    yield sink
+    set_metrics_sink(None)
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(MyController.api_router)
+    return TestClient(app)
+
+
+def test_instrumentation__records_request_phases_and_repository_calls(sink: RecordingMetricsSink, client: TestClient):
+    repository._store = {"1": MyModel(_id="1", my_param="1")}  # noqa: SLF001
+    assert client.get("/1").status_code == HTTPStatus.OK
+
+    [duration] = sink.values(REQUEST_DURATION, route="get", status="200")
+    phases = {tags["phase"]: value for name, value, tags in sink.observations if name == REQUEST_PHASE_DURATION}
+    assert set(phases) == {"dependencies", "endpoint", "repository", "serialization"}
+    assert sum(phases.values()) == pytest.approx(duration, abs=1e-3)
+    assert len(sink.values(REPOSITORY_DURATION, method="get")) == 1
+    assert set(sink.gauges.values()) == {0}
+
+
+def test_instrumentation__when_failed__then_status_error(sink: RecordingMetricsSink, client: TestClient):
+    with pytest.raises(AttributeError):
+        client.delete("/missing")
+    assert len(sink.values(REQUEST_DURATION, route="delete", status="error")) == 1
+    assert set(sink.gauges.values()) == {0}
+
+
+def test_instrumentation__when_disabled__then_nothing_recorded(client: TestClient):
+    sink = RecordingMetricsSink()
+    sink.enabled = False
+    set_metrics_sink(sink)
+    try:
+        client.get("/")
+    finally:
+        set_metrics_sink(None)
+    assert not sink.observations
+
+
+def test_instrumentation__when_disabled__then_endpoints_not_wrapped(client: TestClient):
+    route = next(route for route in client.app.routes if getattr(route, "name", None) == "get")
+    assert not hasattr(route.dependant.call, "__furious_instrumented__")
+
+    sink = RecordingMetricsSink()
+    set_metrics_sink(sink)
+    try:
+        assert route.dependant.call.__furious_instrumented__
+        repository._store = {"1": MyModel(_id="1", my_param="1")}  # noqa: SLF001
+        assert client.get("/1").status_code == HTTPStatus.OK
+    finally:
+        set_metrics_sink(None)
+    assert len(sink.values(REQUEST_DURATION, route="get", status="200")) == 1
+    assert not hasattr(route.dependant.call, "__furious_instrumented__")
@@ -0,0 +1,60 @@
+import json
+from typing import Any, AsyncIterator, Callable, List
+
+import pytest
+
+from furiousapi.core.exceptions import InvalidStreamError
+from furiousapi.core.parsers import iter_json_array, iter_ndjson
+
+ITEMS = [{"a": 1, "b": "ü"}, 12345, "x,]", [1, [2]], None, 1.5]
+
+
+async def feed(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def collect(items: AsyncIterator[Any]) -> List[Any]:
+    return [item async for item in items]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("size", [1, 3, 1000])
+async def test_iter_json_array__any_chunking(size: int):
+    data = b' [ {"a": 1, "b": "\xc3\xbc"}, 12345 ,"x,]",[1, [2]], null, 1.5 ] \n'
+    assert [item async for item in iter_json_array(feed(data, size))] == ITEMS
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("size", [1, 3, 1000])
+async def test_iter_ndjson__any_chunking(size: int):
+    data = b'{"a": 1, "b": "\xc3\xbc"}\n12345\n"x,]"\n\n[1, [2]]\nnull\r\n1.5'
+    assert [item async for item in iter_ndjson(feed(data, size))] == ITEMS
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("data", [b"", b"{}", b"[1,]", b"[1 2]", b"[1", b"[] 1", b'["abc'])
+async def test_iter_json_array__when_invalid__then_raise(data: bytes):
+    with pytest.raises(InvalidStreamError):
+        await collect(iter_json_array(feed(data, 2)))
+
+
+@pytest.mark.asyncio()
+async def test_iter_json_array__when_item_too_large__then_raise():
+    with pytest.raises(InvalidStreamError, match="exceeds"):
+        await collect(iter_json_array(feed(b'["' + b"x" * 100, 10), max_item_size=50))
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("size", [1, 2, 7])
+async def test_iter_json_array__items_spanning_chunks(size: int):
+    items = [{"a": ['x"]}', "\\", {"b": "[{"}]}, '\\"', [[], {}], 10.25]
+    data = json.dumps(items).encode()
+    assert await collect(iter_json_array(feed(data, size))) == items
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("parse", [iter_ndjson, iter_json_array])
+async def test_when_invalid_utf8__then_raise(parse: Callable[..., AsyncIterator[Any]]):
+    with pytest.raises(InvalidStreamError, match="utf-8"):
+        await collect(parse(feed(b'["\xff"]\n', 2)))
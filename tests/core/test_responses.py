@@ -0,0 +1,137 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+
+import pytest
+from beanie import PydanticObjectId
+from pydantic import BaseModel, Field
+
+from furiousapi.core.db.models import FuriousPydanticConfig
+from furiousapi.core.pagination import PaginatedResponse
+from furiousapi.core.responses import (
+    BulkItemError,
+    BulkItemSuccess,
+    BulkResponseModel,
+    BulkResultBuilder,
+    BulkResultResponse,
+    ModelResponse,
+    PartialModelResponse,
+)
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Inner(BaseModel):
+    created_at: datetime
+    price: Decimal
+
+
+class Model(BaseModel):
+    id: PydanticObjectId = Field(alias="_id")
+    uid: uuid.UUID
+    color: Color
+    inner: Inner
+    tags: List[str]
+    note: Optional[str]
+
+    class Config(FuriousPydanticConfig):
+        pass
+
+
+MODEL = Model(
+    _id=PydanticObjectId(),
+    uid=uuid.uuid4(),
+    color=Color.RED,
+    inner=Inner(created_at=datetime(2023, 1, 1, 12, 30), price=Decimal("1.5")),
+    tags=["a"],
+    note=None,
+)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [MODEL, PaginatedResponse[Model](items=[MODEL, MODEL], total=2, next="abc"), None],
+)
+def test_model_response__same_as_partial_model_response(content: Optional[BaseModel]):
+    assert json.loads(ModelResponse(content).body) == json.loads(PartialModelResponse(content).body)
+
+
+class Event(BaseModel):
+    at: datetime
+    id: PydanticObjectId
+
+    class Config:
+        json_encoders = {  # noqa: RUF012
+            datetime: lambda d: int(d.replace(tzinfo=timezone.utc).timestamp()),
+            PydanticObjectId: str,
+        }
+
+
+class Events(BaseModel):
+    events: List[Event]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        Event(at=datetime(2023, 1, 1), id=PydanticObjectId("64651df6d6ab49e10ea7f4b5")),
+        Events(events=[Event(at=datetime(2023, 1, 1), id=PydanticObjectId("64651df6d6ab49e10ea7f4b5"))]),
+    ],
+)
+def test_model_response__custom_json_encoders_of_native_types_apply(content: BaseModel):
+    assert json.loads(ModelResponse(content).body) == json.loads(PartialModelResponse(content).body)
+
+
+def test_model_response__custom_json_encoders_are_used():
+    body = json.loads(ModelResponse(Event(at=datetime(2023, 1, 1), id=PydanticObjectId())).body)
+    assert body["at"] == 1672531200  # noqa: PLR2004
+
+
+def test_model_response__exclude_none_and_include():
+    body = json.loads(
+        ModelResponse(MODEL, exclude_none=True, include={"id": ..., "note": ..., "inner": {"price"}}).body
+    )
+    assert body == {"_id": str(MODEL.id), "inner": {"price": 1.5}}
+
+
+def make_bulk_result() -> BulkResultBuilder:
+    builder = BulkResultBuilder()
+    builder.add_success("a")
+    builder.add_error("duplicate", 2)
+    builder.extend(BulkResponseModel(items=[BulkItemSuccess(id=PydanticObjectId("64651df6d6ab49e10ea7f4b5"))]))
+    return builder
+
+
+def test_bulk_result_builder__renders_bulk_response_model_wire_format():
+    builder = make_bulk_result()
+    expected = BulkResponseModel(
+        items=[
+            BulkItemSuccess(id="a"),
+            BulkItemError(message="duplicate"),
+            BulkItemError(message="duplicate"),
+            BulkItemSuccess(id="64651df6d6ab49e10ea7f4b5"),
+        ],
+        has_errors=True,
+    )
+    assert json.loads(BulkResultResponse(builder).body) == json.loads(expected.json())
+    assert BulkResultBuilder.from_model(builder.to_model()).to_dict() == builder.to_dict()
+
+
+def test_bulk_result_builder__errors_only():
+    assert json.loads(BulkResultResponse(make_bulk_result(), errors_only=True).body) == {
+        "errors": [{"status": "ERROR", "message": "duplicate", "index": i} for i in (1, 2)],
+        "count": 4,
+        "has_errors": True,
+    }
+
+
+def test_bulk_result_builder__extend_when_status_is_not_set():
+    builder = BulkResultBuilder.from_model(
+        BulkResponseModel.construct(items=[BulkItemError(status=None, message="failed"), BulkItemSuccess(id="a")])
+    )
+    assert builder.to_dict()["items"] == [{"status": "ERROR", "message": "failed"}, {"status": "OK", "id": "a"}]
@@ -0,0 +1,31 @@
+from furiousapi.core.db.anchors import KeysetAnchors
+
+
+def test_nearest__returns_the_closest_anchor_before_the_offset():
+    anchors = KeysetAnchors(interval=10)
+    query = KeysetAnchors.query(["year"])
+
+    assert anchors.nearest(query, 25) == (0, None)
+    assert anchors.add(query, 10, ("a",))
+    assert anchors.add(query, 20, ("b",))
+
+    assert anchors.nearest(query, 9) == (0, None)
+    assert anchors.nearest(query, 10) == (10, ("a",))
+    assert anchors.nearest(query, 25) == (20, ("b",))
+    assert anchors.nearest(query, 500) == (20, ("b",))
+    assert anchors.nearest(KeysetAnchors.query(["title"]), 25) == (0, None)
+
+
+def test_add__keeps_the_anchors_contiguous_and_bounded():
+    anchors = KeysetAnchors(interval=10, max_queries=1, max_anchors=2)
+    query = KeysetAnchors.query(["year"])
+
+    assert not anchors.add(query, 15, ("a",))
+    assert not anchors.add(query, 20, ("b",))
+    assert anchors.add(query, 10, ("a",))
+    assert anchors.add(query, 20, ("b",))
+    assert not anchors.add(query, 30, ("c",))
+
+    anchors.add(KeysetAnchors.query(["title"]), 10, ("a",))
+    assert len(anchors) == 1
+    assert anchors.nearest(query, 30) == (0, None)
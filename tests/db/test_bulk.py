@@ -0,0 +1,141 @@
+import asyncio
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from furiousapi.core.db.bulk import CHUNK_FAILED_MESSAGE, BulkExecutor
+from furiousapi.core.db.exceptions import BulkDuplicateItemError, BulkTooLargeError, EntityAlreadyExistsError
+from furiousapi.core.exceptions import InvalidStreamError
+from furiousapi.core.responses import BulkItemError, BulkItemStatusEnum, BulkItemSuccess, BulkResponseModel
+
+
+class ChunkRepository:
+    bulk_concurrency = None
+
+    def __init__(self) -> None:
+        self.chunks: List[List[Any]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def _run(self, chunk: List[Any]) -> None:
+        self.chunks.append(chunk)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # later chunks finish first, results must still be merged in order
+        await asyncio.sleep(0.001 * (10 - len(self.chunks)))
+        self.running -= 1
+
+    async def bulk_create(self, bulk: List[str]) -> BulkResponseModel:
+        await self._run(bulk)
+        if "bad" in bulk:
+            raise ValueError("connection to db-1 lost")
+        if "exists" in bulk:
+            raise EntityAlreadyExistsError(BulkResponseModel)
+        return BulkResponseModel(items=[BulkItemSuccess(id=i) for i in bulk])
+
+    async def bulk_update(self, bulk: List[str]) -> List:
+        await self._run(bulk)
+        return bulk
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__chunks_with_bounded_concurrency_in_order():
+    repository = ChunkRepository()
+    executor = BulkExecutor(chunk_size=2, concurrency=2)
+    bulk = [str(i) for i in range(9)]
+
+    assert await executor.update(repository, bulk) == bulk  # type: ignore[arg-type]
+    assert [len(chunk) for chunk in repository.chunks] == [2, 2, 2, 2, 1]
+    assert repository.max_running == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__chunks_run_one_at_a_time_unless_the_repository_opts_in():
+    repository = ChunkRepository()
+    bulk = [str(i) for i in range(6)]
+    await BulkExecutor(chunk_size=2).update(repository, bulk)  # type: ignore[arg-type]
+    assert repository.max_running == 1
+
+    repository = ChunkRepository()
+    repository.bulk_concurrency = 3  # type: ignore[assignment]
+    await BulkExecutor(chunk_size=2).update(repository, bulk)  # type: ignore[arg-type]
+    assert repository.max_running == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__create_reports_failed_chunk_per_item():
+    executor = BulkExecutor(chunk_size=2, concurrency=3)
+    result = await executor.create(ChunkRepository(), ["1", "2", "bad", "3", "4"])  # type: ignore[arg-type]
+
+    assert [item.status for item in result.to_model().items] == [BulkItemStatusEnum.OK] * 2 + [
+        BulkItemStatusEnum.ERROR
+    ] * 2 + [BulkItemStatusEnum.OK]
+    assert result.has_errors
+    assert result.to_dict()["items"][2] == {"status": "ERROR", "message": CHUNK_FAILED_MESSAGE}
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__when_furious_error__then_raise_and_keep_the_completed_chunks():
+    repository = ChunkRepository()
+    executor = BulkExecutor(chunk_size=2, concurrency=1)
+
+    with pytest.raises(EntityAlreadyExistsError):
+        await executor.create(repository, ["1", "2", "exists", "3", "4"])  # type: ignore[arg-type]
+    # bulks are not atomic, the first chunk was written and the chunks after the error never started
+    assert repository.chunks == [["1", "2"], ["exists", "3"]]
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__when_duplicate_ids__then_raise():
+    repository = ChunkRepository()
+    with pytest.raises(BulkDuplicateItemError):
+        await BulkExecutor().update(repository, ["1", "2", "1"])  # type: ignore[arg-type]
+    assert not repository.chunks
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__when_too_large__then_raise():
+    repository = ChunkRepository()
+    with pytest.raises(BulkTooLargeError):
+        await BulkExecutor(max_size=2).update(repository, ["1", "2", "3"])  # type: ignore[arg-type]
+    assert not repository.chunks
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__stream_reports_duplicate_ids_per_item():
+    async def items() -> AsyncIterator[str]:
+        for item in ["1", "2", "1", "3"]:
+            yield item
+
+    repository = ChunkRepository()
+    results = [
+        item
+        async for chunk in BulkExecutor(chunk_size=2).stream(items(), str, repository.bulk_update)
+        for item in chunk
+    ]
+
+    assert results[:2] == ["1", "2"]
+    assert isinstance(results[2], BulkItemError)
+    assert results[3] == "3"
+    assert repository.chunks == [["1", "2"], ["3"]]
+
+
+@pytest.mark.asyncio()
+async def test_bulk_executor__stream_reports_started_chunks_before_a_body_error():
+    async def items() -> AsyncIterator[str]:
+        for item in ["1", "2", "3"]:
+            yield item
+        raise InvalidStreamError("invalid json")
+
+    repository = ChunkRepository()
+    results: List[Any] = []
+
+    async def consume() -> None:
+        async for chunk in BulkExecutor(chunk_size=2, concurrency=4).stream(items(), str, repository.bulk_update):
+            results.extend(chunk)
+
+    with pytest.raises(InvalidStreamError):
+        await consume()
+
+    assert results == ["1", "2"]
+    assert repository.chunks == [["1", "2"]]
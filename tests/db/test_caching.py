@@ -0,0 +1,147 @@
+import asyncio
+from enum import Enum
+from typing import Any, Dict, List
+
+import pytest
+
+from furiousapi.core.cache import LRUCache
+from furiousapi.core.db.caching import CachingRepository, InMemoryCacheBackend
+from furiousapi.core.db.projection import FieldProjection
+from furiousapi.utils import NOT_SET
+
+
+class Entity:
+    def __init__(self, id_: str, version: int = 0) -> None:
+        self.id = id_
+        self.version = version
+
+
+class Field(Enum):
+    ID = "id"
+
+
+class DictRepository:
+    def __init__(self) -> None:
+        self.data: Dict[str, Entity] = {str(i): Entity(str(i)) for i in range(3)}
+        self.calls: List[Any] = []
+        self.delay = 0.0
+
+    async def get(self, identifiers: Any, fields: Any = None, *, should_error: bool = True) -> Any:  # noqa: ARG002
+        self.calls.append(identifiers)
+        self.fields = fields
+        if isinstance(identifiers, dict):
+            identifiers = identifiers["id"]
+        elif isinstance(identifiers, tuple):
+            (identifiers,) = identifiers
+        entity = self.data.get(str(identifiers))
+        await asyncio.sleep(self.delay)
+        return entity
+
+    async def update(self, entity: Entity) -> Entity:
+        self.data[entity.id] = entity
+        return entity
+
+    async def delete(self, entity: Any) -> None:
+        identifiers = getattr(entity, "id", entity)
+        self.data.pop(str(identifiers["id"] if isinstance(identifiers, dict) else identifiers))
+
+    async def bulk_update(self, bulk: List[Entity]) -> List:
+        return [await self.update(entity) for entity in bulk]
+
+
+def test_lru_cache__evicts_least_recently_used_and_expired():
+    now = [0.0]
+    cache: LRUCache[str, int] = LRUCache(2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is NOT_SET
+    now[0] = 11
+    assert cache.get("a") is NOT_SET
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations, stats.size) == (1, 2, 1, 1, 1)
+
+
+def test_lru_cache__replaced_values_are_evicted():
+    now = [0.0]
+    evicted = []
+    cache: LRUCache[str, int] = LRUCache(2, ttl=10, clock=lambda: now[0], on_evict=lambda *x: evicted.append(x))
+    cache.set("a", 1)
+    cache.set("a", 2)
+    now[0] = 11
+    cache.set("a", 3)
+
+    assert evicted == [("a", 1), ("a", 2)]
+    assert (cache.get("a"), cache.stats.expirations) == (3, 1)
+
+
+@pytest.mark.asyncio()
+async def test_caching_repository__get_is_cached_per_projection():
+    inner = DictRepository()
+    repository = CachingRepository(inner)  # type: ignore[arg-type,var-annotated]
+
+    first = await repository.get("1")
+    assert await repository.get(1) is first
+    await repository.get("1", ["id"])
+    await repository.get("1", ["id"])
+    assert await repository.get("missing", should_error=False) is None
+    assert await repository.get("missing", should_error=False) is None
+
+    assert inner.calls == ["1", "1", "missing", "missing"]
+    assert repository.stats.hit_ratio == pytest.approx(2 / 6)
+
+
+@pytest.mark.asyncio()
+async def test_caching_repository__writes_invalidate_all_projections():
+    inner = DictRepository()
+    repository = CachingRepository(inner, InMemoryCacheBackend(max_size=10, ttl=None))  # type: ignore[arg-type]
+    await asyncio.gather(repository.get("1"), repository.get("1", ["id"]), repository.get("2"))
+
+    await repository.update(Entity("1", version=1))
+    assert (await repository.get("1")).version == 1
+    assert (await repository.get("1", ["id"])).version == 1
+
+    await repository.bulk_update([Entity("2", version=2)])
+    assert (await repository.get("2")).version == 2  # noqa: PLR2004
+
+    await repository.delete("2")
+    assert await repository.get("2") is None
+    assert repository.stats.invalidations == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("identifiers", [{"id": "1"}, ("1",), 1])
+async def test_caching_repository__writes_invalidate_non_scalar_identifiers(identifiers: Any):
+    repository = CachingRepository(DictRepository())  # type: ignore[arg-type,var-annotated]
+    assert (await repository.get(identifiers)).version == 0
+
+    await repository.update(Entity("1", version=1))
+    assert (await repository.get(identifiers)).version == 1
+    await repository.delete({"id": "1"})
+    assert await repository.get(identifiers) is None
+
+
+@pytest.mark.asyncio()
+async def test_caching_repository__projection_is_passed_as_is():
+    inner = DictRepository()
+    repository = CachingRepository(inner)  # type: ignore[arg-type,var-annotated]
+    projection = FieldProjection([Field.ID])
+
+    await repository.get("1", projection)
+    assert inner.fields is projection
+    await repository.get("1", iter([Field.ID]))
+    assert inner.calls == ["1"]
+
+
+@pytest.mark.asyncio()
+async def test_caching_repository__get_racing_with_write_is_not_cached():
+    inner = DictRepository()
+    inner.delay = 0.01
+    repository = CachingRepository(inner)  # type: ignore[arg-type,var-annotated]
+
+    stale = asyncio.ensure_future(repository.get("1"))
+    await asyncio.sleep(0)
+    await repository.update(Entity("1", version=1))
+    assert (await stale).version == 0
+    assert (await repository.get("1")).version == 1
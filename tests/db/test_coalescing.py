@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from furiousapi.core.db.coalescing import CoalescingRepository
+
+
+class SlowRepository:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    async def get(self, identifiers: Any, fields: Any = None, *, should_error: bool = True) -> Any:  # noqa: ARG002
+        self.calls.append(identifiers)
+        await asyncio.sleep(0.01)
+        if identifiers == "missing":
+            raise KeyError(identifiers)
+        return {"id": identifiers}
+
+
+@pytest.mark.asyncio()
+async def test_coalescing_repository__concurrent_identical_gets_share_one_call():
+    inner = SlowRepository()
+    repository = CoalescingRepository(inner)  # type: ignore[arg-type,var-annotated]
+
+    results = await asyncio.gather(
+        *(repository.get("1") for _ in range(5)), repository.get("2"), repository.get("1", ["name"])
+    )
+
+    assert results[:5] == [{"id": "1"}] * 5
+    assert sorted(inner.calls) == ["1", "1", "2"]
+    assert (repository.stats.calls, repository.stats.coalesced, repository.stats.in_flight) == (7, 4, 0)
+
+    await repository.get("1")
+    assert len(inner.calls) == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_coalescing_repository__error_and_cancellation_are_isolated():
+    inner = SlowRepository()
+    repository = CoalescingRepository(inner)  # type: ignore[arg-type,var-annotated]
+
+    results = await asyncio.gather(repository.get("missing"), repository.get("missing"), return_exceptions=True)
+    assert all(isinstance(result, KeyError) for result in results)
+
+    cancelled = asyncio.ensure_future(repository.get("1"))
+    follower = asyncio.ensure_future(repository.get("1"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await follower == {"id": "1"}
+
+
+@pytest.mark.asyncio()
+async def test_coalescing_repository__when_disabled__then_passthrough():
+    inner = SlowRepository()
+    repository = CoalescingRepository(inner, enabled=False)  # type: ignore[arg-type,var-annotated]
+    await asyncio.gather(repository.get("1"), repository.get("1"))
+    assert inner.calls == ["1", "1"]
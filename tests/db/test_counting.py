@@ -0,0 +1,130 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from furiousapi.core.db.counting import NO_COUNT, Count, CountingStrategy, CountModeEnum, filter_key
+from furiousapi.core.db.memory import InMemoryRepository
+
+
+class Item(BaseModel):
+    id: Optional[str]
+    color: str
+
+
+class ItemRepository(InMemoryRepository[Item]):  # type: ignore[misc]
+    def __init__(self, items: List[Item]) -> None:
+        super().__init__(items)
+        self.counts = 0
+
+    async def count(self, filtering: Optional[Item] = None) -> int:
+        self.counts += 1
+        return await super().count(filtering)
+
+
+class UncountableRepository(InMemoryRepository[Item]):  # type: ignore[misc]
+    def __init__(self, items: List[Item]) -> None:
+        super().__init__(items)
+        self.counts = 0
+
+    async def count(self, filtering: Optional[Item] = None) -> Optional[int]:  # noqa: ARG002
+        self.counts += 1
+        return None
+
+    async def estimate_count(self, filtering: Optional[Item] = None) -> Optional[int]:  # noqa: ARG002
+        return None
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def repository() -> ItemRepository:
+    return ItemRepository([Item(id=str(i), color="red" if i % 3 else "blue") for i in range(9)])
+
+
+@pytest.mark.asyncio()
+async def test_count__modes(repository: ItemRepository):
+    strategy = CountingStrategy()
+    red = repository.__filtering__.construct(color="red")
+
+    assert await strategy.count(repository, red, CountModeEnum.EXACT) == Count(6, estimated=False)
+    assert await strategy.count(repository, None, CountModeEnum.ESTIMATED) == Count(9, estimated=True)
+    assert await strategy.count(repository, red, CountModeEnum.ESTIMATED) == Count(6, estimated=False)
+    assert await strategy.count(repository, red, CountModeEnum.NONE) == Count(None, None)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("mode", list(CountModeEnum))
+async def test_count__when_repository_cannot_count__then_no_count(mode: CountModeEnum):
+    strategy = CountingStrategy()
+    repository = UncountableRepository([Item(id="1", color="red")])
+
+    assert await strategy.count(repository, None, mode) == NO_COUNT
+    assert await strategy.count(repository, None, mode) == NO_COUNT
+    # nothing is cached for the repository
+    assert repository.counts == (0 if mode == CountModeEnum.NONE else 2)
+
+
+@pytest.mark.asyncio()
+async def test_count__cached_per_filter_until_expired(repository: ItemRepository):
+    clock = Clock()
+    strategy = CountingStrategy(ttl=10, clock=clock)
+    red = repository.__filtering__.construct(color="red")
+
+    assert await strategy.count(repository, red, CountModeEnum.CACHED) == Count(6, estimated=False)
+    assert await strategy.count(repository, red, CountModeEnum.CACHED) == Count(6, estimated=True)
+    assert await strategy.count(repository, None, CountModeEnum.CACHED) == Count(9, estimated=False)
+    assert repository.counts == 2  # noqa: PLR2004
+
+    clock.now = 11
+    assert await strategy.count(repository, red, CountModeEnum.CACHED) == Count(6, estimated=False)
+    assert repository.counts == 3  # noqa: PLR2004
+
+
+class TenantRepository(InMemoryRepository[Item]):  # type: ignore[misc]
+    def __init__(self, tenant: str, items: List[Item]) -> None:
+        super().__init__(items)
+        self.tenant = tenant
+
+    def cache_scope(self) -> str:
+        return self.tenant
+
+
+@pytest.mark.asyncio()
+async def test_count__cached_per_repository_scope():
+    strategy = CountingStrategy()
+    first = TenantRepository("first", [Item(id="1", color="red")])
+    second = TenantRepository("second", [Item(id="1", color="red"), Item(id="2", color="red")])
+
+    assert await strategy.count(first, None, CountModeEnum.CACHED) == Count(1, estimated=False)
+    assert await strategy.count(second, None, CountModeEnum.CACHED) == Count(2, estimated=False)
+    assert await strategy.count(TenantRepository("first", []), None, CountModeEnum.CACHED) == Count(1, estimated=True)
+
+
+@pytest.mark.asyncio()
+async def test_invalidate__drops_the_counts_of_the_repository(repository: ItemRepository):
+    strategy = CountingStrategy()
+    red = repository.__filtering__.construct(color="red")
+    other = TenantRepository("other", [])
+    for repo, filtering in ((repository, None), (repository, red), (other, None)):
+        await strategy.count(repo, filtering, CountModeEnum.CACHED)
+
+    strategy.invalidate(repository, red)
+    assert await strategy.count(repository, red, CountModeEnum.CACHED) == Count(6, estimated=False)
+    assert await strategy.count(repository, None, CountModeEnum.CACHED) == Count(9, estimated=True)
+
+    strategy.invalidate(repository)
+    assert await strategy.count(repository, None, CountModeEnum.CACHED) == Count(9, estimated=False)
+    assert await strategy.count(repository, red, CountModeEnum.CACHED) == Count(6, estimated=False)
+    assert await strategy.count(other, None, CountModeEnum.CACHED) == Count(0, estimated=True)
+
+
+def test_filter_key__ignores_unset_fields():
+    assert filter_key(Item.construct(id=None, color="red")) == filter_key(Item.construct(color="red"))
+    assert filter_key(None) == ()
@@ -0,0 +1,102 @@
+import contextlib
+import random
+import struct
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+from bson import ObjectId
+
+from furiousapi.core.db.cursors import (
+    TAG_DATE,
+    TAG_DATETIME,
+    TAG_DATETIME_TZ,
+    TAG_DECIMAL,
+    TAG_INT,
+    TAG_STR,
+    BinaryCursorCodec,
+    JSONCursorCodec,
+)
+from furiousapi.core.exceptions import InvalidCursorError
+
+VALUES: List[Any] = [
+    None,
+    True,
+    False,
+    0,
+    -1,
+    2**70,
+    -(2**70),
+    1.5,
+    "with $$ delimiter",
+    "",
+    b"\x00\xff",
+    uuid.uuid4(),
+    ObjectId(),
+    datetime(2023, 5, 17, 10, 30, 1, 123456),
+    datetime(1950, 1, 1, tzinfo=timezone(timedelta(hours=-5))),
+    date(2023, 5, 17),
+    Decimal("10.25"),
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_binary_cursor_codec__roundtrip(value: Any):
+    codec = BinaryCursorCodec()
+    cursor = codec.encode([value, "id"])
+    assert "=" not in cursor
+    assert codec.decode(cursor) == [value, "id"]
+
+
+def test_binary_cursor_codec__when_aware_datetime__then_offset_kept():
+    value = datetime(2023, 5, 17, 10, tzinfo=timezone(timedelta(hours=3)))
+    decoded = BinaryCursorCodec().decode(BinaryCursorCodec().encode([value]))[0]
+    assert decoded == value
+    assert decoded.utcoffset() == timedelta(hours=3)
+
+
+def test_binary_cursor_codec__shorter_than_json():
+    values = [datetime(2023, 5, 17, 10, 30, 1), 1234, ObjectId()]
+    assert len(BinaryCursorCodec().encode(values)) < len(JSONCursorCodec().encode(values)) * 0.6
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", "AQX", BinaryCursorCodec().encode(["value"])[:-2]])
+def test_binary_cursor_codec__when_invalid__then_raise(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        BinaryCursorCodec().decode(cursor)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        bytes((TAG_DATETIME,)) + struct.pack(">q", 2**63 - 1),
+        bytes((TAG_DATETIME_TZ,)) + struct.pack(">q", 0) + b"\xff\xff\xff\xff\x0f",
+        bytes((TAG_DATE,)) + b"\x00",
+        bytes((TAG_DATE,)) + b"\xff\xff\xff\xff\xff\x0f",
+        bytes((TAG_DECIMAL, 6)) + b"abc",
+        bytes((TAG_DECIMAL, 2)) + b"\xff",
+        bytes((TAG_STR, 2)) + b"\xff",
+    ],
+)
+def test_binary_cursor_codec__when_value_out_of_range__then_raise(payload: bytes):
+    codec = BinaryCursorCodec()
+    with pytest.raises(InvalidCursorError):
+        codec.decode(codec.encode_bytes(bytes((codec.version,)) + payload))
+
+
+@pytest.mark.parametrize("tag", [TAG_DATETIME, TAG_DATETIME_TZ, TAG_DATE, TAG_DECIMAL, TAG_STR, TAG_INT])
+def test_binary_cursor_codec__when_random_payload__then_value_or_invalid_cursor(tag: int):
+    codec = BinaryCursorCodec()
+    rand = random.Random(tag)
+    for _ in range(500):
+        payload = bytes(rand.getrandbits(8) for _ in range(rand.randint(0, 12)))
+        with contextlib.suppress(InvalidCursorError):
+            codec.decode(codec.encode_bytes(bytes((codec.version, tag)) + payload))
+
+
+def test_json_cursor_codec__is_backward_compatible():
+    # cursor rendered by the previous BaseCursorPagination implementation
+    assert JSONCursorCodec().decode("MSQkImFiYyI=") == [1, "abc"]
+    assert JSONCursorCodec().encode([1, "abc"]) == "MSQkImFiYyI="
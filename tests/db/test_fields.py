@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from furiousapi.core.db.fields import SortableFieldEnum, SortKey
+from furiousapi.core.db.utils import get_model_sort_fields_enum
+from furiousapi.core.fields import SortingDirection
+
+
+class Model(BaseModel):
+    id: str
+    rank: int
+
+
+class OtherModel(BaseModel):
+    rank: int
+
+
+class StaticSortEnum(SortableFieldEnum):
+    rank = "rank"
+
+
+ModelSortEnum = get_model_sort_fields_enum(Model)
+OtherModelSortEnum = get_model_sort_fields_enum(OtherModel)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("rank", SortingDirection.DESCENDING),
+        ("rank:asc", SortingDirection.ASCENDING),
+        ("rank:desc", SortingDirection.DESCENDING),
+    ],
+)
+def test_sort_enum_call__returns_sort_key(value: str, expected: SortingDirection):
+    key = ModelSortEnum(value)
+    assert isinstance(key, SortKey)
+    assert key.field is ModelSortEnum.rank  # type: ignore[attr-defined]
+    assert key.direction == expected
+    assert ModelSortEnum.validate(value) is key
+
+
+def test_sort_key__is_interned_and_does_not_mutate_member():
+    member = ModelSortEnum.rank  # type: ignore[attr-defined]
+    ascending = +member
+    descending = -member
+    assert ascending is ModelSortEnum("rank:asc")
+    assert ~ascending is descending
+    assert ascending.direction == SortingDirection.ASCENDING
+    assert descending.direction == SortingDirection.DESCENDING
+    assert member.direction == ModelSortEnum.__default__
+    assert -OtherModelSortEnum.rank is not descending  # type: ignore[attr-defined]
+    assert str(ascending) == "rank:asc"
+
+
+def test_sort_key__is_immutable():
+    key = +ModelSortEnum.rank  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError):
+        key.direction = SortingDirection.DESCENDING  # type: ignore[misc]
+
+
+def test_sort_key__pickle():
+    key = +StaticSortEnum.rank
+    assert pickle.loads(pickle.dumps(key)) is key  # noqa: S301
+    assert pickle.loads(pickle.dumps(StaticSortEnum.rank)) is StaticSortEnum.rank  # noqa: S301
@@ -0,0 +1,90 @@
+import asyncio
+from enum import Enum
+from typing import Any, List, Optional
+
+import pytest
+
+from furiousapi.core.db.exceptions import EntityNotFoundError
+from furiousapi.core.db.loaders import RepositoryLoader
+from furiousapi.core.db.projection import FieldProjection
+from furiousapi.core.db.repository import BaseRepository
+
+
+class Field(Enum):
+    ID = "id"
+
+
+class BatchRepository:
+    def __init__(self) -> None:
+        self.batches: List[Any] = []
+
+    async def get_many(self, identifiers: List[Any], fields: Any = None) -> List[Optional[dict]]:
+        self.batches.append((identifiers, fields))
+        await asyncio.sleep(0)
+        return [None if i == "missing" else {"id": i} for i in identifiers]
+
+
+class PointRepository:
+    get_many = BaseRepository.get_many
+
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    async def get(self, identifiers: Any, fields: Any = None, *, should_error: bool = True) -> Any:  # noqa: ARG002
+        self.calls.append(identifiers)
+        return {"id": identifiers}
+
+
+@pytest.mark.asyncio()
+async def test_loader__batches_same_tick_loads_per_projection():
+    repository = BatchRepository()
+    loader = RepositoryLoader(repository)  # type: ignore[arg-type,var-annotated]
+
+    results = await asyncio.gather(
+        loader.load("1"), loader.load("2"), loader.load(1), loader.load("1", ["id"]), loader.load_many(["2", "3"])
+    )
+
+    assert results == [{"id": "1"}, {"id": "2"}, {"id": "1"}, {"id": "1"}, [{"id": "2"}, {"id": "3"}]]
+    assert sorted(repository.batches, key=str) == [(["1", "2", "3"], None), (["1"], ["id"])]
+
+    assert await loader.load("3") == {"id": "3"}
+    assert len(repository.batches) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_loader__when_missing__then_none_or_raise():
+    loader = RepositoryLoader(BatchRepository())  # type: ignore[arg-type,var-annotated]
+    assert await loader.load("missing", should_error=False) is None
+    with pytest.raises(EntityNotFoundError):
+        await loader.load("missing")
+
+
+@pytest.mark.asyncio()
+async def test_loader__get_many_falls_back_to_gathered_gets():
+    repository = PointRepository()
+    loader = RepositoryLoader(repository)  # type: ignore[arg-type,var-annotated]
+    assert await loader.load_many(["1", "2"]) == [{"id": "1"}, {"id": "2"}]
+    assert repository.calls == ["1", "2"]
+
+
+@pytest.mark.asyncio()
+async def test_loader__when_get_many_fails__then_all_loads_fail_and_retry():
+    repository = BatchRepository()
+    loader = RepositoryLoader(repository)  # type: ignore[arg-type,var-annotated]
+    repository.get_many = lambda *_: asyncio.sleep(0, [])  # type: ignore[method-assign]
+    results = await asyncio.gather(loader.load("1"), loader.load("2"), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+    del repository.get_many
+    assert await loader.load("1") == {"id": "1"}
+
+
+@pytest.mark.asyncio()
+async def test_loader__projection_is_passed_as_is():
+    repository = BatchRepository()
+    loader = RepositoryLoader(repository)  # type: ignore[arg-type,var-annotated]
+    projection = FieldProjection([Field.ID])
+
+    await asyncio.gather(loader.load("1", projection), loader.load_many(["2"], iter([Field.ID])))
+
+    assert repository.batches == [(["1", "2"], projection)]
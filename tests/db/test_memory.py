@@ -0,0 +1,165 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from furiousapi.core.db.anchors import KeysetAnchors
+from furiousapi.core.db.counting import filter_key
+from furiousapi.core.db.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from furiousapi.core.db.memory import InMemoryRepository
+from furiousapi.core.exceptions import InvalidCursorError
+from furiousapi.core.pagination import CursorPaginationParams, OffsetPaginationParams
+from furiousapi.core.responses import BulkItemError
+
+
+class Book(BaseModel):
+    id: Optional[str]
+    title: str
+    year: Optional[int]
+    author: str
+
+
+class BookRepository(InMemoryRepository[Book]):  # type: ignore[misc]
+    pass
+
+
+def make_books() -> List[Book]:
+    years = [2001, None, 1999, 2001, 2010, None, 1999, 2005]
+    return [
+        Book(id=f"{i:02d}", title=f"book {i}", year=year, author="a" if i % 2 else "b") for i, year in enumerate(years)
+    ]
+
+
+async def collect(repository: BookRepository, **kwargs) -> List[Optional[str]]:
+    ids: List[Optional[str]] = []
+    pagination = CursorPaginationParams(limit=3)
+    async for page in repository.iter_pages(pagination, **kwargs):
+        ids += [book.id for book in page.items]
+    return ids
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("sorting", "expected"),
+    [
+        (None, ["00", "01", "02", "03", "04", "05", "06", "07"]),
+        (["year:asc"], ["01", "05", "02", "06", "00", "03", "07", "04"]),
+        (["year:desc"], ["04", "07", "03", "00", "06", "02", "05", "01"]),
+        (["author:asc", "year:desc"], ["07", "03", "05", "01", "04", "00", "06", "02"]),
+    ],
+)
+async def test_list__cursor_pages_follow_the_sorting(sorting: Optional[List[str]], expected: List[str]):
+    repository = BookRepository(make_books())
+    sort = [repository.__sort__(key) for key in sorting] if sorting else None
+    assert await collect(repository, sorting=sort) == expected
+
+
+@pytest.mark.asyncio()
+async def test_list__prev_cursor_returns_the_previous_page():
+    repository = BookRepository(make_books())
+    sorting = [repository.__sort__("year:asc")]
+    first = await repository.list(CursorPaginationParams(limit=3), sorting=sorting)
+    second = await repository.list(CursorPaginationParams(limit=3, next=first.next), sorting=sorting)
+
+    back = await repository.list(CursorPaginationParams(limit=3, prev=second.prev), sorting=sorting)
+
+    assert [book.id for book in back.items] == [book.id for book in first.items]
+    assert back.prev is None
+    assert back.next == first.next
+
+
+@pytest.mark.asyncio()
+async def test_list__filtering_projection_and_offset():
+    repository = BookRepository(make_books())
+    filtering = repository.__filtering__.construct(author="a")
+
+    page = await repository.list(
+        OffsetPaginationParams(limit=2, offset=1), [repository.__fields__.title], None, filtering
+    )
+
+    assert [book.dict() for book in page.items] == [{"id": "03", "title": "book 3"}, {"id": "05", "title": "book 5"}]
+    assert (page.index, page.next, page.total) == (1, "3", None)
+
+
+@pytest.mark.asyncio()
+async def test_writes_keep_the_indexes_sorted():
+    repository = BookRepository(make_books())
+    repository.create_index("year")
+
+    await repository.add(Book(title="new", year=2000, author="c"))
+    await repository.update(Book(id="04", title="book 4", year=1990, author="b"))
+    await repository.delete("00")
+    result = await repository.bulk_create([Book(id=f"x{i}", title="bulk", year=2000 + i, author="c") for i in range(3)])
+
+    assert not result.has_errors
+    years = [
+        book.year
+        for book in (
+            await repository.list(OffsetPaginationParams(limit=20), sorting=[repository.__sort__("year:asc")])
+        ).items
+    ]
+    assert years == [None, None, 1990, 1999, 1999, 2000, 2000, 2001, 2001, 2002, 2005]
+    assert len(repository) == 11  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_errors():
+    repository = BookRepository(make_books())
+
+    with pytest.raises(EntityAlreadyExistsError):
+        await repository.add(Book(id="01", title="duplicate", author="a"))
+    with pytest.raises(EntityNotFoundError):
+        await repository.get("missing")
+    with pytest.raises(InvalidCursorError):
+        await repository.list(CursorPaginationParams(next="invalid"))
+    assert await repository.get("missing", should_error=False) is None
+    assert await repository.update(Book(id="missing", title="", author="")) is None
+    assert isinstance((await repository.bulk_delete(["01", "missing"]))[1], BulkItemError)
+    assert await repository.get_many(["01", "02"]) == [None, make_books()[2]]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("sorting", [None, ["year:desc"], ["author:asc", "year:desc"]])
+@pytest.mark.parametrize("author", [None, "a"])
+async def test_list__offset_pages_seek_from_anchors(sorting: Optional[List[str]], author: Optional[str]):
+    books = [Book(id=f"{i:03d}", title="", year=1990 + i % 7, author="ab"[i % 3 % 2]) for i in range(60)]
+    anchored, repository = BookRepository(books), BookRepository(books)
+    anchored._anchors = KeysetAnchors(interval=4)  # noqa: SLF001
+    sort = [repository.__sort__(key) for key in sorting] if sorting else None
+    filtering = repository.__filtering__.construct(author=author)
+
+    async def ids(repository: BookRepository, offset: int) -> List[Optional[str]]:
+        page = await repository.list(OffsetPaginationParams(limit=5, offset=offset), None, sort, filtering)
+        return [book.id for book in page.items]
+
+    # deep first, then shallower and deeper offsets seeking from the anchors added on the way
+    for offset in (33, 5, 18, 29, 38, 41, 60):
+        assert await ids(anchored, offset) == await ids(repository, offset)
+    assert len(anchored._anchors) == 1  # noqa: SLF001
+
+    await anchored.delete("000")
+    await repository.delete("000")
+    assert len(anchored._anchors) == 0  # noqa: SLF001
+    assert await ids(anchored, 21) == await ids(repository, 21)
+
+
+class RankedBook(BaseModel):
+    id: Optional[str]
+    rank: int = 3
+
+
+class RankedBookRepository(InMemoryRepository[RankedBook]):  # type: ignore[misc]
+    pass
+
+
+@pytest.mark.asyncio()
+async def test_list__filter_defaults_are_not_conditions():
+    repository = RankedBookRepository([RankedBook(id=str(i), rank=i) for i in range(5)])
+    pagination = OffsetPaginationParams(limit=10)
+
+    unfiltered = await repository.list(pagination, filtering=repository.__filtering__.construct())
+    filtered = await repository.list(pagination, filtering=repository.__filtering__.construct(rank=3))
+
+    assert [book.id for book in unfiltered.items] == ["0", "1", "2", "3", "4"]
+    assert [book.id for book in filtered.items] == ["3"]
+    assert filter_key(repository.__filtering__.construct()) == ()
@@ -0,0 +1,36 @@
+from typing import Any, Dict, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from furiousapi.core.db.metaclasses import model_query
+
+
+class Filtering(BaseModel):
+    id: Optional[str] = Field(alias="_id")
+    name: Optional[str]
+    rank: Optional[int] = 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"_id": None, "name": None, "rank": None},
+        {"_id": "1", "name": None, "rank": None},
+        {"_id": "1", "name": "name", "rank": 5},
+    ],
+)
+def test_model_query__compiled__same_as_validated(kwargs: Dict[str, Any]):
+    validated = model_query(Filtering).dependency(**kwargs)
+    compiled = model_query(Filtering, compiled=True).dependency(**kwargs)
+
+    assert compiled.dict() == validated.dict()
+    assert compiled.__fields_set__ == validated.__fields_set__
+
+
+def test_model_query__compiled__same_signature():
+    validated = model_query(Filtering).dependency
+    compiled = model_query(Filtering, compiled=True).dependency
+    assert [p.name for p in validated.__signature__.parameters.values()] == [  # type: ignore[attr-defined]
+        p.name for p in compiled.__signature__.parameters.values()  # type: ignore[attr-defined]
+    ]
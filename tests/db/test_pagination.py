@@ -0,0 +1,145 @@
+import base64
+from typing import Callable, ClassVar, List
+
+import pytest
+from pydantic import BaseModel
+
+from furiousapi.core.db.cursors import BinaryCursorCodec, CursorSigner
+from furiousapi.core.db.models import json_dumps, json_loads
+from furiousapi.core.db.pagination import BaseRelayPagination
+from furiousapi.core.db.utils import get_model_sort_fields_enum
+from furiousapi.core.exceptions import InvalidCursorError
+from furiousapi.core.fields import SortingDirection
+
+
+class Item(BaseModel):
+    id: str
+    rank: int
+
+
+ItemSortEnum = get_model_sort_fields_enum(Item)
+
+
+class Pagination(BaseRelayPagination):
+    __json_dumps__: ClassVar[Callable] = staticmethod(json_dumps)
+    __json_loads__: ClassVar[Callable] = staticmethod(json_loads)
+
+
+class BinaryPagination(Pagination):
+    __cursor_codec__ = BinaryCursorCodec()
+
+
+class SignedPagination(BinaryPagination):
+    __cursor_signer__ = CursorSigner("secret")
+
+
+ITEMS = [Item(id=str(i), rank=i % 3) for i in range(5)]
+
+
+@pytest.fixture(params=[Pagination, BinaryPagination, SignedPagination])
+def pagination(request: pytest.FixtureRequest) -> BaseRelayPagination:
+    return request.param(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")])
+
+
+def test_make_cursors__same_as_render_cursor(pagination: BaseRelayPagination):
+    field_orderings = pagination.get_field_orderings()
+    expected = tuple(pagination.render_cursor(item, field_orderings) for item in ITEMS)
+    assert pagination.make_cursors(ITEMS, field_orderings) == expected
+
+
+def test_make_cursor_batch__renders_lazily(pagination: BaseRelayPagination):
+    field_orderings = pagination.get_field_orderings()
+    batch = pagination.make_cursor_batch(ITEMS, field_orderings)
+    rendered: List[str] = batch._cursors  # type: ignore[assignment] # noqa: SLF001
+
+    assert pagination.decode_cursor(batch.last) == [ITEMS[-1].rank, ITEMS[-1].id]  # type: ignore[arg-type]
+    assert rendered.count(None) == len(ITEMS) - 1  # type: ignore[arg-type]
+    assert list(batch) == [pagination.render_cursor(item, field_orderings) for item in ITEMS]
+    assert batch[1:3] == list(batch)[1:3]
+
+
+def test_make_cursor_batch__when_empty__then_no_cursors(pagination: BaseRelayPagination):
+    batch = pagination.make_cursor_batch([], pagination.get_field_orderings())
+    assert batch.first is None
+    assert batch.last is None
+    assert list(batch) == []
+
+
+def test_signed_cursor__roundtrip():
+    pagination = SignedPagination(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")])
+    field_orderings = pagination.get_field_orderings()
+    cursor = pagination.render_cursor(ITEMS[0], field_orderings)
+    assert pagination.parse_cursor(cursor, field_orderings) == tuple(zip(field_orderings, [ITEMS[0].rank, "0"]))
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        SignedPagination(ItemSortEnum, {"id"}, [+ItemSortEnum("id")]),
+        type("OtherSecret", (BinaryPagination,), {"__cursor_signer__": CursorSigner("other")})(
+            ItemSortEnum, {"id"}, [-ItemSortEnum("rank")]
+        ),
+        type("NewSchema", (BinaryPagination,), {"__cursor_signer__": CursorSigner("secret", schema_version=1)})(
+            ItemSortEnum, {"id"}, [-ItemSortEnum("rank")]
+        ),
+    ],
+)
+def test_signed_cursor__when_rendered_for_other_scope__then_rejected(other: BaseRelayPagination):
+    pagination = SignedPagination(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")])
+    cursor = pagination.render_cursor(ITEMS[0], pagination.get_field_orderings())
+    with pytest.raises(InvalidCursorError):
+        other.decode_cursor(cursor)
+
+
+def test_signed_cursor__when_tampered__then_rejected():
+    pagination = SignedPagination(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")])
+    codec = BinaryCursorCodec()
+    envelope = bytearray(codec.decode_bytes(pagination.render_cursor(ITEMS[0], pagination.get_field_orderings())))
+    envelope[10] ^= 1
+    with pytest.raises(InvalidCursorError, match="signature"):
+        pagination.decode_cursor(codec.encode_bytes(bytes(envelope)))
+
+
+def test_encode_cursor__takes_raw_values_and_renders_the_previous_cursors():
+    pagination = Pagination(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")])
+    item = ITEMS[4]
+    # the cursor of the previous implementation, the json dumped values joined and base64 encoded
+    previous = base64.b64encode(f"{json_dumps(item.rank)}$${json_dumps(item.id)}".encode()).decode()
+
+    assert pagination.encode_cursor((item.rank, item.id)) == previous
+    assert pagination.render_cursor(item, pagination.get_field_orderings()) == previous
+    assert pagination.decode_cursor(previous) == [item.rank, item.id]
+
+
+@pytest.mark.parametrize(
+    ("next_", "prev", "expected"),
+    [(None, None, (False, None)), ("a", None, (False, "a")), ("a", "b", (True, "b")), (None, "b", (True, "b"))],
+)
+def test_get_cursor_info(next_: str, prev: str, expected: tuple):
+    info = BaseRelayPagination.get_cursor_info(next_, prev)
+    assert (info.reversed, info.cursor) == expected
+
+
+def test_reversed_pagination__flips_directions_and_results():
+    pagination = Pagination(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")], reversed_=True)
+    field_orderings = pagination.get_field_orderings()
+    assert [pagination.get_direction(field) for field in field_orderings] == [SortingDirection.ASCENDING] * 2
+    assert pagination.reverse_results(ITEMS) == ITEMS[::-1]
+
+
+@pytest.mark.parametrize(
+    ("reversed_", "has_more", "cursor", "expected"),
+    [
+        (False, True, None, (None, -1)),
+        (False, True, "cursor", (0, -1)),
+        (False, False, "cursor", (0, None)),
+        (True, True, "cursor", (0, -1)),
+        (True, False, "cursor", (None, -1)),
+    ],
+)
+def test_make_page_cursors(reversed_: bool, has_more: bool, cursor: str, expected: tuple):  # noqa: FBT001
+    pagination = Pagination(ItemSortEnum, {"id"}, [-ItemSortEnum("rank")], reversed_=reversed_)
+    field_orderings = pagination.get_field_orderings()
+    cursors = pagination.make_cursors(ITEMS, field_orderings)
+    prev, next_ = pagination.make_page_cursors(ITEMS, field_orderings, has_more=has_more, cursor=cursor)
+    assert (prev, next_) == tuple(None if i is None else cursors[i] for i in expected)
@@ -0,0 +1,159 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from furiousapi.core.db.memory import InMemoryRepository
+from furiousapi.core.db.prefetch import PagePrefetcher
+from furiousapi.core.instrumentation import PREFETCH_LOOKUPS, RecordingMetricsSink, set_metrics_sink
+from furiousapi.core.pagination import CursorPaginationParams
+
+
+class Item(BaseModel):
+    id: Optional[str]
+    color: str
+
+
+class ItemRepository(InMemoryRepository[Item]):  # type: ignore[misc]
+    def __init__(self, items: List[Item]) -> None:
+        super().__init__(items)
+        self.lists = 0
+        self.fail = False
+
+    async def list(self, *args, **kwargs):
+        self.lists += 1
+        if self.fail:
+            raise RuntimeError("unavailable")
+        return await super().list(*args, **kwargs)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def repository() -> ItemRepository:
+    return ItemRepository([Item(id=f"{i:02d}", color="red" if i % 3 else "blue") for i in range(10)])
+
+
+async def settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio()
+async def test_list__next_page_is_served_from_the_prefetch(repository: ItemRepository):
+    prefetcher = PagePrefetcher()
+    sink = RecordingMetricsSink()
+    set_metrics_sink(sink)
+    try:
+        ids = []
+        pagination = CursorPaginationParams(limit=3)
+        while True:
+            page = await prefetcher.list(repository, pagination)
+            await settle()
+            ids += [item.id for item in page.items]
+            if not page.next:
+                break
+            pagination = CursorPaginationParams(limit=3, next=page.next)
+    finally:
+        set_metrics_sink(None)
+
+    assert ids == [f"{i:02d}" for i in range(10)]
+    # the first page and the 3 prefetched pages
+    assert repository.lists == 4  # noqa: PLR2004
+    stats = prefetcher.stats
+    assert (stats.hits, stats.misses, stats.prefetched, stats.size) == (3, 0, 3, 0)
+    assert stats.hit_ratio == 1
+    assert sink.gauges[(PREFETCH_LOOKUPS, (("repository", "ItemRepository"), ("result", "hit")))] == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_list__prefetch_is_keyed_by_the_query(repository: ItemRepository):
+    prefetcher = PagePrefetcher()
+    red = repository.__filtering__.construct(color="red")
+    page = await prefetcher.list(repository, CursorPaginationParams(limit=3))
+    await settle()
+
+    other = await prefetcher.list(repository, CursorPaginationParams(limit=3, next=page.next), filtering=red)
+    expected = await repository.list(CursorPaginationParams(limit=3, next=page.next), filtering=red)
+
+    assert [item.id for item in other.items] == [item.id for item in expected.items]
+    assert prefetcher.stats.misses == 1
+
+
+@pytest.mark.asyncio()
+async def test_list__memory_is_bounded(repository: ItemRepository):
+    clock = Clock()
+    prefetcher = PagePrefetcher(ttl=5, max_size=1, clock=clock)
+
+    first = await prefetcher.list(repository, CursorPaginationParams(limit=2))
+    await prefetcher.list(repository, CursorPaginationParams(limit=4))
+    await settle()
+    assert (prefetcher.stats.size, prefetcher.stats.discarded) == (1, 1)
+
+    clock.now = 6
+    page = await prefetcher.list(repository, CursorPaginationParams(limit=4, next=first.next))
+    assert [item.id for item in page.items] == ["02", "03", "04", "05"]
+    assert (prefetcher.stats.hits, prefetcher.stats.discarded) == (0, 2)
+
+
+@pytest.mark.asyncio()
+async def test_list__failed_prefetch_falls_back_to_the_repository(repository: ItemRepository):
+    prefetcher = PagePrefetcher()
+    page = await prefetcher.list(repository, CursorPaginationParams(limit=3))
+    repository.fail = True
+    await settle()
+    repository.fail = False
+
+    second = await prefetcher.list(repository, CursorPaginationParams(limit=3, next=page.next))
+
+    assert [item.id for item in second.items] == ["03", "04", "05"]
+    assert (prefetcher.stats.errors, prefetcher.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio()
+async def test_list__expired_prefetch_replaced_is_discarded(repository: ItemRepository):
+    clock = Clock()
+    prefetcher = PagePrefetcher(ttl=5, clock=clock)
+
+    await prefetcher.list(repository, CursorPaginationParams(limit=3))
+    clock.now = 6
+    await prefetcher.list(repository, CursorPaginationParams(limit=3))
+    await settle()
+
+    stats = prefetcher.stats
+    assert (stats.prefetched, stats.discarded, stats.size) == (2, 1, 1)
+
+
+class TenantRepository(InMemoryRepository[Item]):  # type: ignore[misc]
+    def __init__(self, tenant: str, items: List[Item]) -> None:
+        super().__init__(items)
+        self.tenant = tenant
+
+    def cache_scope(self) -> str:
+        return self.tenant
+
+
+@pytest.mark.asyncio()
+async def test_list__prefetch_is_kept_per_repository_scope():
+    prefetcher = PagePrefetcher()
+    items = [Item(id=f"{i:02d}", color="red") for i in range(6)]
+    first, second = TenantRepository("first", items[:4]), TenantRepository("second", items[2:])
+
+    page = await prefetcher.list(first, CursorPaginationParams(limit=2))
+    await prefetcher.list(second, CursorPaginationParams(limit=2))
+    await settle()
+    other = await prefetcher.list(second, CursorPaginationParams(limit=2, next=page.next))
+    expected = await second.list(CursorPaginationParams(limit=2, next=page.next))
+
+    assert [item.id for item in other.items] == [item.id for item in expected.items]
+    assert (prefetcher.stats.hits, prefetcher.stats.misses) == (0, 1)
+
+    prefetcher.invalidate(first)
+    assert (prefetcher.stats.size, prefetcher.stats.discarded) == (1, 1)
@@ -0,0 +1,48 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+from furiousapi.core.db.projection import FieldProjection
+from furiousapi.core.db.utils import get_model_fields_enum
+from furiousapi.core.pagination import PaginatedResponse
+
+
+class Author(BaseModel):
+    name: str
+    country: str
+
+
+class Book(BaseModel):
+    title: str
+    year: int
+    author: Author
+
+
+BookFields: Enum = get_model_fields_enum(Book, recursive=True)  # type: ignore[assignment]
+
+
+def test_from_fields__when_no_fields__then_none():
+    assert FieldProjection.from_fields(None) is None
+    assert FieldProjection.from_fields([]) is None
+
+
+def test_tree__nested_paths_are_absorbed_by_selected_parents():
+    projection = FieldProjection([BookFields["author.name"], BookFields["title"]])
+    assert projection.tree == {"author": {"name": 1}, "title": 1}
+    assert projection.include == {"author": {"name": ...}, "title": ...}
+    assert projection.names == {"author", "title"}
+    assert list(projection) == [BookFields["author.name"], BookFields["title"]]
+
+    assert FieldProjection([BookFields["author.name"], BookFields["author"]]).tree == {"author": 1}
+
+
+def test_include__serializes_only_the_projected_keys():
+    book = Book(title="t", year=2000, author=Author(name="n", country="c"))
+    projection = FieldProjection([BookFields["author.name"], BookFields["year"]])
+
+    assert book.dict(include=projection.include) == {"year": 2000, "author": {"name": "n"}}
+    page = PaginatedResponse[Book](items=[book], next="1")
+    assert page.dict(include=projection.include_items(page)) == {
+        "items": [{"year": 2000, "author": {"name": "n"}}],
+        "next": "1",
+    }
@@ -1,3 +1,4 @@
+import gc
 from enum import Enum
 from typing import List, Optional, Tuple
 
@@ -6,6 +7,9 @@ from pydantic import BaseModel
 
 from furiousapi.core.db.fields import SortableFieldEnum
 from furiousapi.core.db.utils import (
+    ModelMetadataRegistry,
+    RegistryInfo,
+    SubsetModelCache,
     create_subset_model,
     get_model_fields,
     get_model_fields_enum,
@@ -84,3 +88,44 @@ def test_create_subset_model(projection: dict, expected: List[str]):
     actual = list(get_model_fields(create_subset_model(MyModel, projection), recursive=True).keys())
     for i in expected:
         assert i in actual
+
+
+def test_create_subset_model__when_same_projection__then_cached():
+    first = create_subset_model(MyModel, {"flat": 1, "inner_model1": {"inner2": 1}})
+    second = create_subset_model(MyModel, {"inner_model1": {"inner2": 1}, "flat": 1})
+    assert first is second
+    assert create_subset_model(MyModel, {"flat": 1}, cache=False) is not create_subset_model(MyModel, {"flat": 1})
+
+
+def test_subset_model_cache__lru_eviction_and_counters():
+    cache = SubsetModelCache(max_size=2)
+    cache.warm(MyModel, [{"flat": 1}, {"inner_model1": 1}])
+    cache.get_or_create(MyModel, {"flat": 1})
+    cache.get_or_create(MyModel, {"flat": 1, "inner_model1": 1})
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.current_size) == (1, 3, 2)
+    assert (MyModel, {"flat": 1}) in cache
+    assert (MyModel, {"inner_model1": 1}) not in cache
+
+
+def test_model_metadata_registry__computed_once_and_weakly_referenced():
+    registry = ModelMetadataRegistry()
+    model = create_subset_model(MyModel, {"flat": 1}, cache=False)
+
+    metadata = registry.get(model)
+    assert registry.get(model) is metadata
+    assert metadata.fields == {"flat": "flat"}
+    assert registry.get(MyModel).nested == {"inner_model1": InnerModel}
+    assert registry.registry_info() == RegistryInfo(hits=1, misses=2, current_size=2)
+
+    del model, metadata
+    gc.collect()
+    assert len(registry) == 1
+
+
+def test_get_model_fields__recursive_with_include():
+    assert get_model_fields(MyModel, {"inner_model1", "inner2", "inner_model1.inner2"}, recursive=True) == {
+        "inner_model1": "inner_model1",
+        "inner_model1.inner2": "inner_model1.inner2",
+    }